@@ -0,0 +1,324 @@
+"""
+Chunk I/O - Bounded-memory readers for chunked uploads
+Streams byte ranges of a video file without loading the whole file, and
+computes integrity checksums from the same bytes as they are sent
+"""
+
+import hashlib
+import os
+import threading
+
+
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+class IntegrityRecorder:
+    """Builds a file digest and per-chunk checksums from bytes being uploaded"""
+
+    def __init__(self, file_size):
+        """
+        Initialize integrity recorder
+
+        Args:
+            file_size: Total size of the file being uploaded
+        """
+        self.file_size = file_size
+        self._digest = hashlib.sha256()
+        self._position = 0
+        self._chunks = {}
+        self._lock = threading.Lock()
+
+    def update(self, offset, data):
+        """
+        Feed bytes read at an offset into the file digest
+
+        Bytes that were already hashed (re-sent chunks) are ignored; bytes
+        beyond the hashed prefix wait for finalize().
+
+        Args:
+            offset: File offset of the first byte of data
+            data: Bytes that were read
+        """
+        with self._lock:
+            end = offset + len(data)
+            if offset <= self._position < end:
+                self._digest.update(memoryview(data)[self._position - offset:])
+                self._position = end
+
+    def record_chunk(self, start, end, checksum):
+        """
+        Record the checksum of a chunk that was sent
+
+        Args:
+            start: First byte of the chunk
+            end: End of the chunk (exclusive)
+            checksum: Hex SHA-256 of the chunk
+        """
+        with self._lock:
+            self._chunks[(start, end)] = checksum
+
+    def finalize(self, video_file):
+        """
+        Complete the digest and return the integrity summary
+
+        Normally every byte has already been hashed on its way to the
+        server. Only when an upload resumed part-way through are the bytes
+        that were not sent in this run read from disk.
+
+        Args:
+            video_file: Path to the uploaded file
+
+        Returns:
+            Dictionary with 'sha256', 'size', 'chunks' and 'extra_bytes_read'
+        """
+        with self._lock:
+            extra_bytes_read = self.file_size - self._position
+
+            if extra_bytes_read > 0:
+                with open(video_file, 'rb') as f:
+                    fd = f.fileno()
+                    while self._position < self.file_size:
+                        block = os.pread(fd, min(HASH_BLOCK_SIZE, self.file_size - self._position),
+                                         self._position)
+                        if not block:
+                            break
+                        self._digest.update(block)
+                        self._position += len(block)
+
+            return {
+                'sha256': self._digest.hexdigest(),
+                'size': self.file_size,
+                'chunks': [
+                    {'start': start, 'end': end, 'sha256': checksum}
+                    for (start, end), checksum in sorted(self._chunks.items())
+                ],
+                'extra_bytes_read': max(0, extra_bytes_read)
+            }
+
+
+class _ChunkChecksum:
+    """Running SHA-256 of one chunk, valid only while it is read front to back"""
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+        self.position = start
+        self.digest = hashlib.sha256()
+
+    def feed(self, offset, data, recorder):
+        """Add bytes read at offset; records the checksum once the chunk is complete"""
+        if offset != self.position:
+            return False
+
+        self.digest.update(data)
+        self.position += len(data)
+        if self.position >= self.end:
+            recorder.record_chunk(self.start, self.end, self.digest.hexdigest())
+        return True
+
+
+class FileChunk:
+    """File-like view over a single byte range of an open file"""
+
+    def __init__(self, fileobj, start, length, recorder=None, budget=None):
+        """
+        Initialize a chunk view
+
+        Args:
+            fileobj: Open binary file object, or a SharedMappedSource
+                     (shared between chunks)
+            start: Offset of the first byte of the chunk
+            length: Number of bytes in the chunk
+            recorder: Optional IntegrityRecorder fed with every byte read
+            budget: Optional ByteBudget; the chunk's bytes are reserved by
+                    reserve() (or the first read) and held until close()
+        """
+        fd = fileobj.fileno()
+        self._read_at = getattr(fileobj, 'read_at', None) or (lambda offset, size: os.pread(fd, size, offset))
+        self.start = start
+        self.length = length
+        self._pos = 0
+        self._recorder = recorder
+        self._checksum = _ChunkChecksum(start, start + length) if recorder else None
+        self._budget = budget
+        self._reserved = 0
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        """
+        Read up to size bytes from the chunk
+
+        Uses positional reads so several chunks (and several uploads) of
+        the same file can be streamed without sharing a file position.
+
+        Args:
+            size: Maximum number of bytes to read (-1 = rest of chunk)
+
+        Returns:
+            Bytes read (empty at end of chunk)
+        """
+        remaining = self.length - self._pos
+        if remaining <= 0:
+            return b''
+
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+
+        self.reserve()
+
+        offset = self.start + self._pos
+        data = self._read_at(offset, size)
+        self._pos += len(data)
+
+        if self._recorder and data:
+            self._recorder.update(offset, data)
+            if self._checksum and not self._checksum.feed(offset, data, self._recorder):
+                self._checksum = None
+
+        return data
+
+    def reserve(self):
+        """
+        Reserve the chunk's bytes against the budget
+
+        Blocks while other uploads have the budget's bytes in flight. Call
+        before timing the request so the wait isn't counted as send time.
+        """
+        if self._budget and not self._reserved:
+            self._reserved = self._budget.acquire(self.length)
+
+    def tell(self):
+        """Current position relative to the start of the chunk"""
+        return self._pos
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move the position within the chunk (used when a body is re-sent)"""
+        if whence == os.SEEK_SET:
+            self._pos = offset
+        elif whence == os.SEEK_CUR:
+            self._pos += offset
+        elif whence == os.SEEK_END:
+            self._pos = self.length + offset
+        self._pos = max(0, min(self._pos, self.length))
+
+        # A rewound body is sent again from the start, so checksum it afresh
+        if self._recorder and self._pos == 0:
+            self._checksum = _ChunkChecksum(self.start, self.start + self.length)
+
+        return self._pos
+
+    def close(self):
+        """Release the chunk's byte budget once the request is over"""
+        if self._reserved:
+            self._budget.release(self._reserved)
+            self._reserved = 0
+
+
+class TeeReader:
+    """Seekable file wrapper that checksums everything read through it"""
+
+    def __init__(self, fileobj, recorder, chunk_size, budget=None):
+        """
+        Initialize tee reader
+
+        Args:
+            fileobj: Open binary file object
+            recorder: IntegrityRecorder fed with every byte read
+            chunk_size: Upload chunk size, used to group per-chunk checksums
+            budget: Optional ByteBudget; the first read of each chunk
+                    reserves chunk_size bytes, held until a read starts the
+                    next chunk (the previous one has been accepted by then),
+                    a seek back, or close()
+        """
+        self._file = fileobj
+        self._recorder = recorder
+        self._chunk_size = chunk_size
+        self._checksum = None
+        self._budget = budget
+        self._reserved = 0
+        self._reserved_chunk = None
+
+    def read(self, size=-1):
+        """Read from the file and feed the bytes to the recorder"""
+        offset = self._file.tell()
+
+        if self._budget:
+            chunk_index = offset // self._chunk_size
+            if chunk_index != self._reserved_chunk:
+                self._release()
+                self._reserved = self._budget.acquire(self._chunk_size)
+                self._reserved_chunk = chunk_index
+
+        data = self._file.read(size)
+        if not data:
+            return data
+
+        self._recorder.update(offset, data)
+
+        # Split the read along chunk boundaries
+        view = memoryview(data)
+        pos = 0
+        while pos < len(data):
+            chunk_offset = offset + pos
+            chunk_start = chunk_offset - chunk_offset % self._chunk_size
+            chunk_end = min(chunk_start + self._chunk_size, self._recorder.file_size)
+            take = min(len(data) - pos, chunk_end - chunk_offset)
+
+            if chunk_offset == chunk_start:
+                self._checksum = _ChunkChecksum(chunk_start, chunk_end)
+            if self._checksum and not self._checksum.feed(chunk_offset, view[pos:pos + take], self._recorder):
+                self._checksum = None
+
+            pos += take
+
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        previous = self._file.tell()
+        position = self._file.seek(offset, whence)
+        if position < previous:
+            # The chunk is being re-sent; it reserves again on its next read
+            self._release()
+        return position
+
+    def tell(self):
+        return self._file.tell()
+
+    def close(self):
+        self._release()
+        self._file.close()
+
+    def _release(self):
+        """Return the bytes reserved for the current chunk"""
+        if self._reserved:
+            self._budget.release(self._reserved)
+            self._reserved = 0
+        self._reserved_chunk = None
+
+
+def iter_chunk_ranges(video_size, chunk_size, total_chunks):
+    """
+    Yield the byte ranges of a chunked upload
+
+    The last declared chunk absorbs all remaining bytes, matching
+    TikTok's floor-division chunk count.
+
+    Args:
+        video_size: Total file size in bytes
+        chunk_size: Size of each chunk in bytes
+        total_chunks: Number of declared chunks
+
+    Yields:
+        Tuple of (chunk_index, start_byte, end_byte) with end_byte exclusive
+    """
+    for chunk_index in range(total_chunks):
+        start_byte = chunk_index * chunk_size
+
+        if chunk_index == total_chunks - 1:
+            end_byte = video_size
+        else:
+            end_byte = min(start_byte + chunk_size, video_size)
+
+        yield chunk_index, start_byte, end_byte
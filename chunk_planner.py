@@ -0,0 +1,165 @@
+"""
+Chunk Planner - Picks TikTok upload chunk sizes from measured throughput
+Remembers per-host link throughput between runs
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class ThroughputStore:
+    """Persists a smoothed upload throughput estimate per host"""
+
+    # Weight of the newest measurement in the moving average
+    SMOOTHING = 0.3
+
+    def __init__(self, store_file='cache/throughput.json'):
+        """
+        Initialize throughput store
+
+        Args:
+            store_file: JSON file holding per-host estimates
+        """
+        self.store_file = Path(store_file)
+        self._lock = threading.Lock()
+        self._estimates = None
+
+    def _load(self):
+        """Load estimates from disk (once)"""
+        if self._estimates is None:
+            self._estimates = {}
+            if self.store_file.exists():
+                try:
+                    with open(self.store_file, 'r') as f:
+                        self._estimates = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Warning: Ignoring unreadable throughput cache {self.store_file}: {e}")
+        return self._estimates
+
+    def get(self, host):
+        """
+        Get the throughput estimate for a host
+
+        Args:
+            host: Upload host name
+
+        Returns:
+            Bytes per second, or None if the host has not been measured
+        """
+        with self._lock:
+            entry = self._load().get(host)
+            return entry['bytes_per_second'] if entry else None
+
+    def record(self, host, num_bytes, seconds):
+        """
+        Fold a measurement into the estimate for a host and save it
+
+        Args:
+            host: Upload host name
+            num_bytes: Bytes transferred
+            seconds: Time the transfer took
+        """
+        if not host or num_bytes <= 0 or seconds <= 0:
+            return
+
+        measured = num_bytes / seconds
+
+        with self._lock:
+            estimates = self._load()
+            previous = estimates.get(host, {}).get('bytes_per_second')
+            if previous:
+                measured = self.SMOOTHING * measured + (1 - self.SMOOTHING) * previous
+
+            estimates[host] = {
+                'bytes_per_second': measured,
+                'updated_at': time.time()
+            }
+
+            self.store_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.store_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(estimates, f, indent=2)
+            os.replace(tmp_file, self.store_file)
+
+
+class ChunkPlanner:
+    """Plans chunk size and count for TikTok FILE_UPLOAD"""
+
+    # TikTok chunking rules:
+    # - Videos < 5MB must upload as whole (chunk_size = video_size)
+    # - Chunk size must be 5-64 MB
+    # - total_chunk_count is video_size // chunk_size; the last chunk
+    #   carries the remainder and may be up to 128 MB
+    # - At most 1000 chunks
+    MIN_CHUNK_SIZE = 5 * 1024 * 1024
+    MAX_CHUNK_SIZE = 64 * 1024 * 1024
+    MAX_CHUNK_COUNT = 1000
+
+    # Chunk size used before any throughput has been measured
+    DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
+
+    # Aim for chunks that take this long to send: fewer round trips on fast
+    # links, less to resend after a failure on slow ones
+    TARGET_CHUNK_SECONDS = 8
+
+    def __init__(self, throughput_store=None):
+        """
+        Initialize chunk planner
+
+        Args:
+            throughput_store: ThroughputStore (None = default store)
+        """
+        self.throughput_store = throughput_store or ThroughputStore()
+
+    def target_chunk_size(self, host):
+        """
+        Preferred chunk size for a host, clamped to TikTok's window
+
+        Args:
+            host: Upload host name
+
+        Returns:
+            Chunk size in bytes
+        """
+        throughput = self.throughput_store.get(host)
+        if throughput:
+            target = int(throughput * self.TARGET_CHUNK_SECONDS)
+        else:
+            target = self.DEFAULT_CHUNK_SIZE
+
+        return max(self.MIN_CHUNK_SIZE, min(target, self.MAX_CHUNK_SIZE))
+
+    def plan(self, video_size, host):
+        """
+        Plan a valid chunk layout for a file
+
+        Chunks are balanced so every chunk is close to the target size and
+        the final chunk only absorbs a few leftover bytes.
+
+        Args:
+            video_size: Size of video file in bytes
+            host: Upload host name (selects the throughput estimate)
+
+        Returns:
+            Tuple of (chunk_size, total_chunk_count)
+        """
+        if video_size < self.MIN_CHUNK_SIZE:
+            return video_size, 1
+
+        target = self.target_chunk_size(host)
+
+        chunk_count = max(1, round(video_size / target))
+        while video_size // chunk_count > self.MAX_CHUNK_SIZE:
+            chunk_count += 1
+        while chunk_count > 1 and video_size // chunk_count < self.MIN_CHUNK_SIZE:
+            chunk_count -= 1
+        chunk_count = min(chunk_count, self.MAX_CHUNK_COUNT)
+
+        chunk_size = video_size // chunk_count
+
+        # Because chunk_size >= chunk_count, floor division gives back exactly
+        # chunk_count and the remainder is smaller than chunk_count bytes
+        return chunk_size, video_size // chunk_size
@@ -0,0 +1,313 @@
+"""
+Job Queue - Durable SQLite queue of upload jobs
+Jobs survive restarts: a worker leases a job and an expired lease frees it again
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from retry import is_retryable
+
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class JobQueue:
+    """SQLite (WAL) table of upload jobs with leases and attempt counts"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            metadata_file TEXT NOT NULL,
+            platforms TEXT,
+            max_retries INTEGER,
+            force INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL,
+            lease_owner TEXT,
+            lease_expires REAL,
+            available_at REAL NOT NULL,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, available_at);
+    """
+
+    RETRY_DELAY = 60  # seconds, doubled per failed attempt
+
+    def __init__(self, db_file='state/jobs.db', max_attempts=3, clock=time.time):
+        """
+        Initialize job queue
+
+        Args:
+            db_file: Path of the SQLite database
+            max_attempts: Attempts a job gets before it is marked failed
+            clock: Wall-clock time source in seconds (stored in the database,
+                   so it must be comparable across processes)
+        """
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self):
+        """Open a connection (one per operation, so threads never share one)"""
+        conn = sqlite3.connect(str(self.db_file), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return closing(conn)
+
+    def enqueue(self, metadata_file, platforms=None, max_retries=None, force=False):
+        """
+        Add an upload job
+
+        Args:
+            metadata_file: Path to video metadata JSON file
+            platforms: List of specific platforms to upload to (None = all)
+            max_retries: Maximum retry attempts (None = use config default)
+            force: Upload even to targets the ledger holds in flight for a live process
+
+        Returns:
+            ID of the new job
+        """
+        now = self._clock()
+
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (metadata_file, platforms, max_retries, force, status, max_attempts, "
+                "available_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(metadata_file), json.dumps(platforms) if platforms else None,
+                 max_retries, int(force), PENDING, self.max_attempts, now, now, now)
+            )
+            return cursor.lastrowid
+
+    def claim(self, owner, lease_seconds=300):
+        """
+        Lease the oldest runnable job
+
+        Pending jobs are runnable once their retry delay has passed. A running
+        job whose lease expired (its worker died) is runnable again; its
+        'expired_owner' names the dead worker, so the uploads that worker
+        left in flight can be resumed.
+
+        Args:
+            owner: Identifier of the claiming worker
+            lease_seconds: How long the lease lasts without a heartbeat
+
+        Returns:
+            Job dictionary (with 'expired_owner', None unless the job was
+            taken over from an expired lease), or None if nothing is runnable
+        """
+        now = self._clock()
+
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    row = conn.execute(
+                        "SELECT * FROM jobs WHERE (status = ? AND available_at <= ?) "
+                        "OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                        (PENDING, now, RUNNING, now)
+                    ).fetchone()
+
+                    if row is None or row['status'] == PENDING or row['attempts'] < row['max_attempts']:
+                        break
+
+                    # Its last attempt died with the worker
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, "
+                        "error = ?, updated_at = ? WHERE id = ?",
+                        (FAILED, f"Lease expired on attempt {row['attempts']}", now, row['id'])
+                    )
+
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                        "lease_expires = ?, updated_at = ? WHERE id = ?",
+                        (RUNNING, owner, now + lease_seconds, now, row['id'])
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+
+        job = self._decode(row)
+        job.update(status=RUNNING, attempts=row['attempts'] + 1, lease_owner=owner,
+                   expired_owner=row['lease_owner'] if row['status'] == RUNNING else None)
+        return job
+
+    def heartbeat(self, job_id, owner, lease_seconds=300):
+        """
+        Extend a job's lease
+
+        Args:
+            job_id: Job ID
+            owner: Identifier of the worker holding the lease
+            lease_seconds: New lease length from now
+
+        Returns:
+            True if the worker still holds the lease
+        """
+        now = self._clock()
+
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + lease_seconds, now, job_id, RUNNING, owner)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id, owner, results):
+        """
+        Record a finished job
+
+        A job is done when every target succeeded. If a target failed in a
+        way that can pass (a retryable category, including an open circuit
+        breaker), it goes back to pending with a growing delay until it runs
+        out of attempts; a rerun only uploads the targets the upload ledger
+        doesn't have yet. Ineligible or fatal failures fail the job at once.
+
+        Args:
+            job_id: Job ID
+            owner: Identifier of the worker holding the lease
+            results: Dictionary with results for each platform
+
+        Returns:
+            New job status, or None if the worker no longer held the lease
+        """
+        failed = [p for p, r in results.items() if not r.get('success')]
+        error = '; '.join(f"{p}: {results[p].get('error', 'Unknown error')}" for p in failed) or None
+        retry = any(is_retryable(results[p].get('category')) for p in failed)
+        return self._finish(job_id, owner, json.dumps(results, default=str), error, retry)
+
+    def fail(self, job_id, owner, error, retry=True):
+        """
+        Record a job that raised instead of returning results
+
+        Args:
+            job_id: Job ID
+            owner: Identifier of the worker holding the lease
+            error: Error message
+            retry: Whether another attempt could succeed
+
+        Returns:
+            New job status, or None if the worker no longer held the lease
+        """
+        return self._finish(job_id, owner, None, error, retry)
+
+    def _finish(self, job_id, owner, result, error, retry):
+        """Release a job's lease and move it to its next state"""
+        now = self._clock()
+
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = ? AND lease_owner = ?",
+                    (job_id, RUNNING, owner)
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                if not error:
+                    status, available_at = DONE, now
+                elif retry and row['attempts'] < row['max_attempts']:
+                    status, available_at = PENDING, now + self.RETRY_DELAY * 2 ** (row['attempts'] - 1)
+                else:
+                    status, available_at = FAILED, now
+
+                conn.execute(
+                    "UPDATE jobs SET status = ?, result = COALESCE(?, result), error = ?, available_at = ?, "
+                    "lease_owner = NULL, lease_expires = NULL, updated_at = ? WHERE id = ?",
+                    (status, result, error, available_at, now, job_id)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return status
+
+    def next_available(self):
+        """
+        Seconds until the next pending job becomes runnable
+
+        Returns:
+            Seconds (0 = runnable now), or None if no job is waiting
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT MIN(CASE WHEN status = ? THEN available_at ELSE lease_expires END) AS at "
+                "FROM jobs WHERE status IN (?, ?)",
+                (PENDING, PENDING, RUNNING)
+            ).fetchone()
+
+        if row['at'] is None:
+            return None
+        return max(0.0, row['at'] - self._clock())
+
+    def jobs(self, status=None, limit=20):
+        """
+        List the most recent jobs
+
+        Args:
+            status: Only jobs in this state (None = all)
+            limit: Maximum number of jobs
+
+        Returns:
+            List of job dictionaries, newest first
+        """
+        query = "SELECT * FROM jobs"
+        params = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [self._decode(row) for row in rows]
+
+    def counts(self):
+        """
+        Count jobs by state
+
+        Returns:
+            Dictionary mapping status to number of jobs
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+
+        return {row['status']: row['n'] for row in rows}
+
+    def _decode(self, row):
+        """Job dictionary with JSON columns decoded"""
+        job = dict(row)
+        job['platforms'] = json.loads(job['platforms']) if job['platforms'] else None
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job['force'] = bool(job['force'])
+        return job
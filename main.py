@@ -5,12 +5,16 @@ Main CLI entry point
 """
 
 import argparse
+import json
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 
-from uploader import UploadOrchestrator
-from video_manager import VideoManager
+from job_queue import JobQueue
+from upload_daemon import UploadDaemon, notify_daemon
+from uploader import UploadOrchestrator, expand_metadata_paths
+from video_manager import VideoManager, expand_video_paths
 
 
 def main():
@@ -22,6 +26,12 @@ def main():
 Examples:
   %(prog)s --metadata video_metadata.json
   %(prog)s --metadata video_metadata.json --platforms youtube_english tiktok_english
+  %(prog)s --batch metadata/
+  %(prog)s --serve
+  %(prog)s --enqueue metadata/next_video.json
+  %(prog)s --jobs
+  %(prog)s --validate videos/your_video.mp4
+  %(prog)s --validate videos/ "renders/*.mp4" --report validation.jsonl
   %(prog)s --setup
   %(prog)s --logs
         """
@@ -38,6 +48,32 @@ Examples:
         help='Path to video metadata JSON file'
     )
 
+    parser.add_argument(
+        '--batch',
+        nargs='+',
+        help='Upload every metadata JSON file given (or found in given directories) on one worker pool'
+    )
+
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run the upload daemon, working through queued jobs until stopped'
+    )
+
+    parser.add_argument(
+        '--enqueue',
+        nargs='+',
+        help='Queue metadata JSON files (or directories of them) for the upload daemon'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        nargs='?',
+        const='all',
+        choices=['all', 'pending', 'running', 'done', 'failed'],
+        help='List queued upload jobs (optionally only those in one state)'
+    )
+
     parser.add_argument(
         '--platforms',
         nargs='+',
@@ -58,7 +94,19 @@ Examples:
 
     parser.add_argument(
         '--validate',
-        help='Validate a video file without uploading'
+        nargs='+',
+        help='Validate video files, directories or glob patterns without uploading'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Maximum parallel processes for batch validation (default: CPU count)'
+    )
+
+    parser.add_argument(
+        '--report',
+        help='Write batch validation results to this JSON Lines file'
     )
 
     parser.add_argument(
@@ -67,6 +115,12 @@ Examples:
         help='Maximum number of retry attempts per platform'
     )
 
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Upload even where another running process holds the upload in flight'
+    )
+
     args = parser.parse_args()
 
     # Handle different commands
@@ -75,9 +129,20 @@ Examples:
     elif args.logs:
         view_logs()
     elif args.validate:
-        validate_video(args.validate)
+        if len(args.validate) == 1 and os.path.isfile(args.validate[0]) and not args.report:
+            validate_video(args.validate[0])
+        else:
+            validate_batch(args.validate, args.workers, args.report)
+    elif args.serve:
+        serve(args.config)
+    elif args.enqueue:
+        enqueue_jobs(args.config, args.enqueue, args.platforms, args.retries, args.force)
+    elif args.jobs:
+        view_jobs(args.jobs)
+    elif args.batch:
+        upload_batch(args.config, args.batch, args.platforms, args.retries, args.force)
     elif args.metadata:
-        upload_video(args.config, args.metadata, args.platforms, args.retries)
+        upload_video(args.config, args.metadata, args.platforms, args.retries, args.force)
     else:
         parser.print_help()
         sys.exit(1)
@@ -130,7 +195,26 @@ def run_setup():
         "upload_settings": {
             "video_privacy": "PUBLIC",
             "youtube_category": "20",
-            "max_retries": 3
+            "max_retries": 3,
+            "youtube_chunk_size_mb": 8,
+            "faststart": True,
+            "faststart_cache_gb": 20,
+            "renditions": False,
+            "concurrency": {
+                "max_workers": 4,
+                "per_platform": {"youtube": 2, "tiktok": 2},
+                "per_account": {"default": 1},
+                "max_bytes_in_flight_mb": 256,
+                "init_per_minute": {"tiktok": 6}
+            },
+            "circuit_breaker": {
+                "failure_threshold": 5,
+                "cooldown_seconds": 120
+            },
+            "daemon": {
+                "max_jobs": 2,
+                "max_attempts": 3
+            }
         }
     }
 
@@ -247,14 +331,60 @@ def validate_video(video_file):
     print()
 
 
-def upload_video(config_file, metadata_file, platforms, max_retries):
+def validate_batch(paths, max_workers, report_file):
+    """Validate many video files in parallel"""
+    video_files = expand_video_paths(paths)
+
+    print("\n" + "="*60)
+    print(f"Validating {len(video_files)} video file(s)")
+    print("="*60 + "\n")
+
+    if not video_files:
+        print("No video files found\n")
+        sys.exit(1)
+
+    manager = VideoManager()
+    report = open(report_file, 'w') if report_file else None
+    valid_count = 0
+
+    try:
+        for video_file, validation in manager.validate_videos(video_files, max_workers=max_workers):
+            video_info = validation.get('video_info', {})
+
+            if validation['valid']:
+                valid_count += 1
+                print(f"✓ {video_file} ({video_info.get('width')}x{video_info.get('height')}, "
+                      f"{video_info.get('duration', 0):.1f}s)")
+                for warning in validation.get('warnings', []):
+                    print(f"    ⚠ {warning}")
+            else:
+                print(f"✗ {video_file}: {validation['error']}")
+
+            if report:
+                report.write(json.dumps({'file': video_file, **validation}, ensure_ascii=False) + '\n')
+                report.flush()
+    finally:
+        if report:
+            report.close()
+
+    print(f"\n{valid_count}/{len(video_files)} valid")
+    if report_file:
+        print(f"Report written to {report_file}")
+    print()
+
+    sys.exit(0 if valid_count == len(video_files) else 1)
+
+
+def upload_video(config_file, metadata_file, platforms, max_retries, force=False):
     """Upload video to platforms"""
+    orchestrator = None
     try:
         orchestrator = UploadOrchestrator(config_file)
         results = orchestrator.upload_from_metadata(
             metadata_file,
             platforms=platforms,
-            max_retries=max_retries
+            max_retries=max_retries,
+            force=force
         )
 
         # Exit with error code if any uploads failed
@@ -272,6 +402,112 @@ def upload_video(config_file, metadata_file, platforms, max_retries):
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if orchestrator:
+            orchestrator.close()
+
+
+def upload_batch(config_file, paths, platforms, max_retries, force=False):
+    """Upload many videos to platforms"""
+    metadata_files = expand_metadata_paths(paths)
+    if not metadata_files:
+        print(f"\nError: No metadata files found in: {', '.join(paths)}\n")
+        sys.exit(1)
+
+    orchestrator = None
+    try:
+        orchestrator = UploadOrchestrator(config_file)
+        batch_results = orchestrator.upload_batch(
+            metadata_files,
+            platforms=platforms,
+            max_retries=max_retries,
+            force=force
+        )
+
+        # Exit with error code if any uploads failed
+        failed = any(not r.get('success') for results in batch_results.values() for r in results.values())
+        sys.exit(1 if failed else 0)
+
+    except FileNotFoundError as e:
+        print(f"\nError: {e}\n")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nUnexpected error: {e}\n")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        if orchestrator:
+            orchestrator.close()
+
+
+def serve(config_file):
+    """Run the upload daemon"""
+    try:
+        orchestrator = UploadOrchestrator(config_file)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"\nError: {e}\n")
+        sys.exit(1)
+
+    daemon_settings = orchestrator.config.get('upload_settings', {}).get('daemon', {})
+    queue = JobQueue(max_attempts=daemon_settings.get('max_attempts', 3))
+    daemon = UploadDaemon(orchestrator, queue, max_jobs=daemon_settings.get('max_jobs', 2))
+    try:
+        daemon.serve()
+    finally:
+        orchestrator.close()
+
+
+def enqueue_jobs(config_file, paths, platforms, max_retries, force=False):
+    """Queue metadata files for the upload daemon"""
+    metadata_files = expand_metadata_paths(paths)
+    if not metadata_files:
+        print(f"\nError: No metadata files found in: {', '.join(paths)}\n")
+        sys.exit(1)
+
+    # Jobs carry their attempt limit, so take it from the daemon's settings
+    daemon_settings = {}
+    if os.path.exists(config_file):
+        with open(config_file, 'r') as f:
+            daemon_settings = json.load(f).get('upload_settings', {}).get('daemon', {})
+
+    queue = JobQueue(max_attempts=daemon_settings.get('max_attempts', 3))
+    for metadata_file in metadata_files:
+        if not os.path.exists(metadata_file):
+            print(f"✗ {metadata_file}: not found")
+            continue
+
+        job_id = queue.enqueue(metadata_file, platforms=platforms, max_retries=max_retries, force=force)
+        print(f"✓ Job {job_id}: {metadata_file}")
+
+    if not notify_daemon():
+        print("\nNo upload daemon is running; jobs will start with: python main.py --serve")
+
+
+def view_jobs(status):
+    """List upload jobs"""
+    queue = JobQueue()
+    jobs = queue.jobs(status=None if status == 'all' else status)
+
+    print("\n" + "="*60)
+    print("Upload Jobs")
+    print("="*60 + "\n")
+
+    if not jobs:
+        print("No jobs\n")
+        return
+
+    icons = {'pending': '…', 'running': '▶', 'done': '✓', 'failed': '✗'}
+    for job in jobs:
+        updated = datetime.fromtimestamp(job['updated_at']).strftime('%Y-%m-%d %H:%M:%S')
+        print(f"{icons.get(job['status'], '?')} Job {job['id']} [{job['status']}] "
+              f"attempt {job['attempts']}/{job['max_attempts']}, {updated}")
+        print(f"    {job['metadata_file']}")
+        if job['error']:
+            print(f"    Error: {job['error']}")
+
+    counts = queue.counts()
+    print(f"\nTotal: {', '.join(f'{n} {s}' for s, n in sorted(counts.items()))}\n")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,260 @@
+"""
+MP4 Parser - Reads video properties straight from ISO-BMFF (MP4/MOV) boxes
+Fast path for VideoManager that needs no ffprobe subprocess
+"""
+
+import os
+import struct
+from collections import Counter
+
+
+MP4_EXTENSIONS = ['.mp4', '.mov', '.m4v']
+
+# Sample entry fourcc -> codec name as reported by ffprobe
+CODEC_NAMES = {
+    'avc1': 'h264',
+    'avc3': 'h264',
+    'hvc1': 'hevc',
+    'hev1': 'hevc',
+    'mp4v': 'mpeg4',
+    'av01': 'av1',
+    'vp09': 'vp9',
+    'vp08': 'vp8',
+    'apch': 'prores',
+    'apcn': 'prores',
+    'apcs': 'prores',
+    'apco': 'prores',
+    'ap4h': 'prores',
+    'jpeg': 'mjpeg',
+}
+
+# Boxes that only contain other boxes on the path to the video sample table
+CONTAINER_BOXES = {'moov', 'trak', 'mdia', 'minf', 'stbl'}
+
+
+def read_top_level_boxes(video_file):
+    """
+    List the top-level boxes of a file without reading their payloads
+
+    Args:
+        video_file: Path to an MP4/MOV file
+
+    Returns:
+        List of (box_type, offset, size) tuples in file order
+
+    Raises:
+        ValueError: If the file is not a well-formed ISO-BMFF file
+    """
+    boxes = []
+    file_size = os.path.getsize(video_file)
+
+    with open(video_file, 'rb') as f:
+        offset = 0
+        while offset + 8 <= file_size:
+            f.seek(offset)
+            size, box_type = struct.unpack('>I4s', f.read(8))
+
+            if size == 1:
+                size = struct.unpack('>Q', f.read(8))[0]
+            elif size == 0:
+                size = file_size - offset
+
+            if size < 8 or offset + size > file_size:
+                raise ValueError(f"Malformed box at offset {offset}")
+
+            boxes.append((box_type.decode('latin-1'), offset, size))
+            offset += size
+
+    if not boxes or boxes[0][0] not in ('ftyp', 'wide', 'free', 'skip', 'moov', 'mdat'):
+        raise ValueError("Not an ISO-BMFF file")
+
+    return boxes
+
+
+def needs_faststart(video_file):
+    """
+    Check whether a file's moov box comes after its media data
+
+    Such files can't be probed or played until the whole file has been
+    read, and platforms process them more slowly.
+
+    Args:
+        video_file: Path to an MP4/MOV file
+
+    Returns:
+        True if an mdat box precedes the moov box
+    """
+    try:
+        box_types = [box[0] for box in read_top_level_boxes(video_file)]
+    except (OSError, ValueError, struct.error):
+        return False
+
+    if 'moov' not in box_types or 'mdat' not in box_types:
+        return False
+
+    return box_types.index('mdat') < box_types.index('moov')
+
+
+def _iter_children(data, start, end):
+    """
+    Iterate boxes inside an in-memory buffer
+
+    Yields:
+        Tuple of (box_type, payload_start, box_end)
+    """
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from('>I4s', data, offset)
+        header = 8
+
+        if size == 1:
+            size = struct.unpack_from('>Q', data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+
+        if size < header or offset + size > end:
+            raise ValueError(f"Malformed box inside moov at offset {offset}")
+
+        yield box_type.decode('latin-1'), offset + header, offset + size
+        offset += size
+
+
+def _find_child(data, start, end, box_type):
+    """Payload range of the first child box of a given type, or None"""
+    for child_type, payload_start, box_end in _iter_children(data, start, end):
+        if child_type == box_type:
+            return payload_start, box_end
+    return None
+
+
+def _parse_time_header(data, payload_start):
+    """Timescale and duration from an mvhd/mdhd payload"""
+    version = data[payload_start]
+    if version == 1:
+        return struct.unpack_from('>IQ', data, payload_start + 20)
+    return struct.unpack_from('>II', data, payload_start + 12)
+
+
+def _parse_video_track(data, trak_start, trak_end):
+    """
+    Extract properties of a video track
+
+    Returns:
+        Dictionary with width, height, codec and fps, or None if the track is not video
+    """
+    mdia = _find_child(data, trak_start, trak_end, 'mdia')
+    if not mdia:
+        return None
+
+    hdlr = _find_child(data, mdia[0], mdia[1], 'hdlr')
+    if not hdlr or data[hdlr[0] + 8:hdlr[0] + 12] != b'vide':
+        return None
+
+    mdhd = _find_child(data, mdia[0], mdia[1], 'mdhd')
+    track_timescale = _parse_time_header(data, mdhd[0])[0] if mdhd else 0
+
+    minf = _find_child(data, mdia[0], mdia[1], 'minf')
+    stbl = _find_child(data, minf[0], minf[1], 'stbl') if minf else None
+    if not stbl:
+        return None
+
+    # stsd: version/flags, entry count, then the first VisualSampleEntry
+    stsd = _find_child(data, stbl[0], stbl[1], 'stsd')
+    if not stsd:
+        return None
+
+    entry_start = stsd[0] + 8
+    fourcc = data[entry_start + 4:entry_start + 8].decode('latin-1')
+    width, height = struct.unpack_from('>HH', data, entry_start + 32)
+
+    # Fall back to the track header's 16.16 fixed-point size
+    if not width or not height:
+        tkhd = _find_child(data, trak_start, trak_end, 'tkhd')
+        if tkhd:
+            size_offset = tkhd[0] + (88 if data[tkhd[0]] == 1 else 76)
+            width, height = (v >> 16 for v in struct.unpack_from('>II', data, size_offset))
+
+    # Frame rate from the most common sample duration in stts
+    fps = 0
+    stts = _find_child(data, stbl[0], stbl[1], 'stts')
+    if stts and track_timescale:
+        entry_count = struct.unpack_from('>I', data, stts[0] + 4)[0]
+        deltas = Counter()
+        for i in range(entry_count):
+            sample_count, sample_delta = struct.unpack_from('>II', data, stts[0] + 8 + i * 8)
+            deltas[sample_delta] += sample_count
+        if deltas:
+            common_delta = deltas.most_common(1)[0][0]
+            if common_delta:
+                fps = track_timescale / common_delta
+
+    return {
+        'width': width,
+        'height': height,
+        'codec': CODEC_NAMES.get(fourcc, fourcc.strip()),
+        'fps': fps
+    }
+
+
+def probe_mp4(video_file):
+    """
+    Get video properties from an MP4/MOV file's moov box
+
+    Seeks over media data to the moov box and parses mvhd, tkhd, mdhd,
+    hdlr, stsd and stts. Fragmented files (no duration in mvhd) and files
+    without a video track are left to ffprobe.
+
+    Args:
+        video_file: Path to video file
+
+    Returns:
+        Dictionary with the same keys as VideoManager._get_video_info,
+        or None if the file can't be handled here
+    """
+    try:
+        boxes = read_top_level_boxes(video_file)
+        moov = next((box for box in boxes if box[0] == 'moov'), None)
+        if not moov:
+            return None
+
+        with open(video_file, 'rb') as f:
+            f.seek(moov[1])
+            data = f.read(moov[2])
+
+        moov_children = next(_iter_children(data, 0, len(data)))
+        moov_start, moov_end = moov_children[1], moov_children[2]
+
+        mvhd = _find_child(data, moov_start, moov_end, 'mvhd')
+        if not mvhd:
+            return None
+
+        timescale, duration_units = _parse_time_header(data, mvhd[0])
+        if not timescale or not duration_units:
+            return None
+
+        video_track = None
+        for box_type, payload_start, box_end in _iter_children(data, moov_start, moov_end):
+            if box_type == 'trak':
+                video_track = _parse_video_track(data, payload_start, box_end)
+                if video_track:
+                    break
+
+        if not video_track:
+            return None
+
+        duration = duration_units / timescale
+        file_size = os.path.getsize(video_file)
+
+        return {
+            'width': int(video_track['width']),
+            'height': int(video_track['height']),
+            'duration': duration,
+            'codec': video_track['codec'],
+            'fps': video_track['fps'],
+            'bitrate': int(file_size * 8 / duration),
+            'size': file_size
+        }
+
+    except (OSError, ValueError, struct.error, StopIteration, TypeError):
+        return None
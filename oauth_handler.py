@@ -19,6 +19,10 @@ import requests
 from oauth_callback_server import start_oauth_server
 
 
+class InteractiveAuthRequired(Exception):
+    """Raised when an account has no usable stored token and needs a browser sign-in"""
+
+
 class OAuthHandler:
     """Handles OAuth authentication for multiple platforms and accounts"""
 
@@ -30,7 +34,8 @@ class OAuthHandler:
         self.credentials_dir = Path(credentials_dir)
         self.credentials_dir.mkdir(parents=True, exist_ok=True)
 
-    def get_youtube_credentials(self, account_name, token_file, credentials_file='credentials/youtube_tokens/youtube_credentials.json'):
+    def get_youtube_credentials(self, account_name, token_file, credentials_file='credentials/youtube_tokens/youtube_credentials.json',
+                                interactive=True):
         """
         Get or create YouTube OAuth credentials for a specific account
 
@@ -38,9 +43,14 @@ class OAuthHandler:
             account_name: Name of the account (e.g., 'english', 'japanese')
             token_file: Path to store the token file
             credentials_file: Path to the OAuth client credentials JSON
+            interactive: Whether the browser consent flow may be started
 
         Returns:
             Credentials object for YouTube API
+
+        Raises:
+            InteractiveAuthRequired: If interactive is False and the stored
+                token is missing or can't be refreshed
         """
         token_path = Path(token_file)
         token_path.parent.mkdir(parents=True, exist_ok=True)
@@ -65,6 +75,9 @@ class OAuthHandler:
                     creds = None
 
             if not creds:
+                if not interactive:
+                    raise InteractiveAuthRequired(f"YouTube {account_name} needs a browser sign-in")
+
                 # Start OAuth flow
                 if not Path(credentials_file).exists():
                     raise FileNotFoundError(
@@ -98,7 +111,7 @@ class OAuthHandler:
 
         return creds
 
-    def get_tiktok_credentials(self, account_name, token_file, client_key, client_secret):
+    def get_tiktok_credentials(self, account_name, token_file, client_key, client_secret, interactive=True):
         """
         Get or create TikTok OAuth credentials for a specific account
 
@@ -107,9 +120,14 @@ class OAuthHandler:
             token_file: Path to store the token file
             client_key: TikTok app client key
             client_secret: TikTok app client secret
+            interactive: Whether the browser consent flow may be started
 
         Returns:
             Dictionary with access token and other credentials
+
+        Raises:
+            InteractiveAuthRequired: If interactive is False and there is
+                no stored token
         """
         token_path = Path(token_file)
         token_path.parent.mkdir(parents=True, exist_ok=True)
@@ -128,6 +146,9 @@ class OAuthHandler:
             except Exception as e:
                 print(f"Error loading existing TikTok token for {account_name}: {e}")
 
+        if not interactive:
+            raise InteractiveAuthRequired(f"TikTok {account_name} needs a browser sign-in")
+
         # Need to get new token through OAuth flow
         print(f"\nTikTok OAuth flow for {account_name}...")
         print("Starting local OAuth callback server...")
@@ -0,0 +1,181 @@
+"""
+Platform Rules - Declarative per-platform video requirements
+Judges one probe result against every target platform's rule set
+"""
+
+# Severities
+ERROR = 'error'
+WARNING = 'warning'
+
+# Comparisons
+MAX = 'max'
+EQUALS = 'equals'
+
+MAX_FILE_SIZE = 4 * 1024 * 1024 * 1024  # 4GB
+YOUTUBE_SHORTS_MAX_DURATION = 60  # seconds
+TIKTOK_MAX_DURATION = 600  # 10 minutes in seconds
+RECOMMENDED_RESOLUTION = (1080, 1920)  # width x height for vertical video
+
+
+class Rule:
+    """One requirement on a probed video property"""
+
+    def __init__(self, field, limit, kind=MAX, severity=ERROR, message='', fix=None):
+        """
+        Initialize rule
+
+        Args:
+            field: Video info key ('size', 'duration', ...) or 'resolution'
+            limit: Limit the value is compared against
+            kind: MAX (value must not exceed limit) or EQUALS
+            severity: ERROR makes the target ineligible, WARNING only reports
+            message: Message template with {value} and {limit} placeholders
+            fix: Rendition recipe options that would satisfy the rule
+                 (e.g. {'max_duration': 60}), or None
+        """
+        self.field = field
+        self.limit = limit
+        self.kind = kind
+        self.severity = severity
+        self.message = message
+        self.fix = fix
+
+    def _value(self, video_info):
+        """Value of the rule's field"""
+        if self.field == 'resolution':
+            return (video_info.get('width', 0), video_info.get('height', 0))
+        return video_info.get(self.field, 0)
+
+    def check(self, video_info):
+        """
+        Check the rule against a probe result
+
+        Args:
+            video_info: Video info dictionary from VideoManager
+
+        Returns:
+            Violation message, or None if the rule is satisfied
+        """
+        value = self._value(video_info)
+
+        if self.kind == MAX:
+            satisfied = value <= self.limit
+        else:
+            satisfied = value == self.limit
+
+        if satisfied:
+            return None
+
+        return self.message.format(value=_format(value), limit=_format(self.limit))
+
+
+def _format(value):
+    """Human-readable rule value"""
+    if isinstance(value, tuple):
+        return 'x'.join(str(v) for v in value)
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+_FILE_SIZE_RULE = Rule('size', MAX_FILE_SIZE, message="File too large: {value} bytes (max {limit})")
+
+_RESOLUTION_RULE = Rule(
+    'resolution', RECOMMENDED_RESOLUTION, kind=EQUALS, severity=WARNING,
+    message="Resolution {value} differs from recommended {limit} for vertical video",
+    fix={'size': RECOMMENDED_RESOLUTION}
+)
+
+PLATFORM_RULES = {
+    'youtube': [
+        _FILE_SIZE_RULE,
+        Rule('duration', YOUTUBE_SHORTS_MAX_DURATION, severity=WARNING,
+             message="Duration {value}s exceeds YouTube Shorts limit ({limit}s)",
+             fix={'max_duration': YOUTUBE_SHORTS_MAX_DURATION}),
+        _RESOLUTION_RULE,
+    ],
+    'tiktok': [
+        _FILE_SIZE_RULE,
+        Rule('duration', TIKTOK_MAX_DURATION,
+             message="Video too long: {value}s (max {limit}s for TikTok)",
+             fix={'max_duration': TIKTOK_MAX_DURATION}),
+        _RESOLUTION_RULE,
+    ],
+}
+
+
+def rendition_fields(platform, renditions):
+    """
+    Rule fields a target renders variants for
+
+    Args:
+        platform: Platform identifier (e.g., 'tiktok_english') or type ('tiktok')
+        renditions: The 'renditions' upload setting. True renders only what
+                    makes a target ineligible (TikTok's 10-minute limit); a
+                    dictionary opts platform types into fields, e.g.
+                    {'youtube': ['duration', 'resolution']}
+
+    Returns:
+        Set of rule fields ('duration', 'resolution', ...)
+    """
+    platform_type = platform.split('_')[0]
+
+    if isinstance(renditions, dict):
+        return set(renditions.get(platform_type) or ())
+
+    if renditions:
+        return {rule.field for rule in PLATFORM_RULES.get(platform_type, [])
+                if rule.severity == ERROR and rule.fix}
+
+    return set()
+
+
+def evaluate(platform, video_info, renditions=False):
+    """
+    Judge a probe result against a target's rule set
+
+    Args:
+        platform: Platform identifier (e.g., 'tiktok_english') or type ('tiktok')
+        video_info: Video info dictionary from VideoManager
+        renditions: The 'renditions' upload setting (see rendition_fields).
+                    A violated rule whose field renders is reported as a
+                    warning, since the rendition will satisfy it
+
+    Returns:
+        Dictionary with 'eligible', 'errors', 'warnings' and 'fixes'
+        (merged recipe options of every violated rule that renders)
+    """
+    platform_type = platform.split('_')[0]
+    rules = PLATFORM_RULES.get(platform_type)
+    if rules is None:
+        return {
+            'eligible': False,
+            'errors': [f"Unknown platform type: {platform_type}"],
+            'warnings': [],
+            'fixes': {}
+        }
+
+    fields = rendition_fields(platform_type, renditions)
+    errors = []
+    warnings = []
+    fixes = {}
+
+    for rule in rules:
+        message = rule.check(video_info)
+        if message is None:
+            continue
+
+        if rule.fix and rule.field in fields:
+            fixes.update(rule.fix)
+            warnings.append(f"{message} (a rendition will be uploaded)")
+        elif rule.severity == ERROR:
+            errors.append(message)
+        else:
+            warnings.append(message)
+
+    return {
+        'eligible': not errors,
+        'errors': errors,
+        'warnings': warnings,
+        'fixes': fixes
+    }
@@ -0,0 +1,124 @@
+"""
+Probe Cache - Persists video probe results between runs
+Entries are keyed by file identity so an unchanged file is never probed twice
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class ProbeCache:
+    """On-disk LRU cache of video information keyed by (path, size, mtime, inode)"""
+
+    def __init__(self, cache_file='cache/probe_cache.json', max_entries=512):
+        """
+        Initialize probe cache
+
+        Args:
+            cache_file: JSON file holding cached probe results
+            max_entries: Number of entries kept before the least recently used is evicted
+        """
+        self.cache_file = Path(cache_file)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _key(self, video_file):
+        """Cache key for a file's current contents"""
+        stat = os.stat(video_file)
+        return f"{os.path.realpath(video_file)}|{stat.st_size}|{stat.st_mtime_ns}|{stat.st_ino}"
+
+    def _load(self):
+        """Load entries from disk (once)"""
+        if self._entries is None:
+            self._entries = OrderedDict()
+            if self.cache_file.exists():
+                try:
+                    with open(self.cache_file, 'r') as f:
+                        self._entries = OrderedDict(json.load(f))
+                except (OSError, ValueError) as e:
+                    print(f"Warning: Ignoring unreadable probe cache {self.cache_file}: {e}")
+        return self._entries
+
+    def _save(self):
+        """Atomically write entries to disk"""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(list(self._entries.items()), f)
+        os.replace(tmp_file, self.cache_file)
+
+    def get(self, video_file):
+        """
+        Get cached video information
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Copy of the cached video info dictionary, or None on a miss
+        """
+        try:
+            key = self._key(video_file)
+        except OSError:
+            return None
+
+        with self._lock:
+            entries = self._load()
+            info = entries.get(key)
+            if info is None:
+                return None
+
+            entries.move_to_end(key)
+            return dict(info)
+
+    def put(self, video_file, video_info):
+        """
+        Store video information for a file
+
+        Args:
+            video_file: Path to video file
+            video_info: Video info dictionary from a successful probe
+        """
+        try:
+            key = self._key(video_file)
+        except OSError:
+            return
+
+        with self._lock:
+            entries = self._load()
+
+            # Drop results for older versions of the same file
+            path_prefix = key.split('|', 1)[0] + '|'
+            for stale_key in [k for k in entries if k.startswith(path_prefix) and k != key]:
+                del entries[stale_key]
+
+            entries[key] = dict(video_info)
+            entries.move_to_end(key)
+
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+            self._save()
+
+    def invalidate(self, video_file=None):
+        """
+        Remove cached results
+
+        Args:
+            video_file: Path whose entries are removed (None = clear the whole cache)
+        """
+        with self._lock:
+            entries = self._load()
+
+            if video_file is None:
+                entries.clear()
+            else:
+                path_prefix = os.path.realpath(video_file) + '|'
+                for key in [k for k in entries if k.startswith(path_prefix)]:
+                    del entries[key]
+
+            self._save()
@@ -0,0 +1,185 @@
+"""
+Renditions - Renders per-platform video variants with ffmpeg
+Shorts trims and vertical scale/pad, cached by (source hash, recipe)
+"""
+
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+class Recipe:
+    """Operations that turn a source video into a platform variant"""
+
+    def __init__(self, max_duration=None, size=None):
+        """
+        Initialize recipe
+
+        Args:
+            max_duration: Trim to this many seconds (None = keep full length)
+            size: (width, height) to scale and pad to (None = keep size)
+        """
+        self.max_duration = max_duration
+        self.size = size
+
+    @property
+    def key(self):
+        """Stable name of the recipe, used in cached file names"""
+        parts = []
+        if self.max_duration:
+            parts.append(f"trim{self.max_duration}")
+        if self.size:
+            parts.append(f"{self.size[0]}x{self.size[1]}")
+        return '_'.join(parts) or 'copy'
+
+    def ffmpeg_args(self):
+        """
+        ffmpeg output options for this recipe
+
+        A plain trim copies the streams; scaling has to re-encode.
+
+        Returns:
+            List of command-line arguments
+        """
+        args = []
+        if self.max_duration:
+            args += ['-t', str(self.max_duration)]
+
+        if self.size:
+            width, height = self.size
+            args += [
+                '-vf', (f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1"),
+                '-c:v', 'libx264', '-preset', 'medium', '-crf', '20', '-pix_fmt', 'yuv420p',
+                '-c:a', 'aac', '-b:a', '128k'
+            ]
+        else:
+            args += ['-c', 'copy']
+
+        return args + ['-movflags', '+faststart']
+
+    def __repr__(self):
+        return f"Recipe({self.key})"
+
+
+def recipe_for(verdict):
+    """
+    Recipe that fixes what a target's rule verdict reported
+
+    Args:
+        verdict: Verdict dictionary from platform_rules.evaluate
+
+    Returns:
+        Recipe, or None if the source can be uploaded as it is
+    """
+    fixes = verdict.get('fixes') if verdict else None
+    if not fixes:
+        return None
+
+    return Recipe(fixes.get('max_duration'), fixes.get('size'))
+
+
+class RenditionFarm:
+    """Bounded pool of ffmpeg workers rendering cached platform variants"""
+
+    RENDER_TIMEOUT = 1800  # seconds
+
+    def __init__(self, output_dir='cache/renditions', max_workers=2):
+        """
+        Initialize rendition farm
+
+        Args:
+            output_dir: Directory of rendered variants
+            max_workers: Maximum ffmpeg processes running at once
+        """
+        self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def output_path(self, content_hash, recipe, source_file):
+        """Cached file for a (source hash, recipe) pair"""
+        _, ext = os.path.splitext(source_file)
+        ext = '.mp4' if recipe.size else ext.lower()
+        return self.output_dir / f"{content_hash}_{recipe.key}{ext}"
+
+    def submit(self, source_file, content_hash, recipe):
+        """
+        Request a variant, rendering it only if it isn't cached or already queued
+
+        Args:
+            source_file: Path to the source video
+            content_hash: Hex SHA-256 of the source video
+            recipe: Recipe to apply
+
+        Returns:
+            Future resolving to the variant's path, or to source_file if
+            rendering failed
+        """
+        output_file = self.output_path(content_hash, recipe, source_file)
+
+        with self._lock:
+            future = self._pending.get(output_file)
+            if future is not None:
+                return future
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='rendition')
+            future = self._executor.submit(self._render, source_file, recipe, output_file)
+            self._pending[output_file] = future
+
+        future.add_done_callback(lambda _: self._forget(output_file))
+        return future
+
+    def _forget(self, output_file):
+        """Drop a finished render from the in-flight table"""
+        with self._lock:
+            self._pending.pop(output_file, None)
+
+    def _render(self, source_file, recipe, output_file):
+        """
+        Render one variant with ffmpeg
+
+        Returns:
+            Path of the variant, or source_file on failure
+        """
+        if output_file.exists():
+            print(f"Using cached {recipe.key} rendition of {source_file}")
+            return str(output_file)
+
+        print(f"Rendering {recipe.key} rendition of {source_file}...")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(f"{output_file.stem}.tmp{output_file.suffix}")
+
+        cmd = ['ffmpeg', '-v', 'error', '-y', '-i', source_file] + recipe.ffmpeg_args() + [str(tmp_file)]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.RENDER_TIMEOUT)
+        except FileNotFoundError:
+            print("Warning: ffmpeg not found. Uploading the original file.")
+            return source_file
+        except subprocess.TimeoutExpired:
+            print(f"Warning: {recipe.key} rendition timed out. Uploading the original file.")
+            tmp_file.unlink(missing_ok=True)
+            return source_file
+
+        if result.returncode != 0:
+            print(f"Warning: {recipe.key} rendition failed. Uploading the original file. "
+                  f"{result.stderr.strip()}")
+            tmp_file.unlink(missing_ok=True)
+            return source_file
+
+        os.replace(tmp_file, output_file)
+        print(f"✓ {recipe.key} rendition ready: {output_file}")
+        return str(output_file)
+
+    def shutdown(self):
+        """Wait for queued renders and stop the workers"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
@@ -0,0 +1,229 @@
+"""
+Retry - Error classification, backoff and circuit breaking for uploads
+Shared by the platform uploaders to retry only what failed
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+
+# Failure categories
+TRANSIENT = 'transient'        # Dropped connection, timeout, 408
+RATE_LIMITED = 'rate_limited'  # 429, honour Retry-After
+SERVER_ERROR = 'server_error'  # 5xx
+FATAL = 'fatal'                # Other 4xx, retrying won't help
+
+RETRYABLE_CATEGORIES = (TRANSIENT, RATE_LIMITED, SERVER_ERROR)
+
+
+def classify_status(status_code):
+    """
+    Classify an HTTP error status
+
+    Args:
+        status_code: HTTP status code of a failed response
+
+    Returns:
+        Failure category string
+    """
+    if status_code == 429:
+        return RATE_LIMITED
+    if status_code == 408:
+        return TRANSIENT
+    if status_code >= 500:
+        return SERVER_ERROR
+    return FATAL
+
+
+def is_retryable(category):
+    """Whether a failure category is worth retrying"""
+    return category in RETRYABLE_CATEGORIES
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value (delay in seconds or an HTTP date), may be None
+
+    Returns:
+        Delay in seconds, or None if absent/unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Bounded, jittered exponential backoff"""
+
+    def __init__(self, max_retries=3, base_delay=1.0, max_delay=60.0, rate_limit_delay=30.0):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Retries allowed after the first attempt
+            base_delay: Backoff for the first retry in seconds
+            max_delay: Upper bound for a single backoff in seconds
+            rate_limit_delay: Minimum wait after a 429 without Retry-After
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limit_delay = rate_limit_delay
+
+    def should_retry(self, category, attempt):
+        """
+        Decide whether to retry
+
+        Args:
+            category: Failure category from classify_status()
+            attempt: Number of retries already made
+
+        Returns:
+            True if another attempt should be made
+        """
+        return is_retryable(category) and attempt < self.max_retries
+
+    def delay(self, attempt, category=None, retry_after=None):
+        """
+        Compute the wait before the next attempt ("full jitter" backoff)
+
+        Args:
+            attempt: Number of retries already made
+            category: Failure category (rate limits wait longer)
+            retry_after: Server-provided delay in seconds, if any
+
+        Returns:
+            Delay in seconds
+        """
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+        if retry_after is not None:
+            return max(retry_after, backoff)
+        if category == RATE_LIMITED:
+            return self.rate_limit_delay + backoff
+        return backoff
+
+    def wait(self, attempt, category=None, retry_after=None):
+        """
+        Sleep before the next attempt
+
+        Returns:
+            The delay that was slept, in seconds
+        """
+        delay = self.delay(attempt, category, retry_after)
+        time.sleep(delay)
+        return delay
+
+
+# Circuit breaker states
+CLOSED = 'closed'        # Requests flow
+OPEN = 'open'            # Platform is down, fail fast
+HALF_OPEN = 'half_open'  # Cooldown over, one probe request decides
+
+# Failures that say something about the platform's health (not our request)
+OUTAGE_CATEGORIES = (TRANSIENT, SERVER_ERROR)
+
+
+class CircuitBreaker:
+    """Stops sending uploads to a platform that keeps failing server-side"""
+
+    def __init__(self, name, failure_threshold=5, cooldown=120.0, clock=time.monotonic):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Platform the breaker guards (for messages)
+            failure_threshold: Consecutive outage failures that open the circuit
+            cooldown: Seconds the circuit stays open before a probe is allowed
+            clock: Monotonic time source in seconds
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        Check whether a request may be sent now
+
+        After the cooldown, exactly one caller gets through as the probe;
+        everyone else keeps failing fast until it reports back.
+
+        Returns:
+            True if the request may be sent
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self._probing = False
+
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+
+            return False
+
+    def retry_in(self):
+        """Seconds until the circuit lets a probe through (0 if closed)"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (self._clock() - self._opened_at))
+
+    def record_success(self):
+        """Record a successful request, closing the circuit"""
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"✓ {self.name} is healthy again, circuit closed")
+            self.state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self, category):
+        """
+        Record a failed request
+
+        Args:
+            category: Failure category; only outages count toward opening
+        """
+        with self._lock:
+            if category not in OUTAGE_CATEGORIES:
+                # The platform answered; a probe that did so ends the outage
+                if self.state == HALF_OPEN:
+                    self.state = CLOSED
+                    self._failures = 0
+                    self._probing = False
+                return
+
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    print(f"⚠️  {self.name} looks down ({self._failures} failures in a row), "
+                          f"pausing uploads for {self.cooldown:.0f}s")
+                self.state = OPEN
+                self._opened_at = self._clock()
+                self._probing = False
@@ -0,0 +1,318 @@
+"""
+Upload Scheduler - Long-lived worker pool for (video, platform) uploads
+Caps concurrent uploads overall, per platform and per account, bytes in
+flight across all uploads, and the rate of upload init requests
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class ByteBudget:
+    """Global cap on upload bytes in flight, shared by every chunk reader"""
+
+    def __init__(self, max_bytes):
+        """
+        Initialize byte budget
+
+        Args:
+            max_bytes: Maximum bytes reserved by all readers together
+        """
+        self.max_bytes = max_bytes
+        self.in_flight = 0
+        self._available = threading.Condition()
+
+    def acquire(self, size):
+        """
+        Reserve bytes, blocking until the budget has room
+
+        A request larger than the whole budget is let through alone, so a
+        big chunk can't wait forever.
+
+        Args:
+            size: Bytes about to be sent
+
+        Returns:
+            Bytes reserved (pass to release())
+        """
+        size = min(size, self.max_bytes)
+
+        with self._available:
+            while self.in_flight and self.in_flight + size > self.max_bytes:
+                self._available.wait()
+            self.in_flight += size
+
+        return size
+
+    def release(self, size):
+        """
+        Return reserved bytes once they have been sent
+
+        Args:
+            size: Bytes returned by acquire()
+        """
+        with self._available:
+            self.in_flight -= size
+            self._available.notify_all()
+
+
+class RateLimiter:
+    """Allows at most `rate` calls in any `period` seconds"""
+
+    def __init__(self, rate, period=60.0, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate: Calls allowed per period
+            period: Window length in seconds
+            clock: Monotonic time source in seconds
+            sleep: Function waiting a number of seconds
+        """
+        self.rate = rate
+        self.period = period
+        self._clock = clock
+        self._sleep = sleep
+        self._granted = deque(maxlen=rate)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait until a call is allowed
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            now = self._clock()
+            start = now
+            if len(self._granted) == self.rate:
+                # The call `rate` grants ago must have left the window
+                start = max(now, self._granted[0] + self.period)
+            self._granted.append(start)
+
+        delay = start - now
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+class UploadScheduler:
+    """Runs upload tasks on one pool without exceeding concurrency caps"""
+
+    def __init__(self, max_workers=4, platform_limits=None, account_limit=1, max_bytes_in_flight=None,
+                 init_rates=None):
+        """
+        Initialize scheduler
+
+        Args:
+            max_workers: Maximum uploads running at once
+            platform_limits: Dictionary mapping platform type ('youtube',
+                             'tiktok') to its maximum concurrent uploads
+                             (missing = only bounded by max_workers)
+            account_limit: Maximum concurrent uploads per platform account
+                           (e.g., 'tiktok_english'), or a dictionary mapping
+                           accounts to their limit with an optional 'default'
+            max_bytes_in_flight: Cap on bytes being sent by all uploads
+                                 together (None = unlimited)
+            init_rates: Dictionary mapping platform type to the upload init
+                        requests each account may make per minute
+        """
+        self.max_workers = max_workers
+        self.platform_limits = dict(platform_limits or {})
+        if isinstance(account_limit, dict):
+            self.account_limits = dict(account_limit)
+            self.account_limit = self.account_limits.pop('default', 1)
+        else:
+            self.account_limits = {}
+            self.account_limit = account_limit
+        self.byte_budget = ByteBudget(max_bytes_in_flight) if max_bytes_in_flight else None
+        self.init_rates = dict(init_rates or {})
+        self._init_limiters = {}
+        self._queue = deque()
+        self._delayed = 0
+        self._closed = False
+        self._running = 0
+        self._running_by_platform = {}
+        self._running_by_account = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='upload')
+
+    @classmethod
+    def from_config(cls, upload_settings):
+        """
+        Build a scheduler from the 'concurrency' block of upload_settings
+
+        Args:
+            upload_settings: upload_settings dictionary from config.json
+
+        Returns:
+            UploadScheduler instance
+        """
+        concurrency = upload_settings.get('concurrency', {})
+        max_bytes_mb = concurrency.get('max_bytes_in_flight_mb')
+        return cls(
+            max_workers=concurrency.get('max_workers', 4),
+            platform_limits=concurrency.get('per_platform'),
+            account_limit=concurrency.get('per_account', 1),
+            max_bytes_in_flight=int(max_bytes_mb * 1024 * 1024) if max_bytes_mb else None,
+            init_rates=concurrency.get('init_per_minute')
+        )
+
+    def init_limiter(self, platform):
+        """
+        Get the shared limiter for an account's upload init requests
+
+        Args:
+            platform: Platform identifier (e.g., 'tiktok_english')
+
+        Returns:
+            RateLimiter, or None if the platform type has no configured rate
+        """
+        rate = self.init_rates.get(platform.split('_')[0])
+        if not rate:
+            return None
+
+        with self._lock:
+            if platform not in self._init_limiters:
+                self._init_limiters[platform] = RateLimiter(rate, period=60.0)
+            return self._init_limiters[platform]
+
+    def submit(self, platform, fn, *args, **kwargs):
+        """
+        Queue an upload task for a platform account
+
+        Args:
+            platform: Platform identifier (e.g., 'youtube_english')
+            fn: Callable performing the upload
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Future resolving to fn's return value
+        """
+        future = Future()
+
+        with self._lock:
+            self._queue.append((platform, future, fn, args, kwargs))
+
+        self._dispatch()
+        return future
+
+    def submit_later(self, delay, platform, fn, *args, **kwargs):
+        """
+        Queue an upload task once a delay has passed
+
+        The task holds no worker or concurrency slot while it waits, so a
+        retry's backoff doesn't keep other uploads of the account waiting.
+
+        Args:
+            delay: Seconds to wait before queueing the task
+            platform: Platform identifier (e.g., 'youtube_english')
+            fn: Callable performing the upload
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Future resolving to fn's return value
+        """
+        future = Future()
+
+        with self._lock:
+            self._delayed += 1
+
+        timer = threading.Timer(delay, self._enqueue_delayed, args=((platform, future, fn, args, kwargs),))
+        timer.daemon = True
+        timer.start()
+        return future
+
+    def _enqueue_delayed(self, task):
+        """Queue a task whose delay has passed"""
+        with self._lock:
+            self._delayed -= 1
+            if self._closed:
+                task[1].cancel()
+                self._idle.notify_all()
+                return
+            self._queue.append(task)
+
+        self._dispatch()
+
+    def _has_capacity(self, platform):
+        """Whether a task for this account may start now (lock held)"""
+        platform_type = platform.split('_')[0]
+        platform_limit = self.platform_limits.get(platform_type)
+        account_limit = self.account_limits.get(platform, self.account_limit)
+
+        return (self._running < self.max_workers
+                and (platform_limit is None or self._running_by_platform.get(platform_type, 0) < platform_limit)
+                and self._running_by_account.get(platform, 0) < account_limit)
+
+    def _dispatch(self):
+        """Start every queued task whose caps allow it, oldest first"""
+        with self._lock:
+            waiting = deque()
+
+            while self._queue:
+                task = self._queue.popleft()
+                platform, future = task[0], task[1]
+
+                if future.cancelled():
+                    continue
+
+                if not self._has_capacity(platform):
+                    waiting.append(task)
+                    continue
+
+                platform_type = platform.split('_')[0]
+                self._running += 1
+                self._running_by_platform[platform_type] = self._running_by_platform.get(platform_type, 0) + 1
+                self._running_by_account[platform] = self._running_by_account.get(platform, 0) + 1
+                self._executor.submit(self._run, task)
+
+            self._queue = waiting
+            if not self._running and not self._queue and not self._delayed:
+                self._idle.notify_all()
+
+    def _run(self, task):
+        """Run one task, then release its slots and start what they unblock"""
+        platform, future, fn, args, kwargs = task
+
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            platform_type = platform.split('_')[0]
+            with self._lock:
+                self._running -= 1
+                self._running_by_platform[platform_type] -= 1
+                self._running_by_account[platform] -= 1
+            self._dispatch()
+
+    def pending(self):
+        """Number of tasks queued, waiting out a delay or running"""
+        with self._lock:
+            return len(self._queue) + self._delayed + self._running
+
+    def shutdown(self, wait=True):
+        """
+        Stop the scheduler
+
+        Args:
+            wait: Wait for queued, delayed and running tasks to finish
+        """
+        with self._lock:
+            if wait:
+                # Queued tasks are only handed to the executor as slots free up
+                while self._running or self._queue or self._delayed:
+                    self._idle.wait()
+            else:
+                for task in self._queue:
+                    task[1].cancel()
+                self._queue.clear()
+            self._closed = True
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,209 @@
+"""
+Shared Source - Reference-counted memory maps of video files
+Lets every concurrent upload of the same file read from one mapping
+"""
+
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+
+
+# Read-ahead is requested in windows of this many bytes (page aligned)
+PREFETCH_WINDOW = 8 * 1024 * 1024
+
+
+class SharedMappedSource:
+    """Read-only memory map of a file shared by several readers"""
+
+    def __init__(self, video_file, key=None):
+        """
+        Map a file into memory
+
+        Args:
+            video_file: Path to video file
+            key: Registry key the source is stored under
+        """
+        self.key = key
+        self.path = os.path.realpath(video_file)
+        self._file = open(self.path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._prefetched = set()
+        self._lock = threading.Lock()
+        self.refcount = 0
+
+    def fileno(self):
+        """File descriptor of the mapped file"""
+        return self._file.fileno()
+
+    def read_at(self, offset, size):
+        """
+        Read bytes at an offset without moving any shared position
+
+        The first reader to reach a window asks the kernel to read it
+        ahead, so readers that follow find the pages already cached.
+
+        Args:
+            offset: File offset
+            size: Maximum number of bytes
+
+        Returns:
+            Bytes read (empty at end of file)
+        """
+        if self._map is None or offset >= self.size:
+            return b''
+
+        end = min(offset + size, self.size)
+        self._prefetch(offset // PREFETCH_WINDOW)
+        return self._map[offset:end]
+
+    def _prefetch(self, window):
+        """Hint the kernel to read a window ahead (once per window)"""
+        if not hasattr(self._map, 'madvise') or not hasattr(mmap, 'MADV_WILLNEED'):
+            return
+
+        with self._lock:
+            if window in self._prefetched:
+                return
+            self._prefetched.add(window)
+
+        start = window * PREFETCH_WINDOW
+        length = min(PREFETCH_WINDOW, self.size - start)
+        try:
+            self._map.madvise(mmap.MADV_WILLNEED, start, length)
+        except (OSError, ValueError):
+            pass
+
+    def close(self):
+        """Unmap the file and close it"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class MappedReader:
+    """File-like cursor over a SharedMappedSource with its own position"""
+
+    def __init__(self, source, on_close=None):
+        """
+        Initialize reader
+
+        Args:
+            source: SharedMappedSource to read from
+            on_close: Called with the source when the reader is closed
+        """
+        self.source = source
+        self._pos = 0
+        self._on_close = on_close
+
+    def read(self, size=-1):
+        """Read up to size bytes from the current position"""
+        if size is None or size < 0:
+            size = self.source.size - self._pos
+        data = self.source.read_at(self._pos, size)
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move the position"""
+        if whence == os.SEEK_SET:
+            self._pos = offset
+        elif whence == os.SEEK_CUR:
+            self._pos += offset
+        elif whence == os.SEEK_END:
+            self._pos = self.source.size + offset
+        self._pos = max(0, self._pos)
+        return self._pos
+
+    def tell(self):
+        """Current position"""
+        return self._pos
+
+    def close(self):
+        """Release the reader's reference to the source"""
+        if self._on_close:
+            self._on_close(self.source)
+            self._on_close = None
+
+
+class SharedSourceRegistry:
+    """Hands out one shared mapping per file, unmapped when the last user releases it"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def _key(self, video_file):
+        """Registry key for a file's current contents"""
+        stat = os.stat(video_file)
+        return (os.path.realpath(video_file), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    def acquire(self, video_file):
+        """
+        Get the shared mapping of a file, taking a reference
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            SharedMappedSource (release it when done)
+        """
+        key = self._key(video_file)
+
+        with self._lock:
+            source = self._sources.get(key)
+            if source is None:
+                source = SharedMappedSource(video_file, key)
+                self._sources[key] = source
+            source.refcount += 1
+            return source
+
+    def release(self, source):
+        """
+        Drop a reference taken by acquire()
+
+        Args:
+            source: SharedMappedSource returned by acquire()
+        """
+        with self._lock:
+            source.refcount -= 1
+            if source.refcount > 0:
+                return
+            if self._sources.get(source.key) is source:
+                del self._sources[source.key]
+
+        source.close()
+
+    @contextmanager
+    def open(self, video_file):
+        """
+        Context manager yielding the shared mapping of a file
+
+        Args:
+            video_file: Path to video file
+        """
+        source = self.acquire(video_file)
+        try:
+            yield source
+        finally:
+            self.release(source)
+
+    def reader(self, video_file):
+        """
+        Open a file-like reader over the shared mapping of a file
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            MappedReader (closing it releases its reference)
+        """
+        return MappedReader(self.acquire(video_file), on_close=self.release)
+
+    def active(self):
+        """Number of files currently mapped"""
+        with self._lock:
+            return len(self._sources)
@@ -0,0 +1,157 @@
+"""
+Status Poller - Tracks TikTok publish IDs in the background
+One thread polls every pending publish so upload workers never sleep
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+
+# Publish states after which polling stops. PROCESSING_DOWNLOAD means TikTok
+# has the whole file and is ingesting it; the upload itself is done.
+FINAL_STATES = ('PUBLISH_COMPLETE', 'PROCESSING_DOWNLOAD', 'SEND_TO_USER_INBOX', 'FAILED')
+
+
+class StatusPoller:
+    """Polls the publish status of many uploads with adaptive backoff"""
+
+    FINAL_STATES = FINAL_STATES
+    THREADS = 1  # polling threads, each holding at most one connection at a time
+
+    def __init__(self, initial_interval=2.0, max_interval=30.0, backoff=1.5, max_wait=600):
+        """
+        Initialize status poller
+
+        Args:
+            initial_interval: Seconds before the first poll of a publish ID
+            max_interval: Upper bound for the wait between two polls
+            backoff: Factor applied to the interval after every poll
+            max_wait: Seconds after which a publish ID stops being tracked
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_wait = max_wait
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def track(self, publish_id, fetch_status, callback=None):
+        """
+        Start tracking a publish ID
+
+        Args:
+            publish_id: TikTok publish ID
+            fetch_status: Callable taking the publish ID and returning the
+                          current status string (None if the poll failed)
+            callback: Optional callable(publish_id, status) run on completion
+
+        Returns:
+            Future resolving to the final status, or the last observed status
+            if max_wait elapses first ('TIMEOUT' if none was ever observed)
+        """
+        now = time.monotonic()
+        entry = {
+            'publish_id': publish_id,
+            'fetch_status': fetch_status,
+            'callback': callback,
+            'future': Future(),
+            'interval': self.initial_interval,
+            'deadline': now + self.max_wait,
+            'last_status': None
+        }
+
+        with self._condition:
+            self._schedule(entry, now + self.initial_interval)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='tiktok-status-poller', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        return entry['future']
+
+    def pending(self):
+        """Number of publish IDs still being tracked"""
+        with self._condition:
+            return len(self._queue)
+
+    def _schedule(self, entry, due):
+        """Queue an entry for its next poll (caller holds the lock)"""
+        heapq.heappush(self._queue, (due, next(self._counter), entry))
+
+    def _run(self):
+        """Poll loop: wake for the earliest due publish ID, poll it, reschedule"""
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+
+                due, _, entry = self._queue[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(timeout=delay)
+                    continue
+
+                heapq.heappop(self._queue)
+
+            self._poll(entry)
+
+    def _poll(self, entry):
+        """Poll one publish ID and either finish or reschedule it"""
+        publish_id = entry['publish_id']
+
+        try:
+            status = entry['fetch_status'](publish_id)
+        except Exception as e:
+            print(f"Error checking TikTok status for {publish_id}: {e}")
+            status = None
+
+        if status:
+            if status != entry['last_status']:
+                print(f"TikTok publish {publish_id} status: {status}")
+            entry['last_status'] = status
+
+        now = time.monotonic()
+
+        if status in self.FINAL_STATES:
+            self._finish(entry, status)
+        elif now >= entry['deadline']:
+            self._finish(entry, entry['last_status'] or 'TIMEOUT')
+        else:
+            entry['interval'] = min(entry['interval'] * self.backoff, self.max_interval)
+            with self._condition:
+                self._schedule(entry, min(now + entry['interval'], entry['deadline']))
+
+    def _finish(self, entry, status):
+        """Resolve an entry's future and run its callback"""
+        entry['future'].set_result(status)
+
+        if entry['callback']:
+            try:
+                entry['callback'](entry['publish_id'], status)
+            except Exception as e:
+                print(f"Error in TikTok status callback for {entry['publish_id']}: {e}")
+
+
+_shared_poller = None
+_shared_poller_lock = threading.Lock()
+
+
+def get_status_poller():
+    """
+    Get the process-wide status poller
+
+    Returns:
+        StatusPoller instance shared by all TikTok uploaders
+    """
+    global _shared_poller
+
+    with _shared_poller_lock:
+        if _shared_poller is None:
+            _shared_poller = StatusPoller()
+        return _shared_poller
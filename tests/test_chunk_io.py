@@ -0,0 +1,104 @@
+"""
+Tests for chunk_io - chunk readers, checksums and byte budget reservations
+"""
+
+import hashlib
+import io
+
+from chunk_io import FileChunk, IntegrityRecorder, TeeReader
+from scheduler import ByteBudget
+
+
+CHUNK = 16
+DATA = bytes(range(256)) * 3  # 768 bytes = 48 chunks
+
+
+class CountingBudget(ByteBudget):
+    """ByteBudget counting its acquire() calls"""
+
+    def __init__(self, max_bytes):
+        super().__init__(max_bytes)
+        self.acquired = 0
+
+    def acquire(self, size):
+        self.acquired += 1
+        return super().acquire(size)
+
+
+def tee_reader(budget=None, data=DATA):
+    recorder = IntegrityRecorder(len(data))
+    return TeeReader(io.BytesIO(data), recorder, CHUNK, budget=budget), recorder
+
+
+def test_tee_reader_records_file_and_chunk_checksums():
+    reader, recorder = tee_reader()
+
+    while reader.read(CHUNK):
+        pass
+    summary = recorder.finalize('unused.mp4')
+
+    assert summary['sha256'] == hashlib.sha256(DATA).hexdigest()
+    assert summary['extra_bytes_read'] == 0
+    assert len(summary['chunks']) == len(DATA) // CHUNK
+    assert summary['chunks'][0] == {'start': 0, 'end': CHUNK, 'sha256': hashlib.sha256(DATA[:CHUNK]).hexdigest()}
+
+
+def test_tee_reader_reserves_once_per_chunk():
+    budget = CountingBudget(1024)
+    reader, _ = tee_reader(budget)
+
+    for _ in range(4):
+        reader.read(CHUNK // 4)
+
+    assert budget.acquired == 1
+    assert budget.in_flight == CHUNK
+
+    reader.read(CHUNK // 4)
+
+    assert budget.acquired == 2
+    assert budget.in_flight == CHUNK
+
+
+def test_tee_reader_releases_on_seek_back_and_close():
+    budget = CountingBudget(1024)
+    reader, _ = tee_reader(budget)
+
+    reader.read(CHUNK)
+    reader.seek(0)
+    assert budget.in_flight == 0
+
+    reader.read(CHUNK)
+    assert budget.acquired == 2
+
+    reader.close()
+    assert budget.in_flight == 0
+
+
+def test_file_chunk_reads_its_range(tmp_path):
+    path = tmp_path / 'video.mp4'
+    path.write_bytes(DATA)
+
+    with open(path, 'rb') as f:
+        chunk = FileChunk(f, CHUNK, 2 * CHUNK)
+        assert chunk.read(5) == DATA[CHUNK:CHUNK + 5]
+        assert chunk.read() == DATA[CHUNK + 5:3 * CHUNK]
+        assert chunk.read() == b''
+
+
+def test_file_chunk_reserve_holds_budget_until_close(tmp_path):
+    path = tmp_path / 'video.mp4'
+    path.write_bytes(DATA)
+    budget = CountingBudget(1024)
+
+    with open(path, 'rb') as f:
+        chunk = FileChunk(f, 0, CHUNK, budget=budget)
+        chunk.reserve()
+        assert budget.in_flight == CHUNK
+
+        chunk.read()
+        chunk.seek(0)
+        chunk.read()
+        assert budget.acquired == 1
+
+        chunk.close()
+        assert budget.in_flight == 0
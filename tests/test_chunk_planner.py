@@ -0,0 +1,100 @@
+"""
+Tests for chunk_planner - TikTok chunk layout and throughput estimates
+"""
+
+import pytest
+
+from chunk_planner import ChunkPlanner, ThroughputStore
+
+
+MB = 1024 * 1024
+HOST = 'open-upload.tiktokapis.com'
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ThroughputStore(tmp_path / 'throughput.json')
+
+
+def assert_valid_layout(video_size, chunk_size, chunk_count):
+    """TikTok's FILE_UPLOAD chunking rules"""
+    assert chunk_count == video_size // chunk_size
+    assert 1 <= chunk_count <= ChunkPlanner.MAX_CHUNK_COUNT
+    assert ChunkPlanner.MIN_CHUNK_SIZE <= chunk_size <= ChunkPlanner.MAX_CHUNK_SIZE
+    last_chunk = video_size - chunk_size * (chunk_count - 1)
+    assert last_chunk <= 128 * MB
+
+
+def test_small_video_is_one_whole_chunk(store):
+    planner = ChunkPlanner(store)
+    assert planner.plan(3 * MB, HOST) == (3 * MB, 1)
+    assert planner.plan(5 * MB - 1, HOST) == (5 * MB - 1, 1)
+
+
+def test_default_chunk_size_without_measurement(store):
+    planner = ChunkPlanner(store)
+    chunk_size, chunk_count = planner.plan(100 * MB, HOST)
+    assert (chunk_size, chunk_count) == (10 * MB, 10)
+
+
+@pytest.mark.parametrize('video_size', [
+    5 * MB, 5 * MB + 1, 9 * MB, 64 * MB + 7, 129 * MB, 1000 * MB + 12345, 4 * 1024 * MB
+])
+@pytest.mark.parametrize('bytes_per_second', [None, 100 * 1024, 2 * MB, 500 * MB])
+def test_plan_is_always_valid(store, video_size, bytes_per_second):
+    if bytes_per_second:
+        store.record(HOST, bytes_per_second, 1.0)
+    chunk_size, chunk_count = ChunkPlanner(store).plan(video_size, HOST)
+    assert_valid_layout(video_size, chunk_size, chunk_count)
+
+
+def test_fast_link_is_capped_at_max_chunk_size(store):
+    store.record(HOST, 500 * MB, 1.0)
+    planner = ChunkPlanner(store)
+    assert planner.target_chunk_size(HOST) == ChunkPlanner.MAX_CHUNK_SIZE
+
+
+def test_slow_link_is_raised_to_min_chunk_size(store):
+    store.record(HOST, 10 * 1024, 1.0)
+    planner = ChunkPlanner(store)
+    assert planner.target_chunk_size(HOST) == ChunkPlanner.MIN_CHUNK_SIZE
+
+
+def test_target_follows_measured_throughput(store):
+    store.record(HOST, 2 * MB, 1.0)
+    planner = ChunkPlanner(store)
+    assert planner.target_chunk_size(HOST) == 2 * MB * ChunkPlanner.TARGET_CHUNK_SECONDS
+
+
+def test_chunk_count_never_exceeds_limit(store):
+    store.record(HOST, 1, 1.0)
+    video_size = ChunkPlanner.MAX_CHUNK_COUNT * ChunkPlanner.MIN_CHUNK_SIZE * 3
+    chunk_size, chunk_count = ChunkPlanner(store).plan(video_size, HOST)
+    assert chunk_count <= ChunkPlanner.MAX_CHUNK_COUNT
+    assert chunk_count == video_size // chunk_size
+
+
+def test_throughput_store_smooths_and_persists(tmp_path):
+    store_file = tmp_path / 'throughput.json'
+    store = ThroughputStore(store_file)
+    assert store.get(HOST) is None
+
+    store.record(HOST, 100, 1.0)
+    store.record(HOST, 200, 1.0)
+    expected = ThroughputStore.SMOOTHING * 200 + (1 - ThroughputStore.SMOOTHING) * 100
+    assert store.get(HOST) == pytest.approx(expected)
+
+    assert ThroughputStore(store_file).get(HOST) == pytest.approx(expected)
+
+
+def test_throughput_store_ignores_empty_measurements(store):
+    store.record(HOST, 0, 1.0)
+    store.record(HOST, 100, 0)
+    store.record(None, 100, 1.0)
+    assert store.get(HOST) is None
+
+
+def test_throughput_store_ignores_unreadable_cache(tmp_path):
+    store_file = tmp_path / 'throughput.json'
+    store_file.write_text('{not json')
+    assert ThroughputStore(store_file).get(HOST) is None
@@ -0,0 +1,129 @@
+"""
+Tests for job_queue - leases, retries and attempt limits
+"""
+
+import pytest
+
+from job_queue import JobQueue, PENDING, RUNNING, DONE, FAILED
+from retry import FATAL, SERVER_ERROR, TRANSIENT
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    return JobQueue(str(tmp_path / 'jobs.db'), max_attempts=2, clock=clock)
+
+
+def failure(category=None, **extra):
+    result = {'success': False, 'error': 'boom', 'platform': 'tiktok_english', **extra}
+    if category:
+        result['category'] = category
+    return result
+
+
+def test_claim_leases_oldest_job_once(queue):
+    first = queue.enqueue('a.json', platforms=['tiktok_english'], max_retries=2, force=True)
+    queue.enqueue('b.json')
+
+    job = queue.claim('worker-1')
+
+    assert job['id'] == first
+    assert job['expired_owner'] is None
+    assert (job['status'], job['attempts'], job['lease_owner']) == (RUNNING, 1, 'worker-1')
+    assert (job['platforms'], job['max_retries'], job['force']) == (['tiktok_english'], 2, True)
+    assert queue.claim('worker-2')['metadata_file'].endswith('b.json')
+    assert queue.claim('worker-3') is None
+
+
+def test_successful_results_finish_the_job(queue):
+    job_id = queue.enqueue('a.json')
+    queue.claim('w')
+
+    assert queue.complete(job_id, 'w', {'tiktok_english': {'success': True}}) == DONE
+
+
+@pytest.mark.parametrize('category', [TRANSIENT, SERVER_ERROR])
+def test_retryable_failure_goes_back_to_pending_with_delay(queue, clock, category):
+    job_id = queue.enqueue('a.json')
+    queue.claim('w')
+
+    assert queue.complete(job_id, 'w', {'tiktok_english': failure(category)}) == PENDING
+    assert queue.claim('w') is None
+    assert queue.next_available() == pytest.approx(JobQueue.RETRY_DELAY)
+
+    clock.advance(JobQueue.RETRY_DELAY)
+    assert queue.claim('w')['attempts'] == 2
+
+
+@pytest.mark.parametrize('result', [
+    failure(FATAL),
+    failure(ineligible=True),
+])
+def test_unretryable_failure_fails_the_job(queue, result):
+    job_id = queue.enqueue('a.json')
+    queue.claim('w')
+
+    results = {'youtube_english': {'success': True}, 'tiktok_english': result}
+
+    assert queue.complete(job_id, 'w', results) == FAILED
+
+
+def test_target_still_in_flight_elsewhere_is_retried(queue):
+    job_id = queue.enqueue('a.json')
+    queue.claim('w')
+
+    assert queue.complete(job_id, 'w', {'tiktok_english': failure(TRANSIENT, in_flight=True)}) == PENDING
+
+
+def test_retries_stop_at_max_attempts(queue, clock):
+    job_id = queue.enqueue('a.json')
+
+    for expected in (PENDING, FAILED):
+        assert queue.claim('w') is not None
+        assert queue.complete(job_id, 'w', {'tiktok_english': failure(TRANSIENT)}) == expected
+        clock.advance(10 * JobQueue.RETRY_DELAY)
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    job_id = queue.enqueue('a.json')
+    queue.claim('dead-worker', lease_seconds=30)
+
+    assert queue.claim('w') is None
+    clock.advance(31)
+
+    job = queue.claim('w')
+    assert (job['id'], job['attempts']) == (job_id, 2)
+    assert job['expired_owner'] == 'dead-worker'
+
+    # The old worker no longer holds the lease
+    assert not queue.heartbeat(job_id, 'dead-worker')
+    assert queue.complete(job_id, 'dead-worker', {}) is None
+
+
+def test_expired_last_attempt_fails_the_job(queue, clock):
+    job_id = queue.enqueue('a.json')
+    for _ in range(2):
+        queue.claim('w', lease_seconds=30)
+        clock.advance(31)
+
+    assert queue.claim('w') is None
+    assert queue.jobs()[0]['status'] == FAILED
+    assert queue.jobs()[0]['id'] == job_id
+
+
+def test_heartbeat_extends_the_lease(queue, clock):
+    job_id = queue.enqueue('a.json')
+    queue.claim('w', lease_seconds=30)
+
+    clock.advance(20)
+    assert queue.heartbeat(job_id, 'w', lease_seconds=30)
+    clock.advance(20)
+
+    assert queue.claim('other') is None
+
+
+def test_fail_without_retry(queue):
+    job_id = queue.enqueue('a.json')
+    queue.claim('w')
+
+    assert queue.fail(job_id, 'w', 'bad metadata', retry=False) == FAILED
+    assert queue.counts() == {FAILED: 1}
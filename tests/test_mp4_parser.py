@@ -0,0 +1,126 @@
+"""
+Tests for mp4_parser - native MP4/MOV probing and faststart detection
+"""
+
+import struct
+
+import pytest
+
+from mp4_parser import needs_faststart, probe_mp4, read_top_level_boxes
+
+
+def box(box_type, payload=b''):
+    return struct.pack('>I4s', 8 + len(payload), box_type.encode('latin-1')) + payload
+
+
+def time_header(timescale, duration):
+    # version/flags, creation and modification time, then timescale and duration
+    return b'\0' * 12 + struct.pack('>II', timescale, duration) + b'\0' * 80
+
+
+def video_trak(width=1080, height=1920, fourcc='avc1', timescale=30000, frame_delta=1001, handler=b'vide'):
+    sample_entry = (struct.pack('>I4s', 86, fourcc.encode('latin-1')) + b'\0' * 24
+                    + struct.pack('>HH', width, height) + b'\0' * 50)
+    stsd = box('stsd', b'\0' * 4 + struct.pack('>I', 1) + sample_entry)
+    stts = box('stts', b'\0' * 4 + struct.pack('>III', 1, 300, frame_delta))
+    stbl = box('stbl', stsd + stts)
+    hdlr = box('hdlr', b'\0' * 8 + handler + b'\0' * 13)
+    mdia = box('mdia', box('mdhd', time_header(timescale, 300 * frame_delta)) + hdlr + box('minf', stbl))
+    return box('trak', mdia)
+
+
+def moov(duration=10, timescale=1000, traks=None):
+    traks = [video_trak()] if traks is None else traks
+    return box('moov', box('mvhd', time_header(timescale, duration * timescale)) + b''.join(traks))
+
+
+def write_mp4(tmp_path, *boxes, name='video.mp4'):
+    path = tmp_path / name
+    path.write_bytes(box('ftyp', b'isom\0\0\0\0') + b''.join(boxes))
+    return str(path)
+
+
+def test_probe_reads_video_properties(tmp_path):
+    path = write_mp4(tmp_path, moov(duration=10), box('mdat', b'\0' * 1000))
+
+    info = probe_mp4(path)
+
+    assert info['width'] == 1080
+    assert info['height'] == 1920
+    assert info['duration'] == pytest.approx(10)
+    assert info['codec'] == 'h264'
+    assert info['fps'] == pytest.approx(29.97, abs=0.01)
+    assert info['size'] == (tmp_path / 'video.mp4').stat().st_size
+    assert info['bitrate'] == int(info['size'] * 8 / 10)
+
+
+def test_probe_finds_trailing_moov(tmp_path):
+    path = write_mp4(tmp_path, box('mdat', b'\0' * 5000), moov(duration=4))
+
+    assert probe_mp4(path)['duration'] == pytest.approx(4)
+
+
+def test_probe_skips_non_video_tracks(tmp_path):
+    audio = video_trak(handler=b'soun', fourcc='mp4a')
+    video = video_trak(width=1920, height=1080, fourcc='hvc1')
+    path = write_mp4(tmp_path, moov(traks=[audio, video]), box('mdat'))
+
+    info = probe_mp4(path)
+
+    assert (info['width'], info['height'], info['codec']) == (1920, 1080, 'hevc')
+
+
+@pytest.mark.parametrize('boxes', [
+    (box('mdat', b'\0' * 100),),                            # no moov
+    (moov(traks=[video_trak(handler=b'soun')]),),           # no video track
+    (moov(duration=0), box('mdat')),                        # fragmented: no duration in mvhd
+])
+def test_probe_leaves_unsupported_files_to_ffprobe(tmp_path, boxes):
+    assert probe_mp4(write_mp4(tmp_path, *boxes)) is None
+
+
+def test_probe_rejects_truncated_file(tmp_path):
+    path = tmp_path / 'truncated.mp4'
+    path.write_bytes((box('ftyp', b'isom') + moov())[:-20])
+
+    assert probe_mp4(str(path)) is None
+
+
+def test_probe_rejects_non_mp4(tmp_path):
+    path = tmp_path / 'notes.mp4'
+    path.write_bytes(b'this is not a video file at all')
+
+    assert probe_mp4(str(path)) is None
+
+
+def test_top_level_boxes_handle_64_bit_size(tmp_path):
+    payload = b'\0' * 32
+    large_mdat = struct.pack('>I4sQ', 1, b'mdat', 16 + len(payload)) + payload
+    path = write_mp4(tmp_path, large_mdat, moov())
+
+    boxes = read_top_level_boxes(path)
+
+    assert [b[0] for b in boxes] == ['ftyp', 'mdat', 'moov']
+    assert boxes[1][2] == 16 + len(payload)
+    assert probe_mp4(path)['duration'] == pytest.approx(10)
+
+
+@pytest.mark.parametrize('order, expected', [
+    (('moov', 'mdat'), False),
+    (('mdat', 'moov'), True),
+    (('free', 'mdat', 'moov'), True),
+    (('mdat',), False),
+])
+def test_needs_faststart_follows_box_order(tmp_path, order, expected):
+    boxes = {'moov': moov(), 'mdat': box('mdat', b'\0' * 64), 'free': box('free')}
+    path = write_mp4(tmp_path, *(boxes[box_type] for box_type in order))
+
+    assert needs_faststart(path) is expected
+
+
+def test_needs_faststart_ignores_unreadable_files(tmp_path):
+    path = tmp_path / 'broken.mp4'
+    path.write_bytes(b'\0\0\0\x40mdat' + b'\0' * 8)
+
+    assert needs_faststart(str(path)) is False
+    assert needs_faststart(str(tmp_path / 'missing.mp4')) is False
@@ -0,0 +1,106 @@
+"""
+Tests for platform_rules - per-platform eligibility verdicts
+"""
+
+import pytest
+
+import platform_rules
+from platform_rules import evaluate
+
+
+def video_info(width=1080, height=1920, duration=30.0, size=50 * 1024 * 1024):
+    return {'width': width, 'height': height, 'duration': duration, 'size': size}
+
+
+@pytest.mark.parametrize('platform', ['youtube_english', 'tiktok_japanese', 'tiktok'])
+def test_recommended_video_passes_cleanly(platform):
+    verdict = evaluate(platform, video_info())
+
+    assert verdict == {'eligible': True, 'errors': [], 'warnings': [], 'fixes': {}}
+
+
+def test_oversized_file_is_ineligible_everywhere():
+    info = video_info(size=platform_rules.MAX_FILE_SIZE + 1)
+
+    for platform in ('youtube_english', 'tiktok_english'):
+        verdict = evaluate(platform, info)
+        assert not verdict['eligible']
+        assert verdict['errors'][0].startswith('File too large')
+
+
+def test_long_video_is_only_a_warning_on_youtube():
+    info = video_info(duration=90.0)
+
+    youtube = evaluate('youtube_english', info)
+    tiktok = evaluate('tiktok_english', info)
+
+    assert youtube['eligible'] and youtube['warnings'] == ["Duration 90.0s exceeds YouTube Shorts limit (60s)"]
+    assert youtube['fixes'] == {}
+    assert tiktok == {'eligible': True, 'errors': [], 'warnings': [], 'fixes': {}}
+
+
+def test_tiktok_rejects_videos_over_ten_minutes():
+    verdict = evaluate('tiktok_english', video_info(duration=700.0))
+
+    assert not verdict['eligible']
+    assert verdict['errors'] == ["Video too long: 700.0s (max 600s for TikTok)"]
+    assert verdict['fixes'] == {}
+
+
+def test_renditions_turn_fixable_errors_into_warnings():
+    verdict = evaluate('tiktok_english', video_info(duration=700.0), renditions=True)
+
+    assert verdict['eligible']
+    assert verdict['warnings'] == ["Video too long: 700.0s (max 600s for TikTok) (a rendition will be uploaded)"]
+    assert verdict['fixes'] == {'max_duration': platform_rules.TIKTOK_MAX_DURATION}
+
+
+def test_renditions_cannot_fix_file_size():
+    verdict = evaluate('youtube_english', video_info(size=platform_rules.MAX_FILE_SIZE + 1), renditions=True)
+
+    assert not verdict['eligible']
+
+
+def test_renditions_true_only_fixes_what_makes_a_target_ineligible():
+    youtube = evaluate('youtube_english', video_info(duration=90.0, width=1920, height=1080), renditions=True)
+    tiktok = evaluate('tiktok_english', video_info(width=1920, height=1080), renditions=True)
+
+    assert youtube['fixes'] == {} and tiktok['fixes'] == {}
+    assert tiktok['warnings'] == ["Resolution 1920x1080 differs from recommended 1080x1920 for vertical video"]
+
+
+def test_per_platform_setting_renders_shorts_cut_and_vertical_video():
+    renditions = {'youtube': ['duration', 'resolution']}
+
+    verdict = evaluate('youtube_english', video_info(duration=90.0, width=1920, height=1080), renditions)
+
+    assert verdict['eligible']
+    assert verdict['fixes'] == {'max_duration': platform_rules.YOUTUBE_SHORTS_MAX_DURATION,
+                                'size': platform_rules.RECOMMENDED_RESOLUTION}
+    assert all(w.endswith('(a rendition will be uploaded)') for w in verdict['warnings'])
+
+
+def test_per_platform_setting_leaves_other_platforms_alone():
+    renditions = {'youtube': ['duration']}
+
+    verdict = evaluate('tiktok_english', video_info(duration=700.0), renditions)
+
+    assert not verdict['eligible']
+    assert verdict['fixes'] == {}
+
+
+@pytest.mark.parametrize('renditions, fields', [
+    (False, set()),
+    (True, {'duration'}),
+    ({'tiktok': ['resolution']}, {'resolution'}),
+    ({'youtube': ['duration']}, set()),
+])
+def test_rendition_fields(renditions, fields):
+    assert platform_rules.rendition_fields('tiktok_english', renditions) == fields
+
+
+def test_unknown_platform_is_ineligible():
+    verdict = evaluate('vimeo_english', video_info())
+
+    assert not verdict['eligible']
+    assert verdict['errors'] == ["Unknown platform type: vimeo"]
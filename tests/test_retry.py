@@ -0,0 +1,161 @@
+"""
+Tests for retry - error classification, backoff and circuit breaking
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from retry import (CircuitBreaker, RetryPolicy, classify_status, is_retryable, parse_retry_after,
+                   CLOSED, HALF_OPEN, OPEN, FATAL, RATE_LIMITED, SERVER_ERROR, TRANSIENT)
+
+
+@pytest.mark.parametrize('status, category', [
+    (429, RATE_LIMITED),
+    (408, TRANSIENT),
+    (500, SERVER_ERROR),
+    (503, SERVER_ERROR),
+    (400, FATAL),
+    (401, FATAL),
+    (403, FATAL),
+    (404, FATAL),
+])
+def test_classify_status(status, category):
+    assert classify_status(status) == category
+
+
+def test_only_fatal_is_not_retryable():
+    assert is_retryable(TRANSIENT)
+    assert is_retryable(RATE_LIMITED)
+    assert is_retryable(SERVER_ERROR)
+    assert not is_retryable(FATAL)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after('1.5') == 1.5
+    assert parse_retry_after('-5') == 0.0
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 80 <= delay <= 90
+
+
+def test_parse_retry_after_past_date_is_zero():
+    retry_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0.0
+
+
+@pytest.mark.parametrize('value', [None, '', 'soon'])
+def test_parse_retry_after_missing_or_invalid(value):
+    assert parse_retry_after(value) is None
+
+
+def test_should_retry_respects_budget_and_category():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry(SERVER_ERROR, 0)
+    assert policy.should_retry(SERVER_ERROR, 1)
+    assert not policy.should_retry(SERVER_ERROR, 2)
+    assert not policy.should_retry(FATAL, 0)
+
+
+def test_delay_is_bounded_full_jitter():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= min(4.0, 2 ** attempt)
+
+
+def test_delay_honours_retry_after_and_rate_limits():
+    policy = RetryPolicy(base_delay=1.0, max_delay=1.0, rate_limit_delay=30.0)
+    assert policy.delay(0, retry_after=10.0) >= 10.0
+    assert 30.0 <= policy.delay(0, RATE_LIMITED) <= 31.0
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(SERVER_ERROR)
+
+
+def test_breaker_opens_after_consecutive_outages(clock):
+    breaker = CircuitBreaker('YouTube', failure_threshold=3, cooldown=60, clock=clock)
+
+    breaker.record_failure(TRANSIENT)
+    breaker.record_failure(SERVER_ERROR)
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure(SERVER_ERROR)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in() == 60
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker('YouTube', failure_threshold=2, clock=clock)
+
+    breaker.record_failure(SERVER_ERROR)
+    breaker.record_success()
+    breaker.record_failure(SERVER_ERROR)
+
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.parametrize('category', [FATAL, RATE_LIMITED])
+def test_non_outage_failures_never_open_the_breaker(clock, category):
+    breaker = CircuitBreaker('TikTok', failure_threshold=2, clock=clock)
+
+    for _ in range(5):
+        breaker.record_failure(category)
+
+    assert breaker.state == CLOSED
+
+
+def test_cooldown_lets_exactly_one_probe_through(clock):
+    breaker = CircuitBreaker('YouTube', failure_threshold=2, cooldown=60, clock=clock)
+    open_breaker(breaker)
+
+    clock.advance(59)
+    assert not breaker.allow()
+
+    clock.advance(1)
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes_the_breaker(clock):
+    breaker = CircuitBreaker('YouTube', failure_threshold=2, cooldown=60, clock=clock)
+    open_breaker(breaker)
+    clock.advance(60)
+    breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_probe_reopens_for_another_cooldown(clock):
+    breaker = CircuitBreaker('YouTube', failure_threshold=2, cooldown=60, clock=clock)
+    open_breaker(breaker)
+    clock.advance(60)
+    breaker.allow()
+
+    breaker.record_failure(TRANSIENT)
+
+    assert breaker.state == OPEN
+    assert breaker.retry_in() == 60
+    assert not breaker.allow()
+
+
+def test_probe_answered_with_client_error_closes_the_breaker(clock):
+    breaker = CircuitBreaker('TikTok', failure_threshold=2, cooldown=60, clock=clock)
+    open_breaker(breaker)
+    clock.advance(60)
+    breaker.allow()
+
+    breaker.record_failure(FATAL)
+
+    assert breaker.state == CLOSED
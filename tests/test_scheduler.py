@@ -0,0 +1,222 @@
+"""
+Tests for scheduler - upload concurrency caps, byte budget and init rate limits
+"""
+
+import threading
+import time
+
+from scheduler import ByteBudget, RateLimiter, UploadScheduler
+
+
+class Tracker:
+    """Task recording how many tasks run at once, overall and per platform"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+        self.release = threading.Event()
+
+    def task(self, platform):
+        keys = ('all', platform.split('_')[0], platform)
+        with self.lock:
+            for key in keys:
+                self.running[key] = self.running.get(key, 0) + 1
+                self.peak[key] = max(self.peak.get(key, 0), self.running[key])
+
+        self.release.wait(5)
+
+        with self.lock:
+            for key in keys:
+                self.running[key] -= 1
+        return platform
+
+
+def run_all(scheduler, platforms):
+    tracker = Tracker()
+    futures = [scheduler.submit(platform, tracker.task, platform) for platform in platforms]
+    time.sleep(0.1)
+    tracker.release.set()
+    results = [future.result(timeout=5) for future in futures]
+    scheduler.shutdown()
+    return tracker.peak, results
+
+
+def test_every_task_runs_and_returns_its_result():
+    platforms = ['youtube_english', 'tiktok_english', 'tiktok_japanese']
+
+    peak, results = run_all(UploadScheduler(max_workers=4, account_limit=2), platforms)
+
+    assert results == platforms
+
+
+def test_max_workers_caps_all_tasks():
+    platforms = [f'tiktok_{i}' for i in range(6)]
+
+    peak, _ = run_all(UploadScheduler(max_workers=2, account_limit=5), platforms)
+
+    assert peak['all'] == 2
+
+
+def test_platform_limit_caps_one_platform_only():
+    platforms = ['youtube_a', 'youtube_b', 'youtube_c', 'tiktok_a', 'tiktok_b']
+
+    peak, _ = run_all(UploadScheduler(max_workers=5, platform_limits={'youtube': 1}), platforms)
+
+    assert peak['youtube'] == 1
+    assert peak['tiktok'] == 2
+
+
+def test_account_limit_caps_each_account():
+    platforms = ['tiktok_english'] * 3 + ['tiktok_japanese'] * 3
+
+    peak, _ = run_all(UploadScheduler(max_workers=8, account_limit=2), platforms)
+
+    assert peak['tiktok_english'] == 2
+    assert peak['tiktok_japanese'] == 2
+
+
+def test_account_limit_overrides_one_account():
+    platforms = ['tiktok_english'] * 3 + ['tiktok_japanese'] * 3
+    limits = {'default': 1, 'tiktok_english': 2}
+
+    peak, _ = run_all(UploadScheduler(max_workers=8, account_limit=limits), platforms)
+
+    assert peak['tiktok_english'] == 2
+    assert peak['tiktok_japanese'] == 1
+
+
+def test_failing_task_frees_its_slot():
+    scheduler = UploadScheduler(max_workers=1)
+
+    def fail():
+        raise RuntimeError('boom')
+
+    failed = scheduler.submit('youtube_english', fail)
+    after = scheduler.submit('youtube_english', lambda: 'ran')
+
+    assert isinstance(failed.exception(timeout=5), RuntimeError)
+    assert after.result(timeout=5) == 'ran'
+    scheduler.shutdown()
+
+
+def test_shutdown_waits_for_queued_tasks():
+    scheduler = UploadScheduler(max_workers=1)
+    done = []
+
+    for i in range(3):
+        scheduler.submit('youtube_english', lambda i=i: (time.sleep(0.02), done.append(i)))
+    scheduler.shutdown(wait=True)
+
+    assert done == [0, 1, 2]
+    assert scheduler.pending() == 0
+
+
+def test_from_config_reads_concurrency_block():
+    scheduler = UploadScheduler.from_config({
+        'concurrency': {'max_workers': 3, 'per_platform': {'tiktok': 2}, 'per_account': 2}
+    })
+
+    assert scheduler.max_workers == 3
+    assert scheduler.platform_limits == {'tiktok': 2}
+    assert scheduler.account_limit == 2
+    assert scheduler.byte_budget is None
+    assert scheduler.init_limiter('tiktok_english') is None
+    scheduler.shutdown()
+
+
+def test_from_config_builds_byte_budget_and_init_limiters():
+    scheduler = UploadScheduler.from_config({
+        'concurrency': {'max_bytes_in_flight_mb': 1.5, 'init_per_minute': {'tiktok': 6}}
+    })
+
+    assert scheduler.byte_budget.max_bytes == int(1.5 * 1024 * 1024)
+    limiter = scheduler.init_limiter('tiktok_english')
+    assert limiter.rate == 6 and limiter.period == 60.0
+    assert scheduler.init_limiter('tiktok_english') is limiter
+    assert scheduler.init_limiter('tiktok_japanese') is not limiter
+    assert scheduler.init_limiter('youtube_english') is None
+    scheduler.shutdown()
+
+
+def test_delayed_task_holds_no_slot_while_waiting():
+    scheduler = UploadScheduler(max_workers=1, account_limit=1)
+    order = []
+
+    later = scheduler.submit_later(0.2, 'tiktok_english', lambda: order.append('retry'))
+    now = scheduler.submit('tiktok_english', lambda: order.append('other'))
+
+    now.result(timeout=1)
+    assert order == ['other']
+
+    later.result(timeout=5)
+    assert order == ['other', 'retry']
+    scheduler.shutdown()
+
+
+def test_shutdown_waits_for_delayed_tasks():
+    scheduler = UploadScheduler(max_workers=1)
+    done = []
+
+    scheduler.submit_later(0.05, 'youtube_english', lambda: done.append('late'))
+    scheduler.shutdown(wait=True)
+
+    assert done == ['late']
+
+
+def test_delayed_task_is_cancelled_after_shutdown_without_wait():
+    scheduler = UploadScheduler(max_workers=1)
+
+    future = scheduler.submit_later(0.05, 'youtube_english', lambda: 'ran')
+    scheduler.shutdown(wait=False)
+
+    time.sleep(0.15)
+    assert future.cancelled()
+
+
+def test_byte_budget_blocks_until_bytes_are_released():
+    budget = ByteBudget(100)
+    first = budget.acquire(60)
+    acquired = threading.Event()
+
+    waiter = threading.Thread(target=lambda: (budget.acquire(60), acquired.set()))
+    waiter.start()
+
+    assert not acquired.wait(0.1)
+    budget.release(first)
+    assert acquired.wait(5)
+    waiter.join()
+    assert budget.in_flight == 60
+
+
+def test_byte_budget_lets_oversized_request_through_alone():
+    budget = ByteBudget(100)
+
+    reserved = budget.acquire(250)
+
+    assert reserved == 100
+    assert budget.in_flight == 100
+    budget.release(reserved)
+    assert budget.in_flight == 0
+
+
+def test_rate_limiter_waits_for_the_window_to_pass(clock):
+    limiter = RateLimiter(2, period=60.0, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire() == 0
+    clock.advance(10)
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 50
+    assert limiter.acquire() == 10
+    assert clock.sleeps == [50, 10]
+
+
+def test_rate_limiter_does_not_wait_after_a_quiet_period(clock):
+    limiter = RateLimiter(2, period=60.0, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire()
+    limiter.acquire()
+    clock.advance(61)
+
+    assert limiter.acquire() == 0
+    assert clock.sleeps == []
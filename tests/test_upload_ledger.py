@@ -0,0 +1,95 @@
+"""
+Tests for upload_ledger - upload records, in-flight owners and unhashed keys
+"""
+
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from upload_ledger import COMPLETED, IN_FLIGHT, UploadLedger, owner_alive, process_owner, unhashed_key
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return UploadLedger(tmp_path / 'ledger.db')
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / 'video.mp4'
+    path.write_bytes(b'\0' * 1000)
+    return str(path)
+
+
+def dead_owner():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return f"{socket.gethostname()}:{process.pid}"
+
+
+def test_in_flight_entry_records_this_process(ledger, video):
+    ledger.mark_in_flight('abc', 'tiktok_english', video)
+
+    entry = ledger.lookup('abc', 'tiktok_english')
+
+    assert entry['status'] == IN_FLIGHT
+    assert entry['owner'] == process_owner()
+    assert entry['file_size'] == 1000
+
+
+def test_in_flight_entry_takes_the_latest_owner(ledger, video):
+    ledger.mark_in_flight('abc', 'tiktok_english', video, owner='other-host:1')
+    ledger.mark_in_flight('abc', 'tiktok_english', video)
+
+    entry = ledger.lookup('abc', 'tiktok_english')
+
+    assert entry['owner'] == process_owner()
+    assert entry['attempts'] == 2
+
+
+def test_owner_alive():
+    assert owner_alive(process_owner())
+    assert not owner_alive(dead_owner())
+    assert not owner_alive(None)
+    # Processes on other hosts can't be checked
+    assert owner_alive('some-other-host:1')
+
+
+def test_unhashed_upload_moves_to_its_hash(ledger, video):
+    ledger.mark_in_flight(None, 'youtube_english', video)
+    assert ledger.lookup_unhashed(video, 'youtube_english')['status'] == IN_FLIGHT
+
+    ledger.mark_finished('abc', 'youtube_english', {'success': True, 'video_id': 'v1'}, video)
+
+    assert ledger.lookup_unhashed(video, 'youtube_english') is None
+    entry = ledger.lookup('abc', 'youtube_english')
+    assert entry['status'] == COMPLETED
+    assert entry['remote_id'] == 'v1'
+    assert ledger.has_size(1000, 'youtube_english')
+
+
+def test_unhashed_key_uses_real_path_and_size(video):
+    assert unhashed_key(video) == f"unhashed:1000:{os.path.realpath(video)}"
+
+
+def test_ledger_without_owner_column_is_migrated(tmp_path, video):
+    db_file = tmp_path / 'old.db'
+    conn = sqlite3.connect(str(db_file))
+    conn.execute(
+        "CREATE TABLE uploads (content_hash TEXT NOT NULL, target TEXT NOT NULL, status TEXT NOT NULL, "
+        "video_file TEXT, file_size INTEGER, remote_id TEXT, result TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+        "started_at REAL, updated_at REAL, PRIMARY KEY (content_hash, target))"
+    )
+    conn.execute("INSERT INTO uploads (content_hash, target, status) VALUES ('abc', 'tiktok_english', 'in_flight')")
+    conn.commit()
+    conn.close()
+
+    ledger = UploadLedger(db_file)
+
+    assert ledger.lookup('abc', 'tiktok_english')['owner'] is None
+    ledger.mark_in_flight('def', 'tiktok_english', video)
+    assert ledger.lookup('def', 'tiktok_english')['owner'] == process_owner()
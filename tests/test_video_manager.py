@@ -0,0 +1,67 @@
+"""
+Tests for video_manager - faststart copy cache
+"""
+
+import os
+
+import pytest
+
+from upload_journal import UploadJournal
+from video_manager import VideoManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return VideoManager(cache_file=None, faststart_dir=tmp_path / 'faststart', faststart_cache_bytes=250)
+
+
+def cached_copy(manager, name, size, used_at):
+    manager.faststart_dir.mkdir(parents=True, exist_ok=True)
+    path = manager.faststart_dir / name
+    path.write_bytes(b'\0' * size)
+    os.utime(path, ns=(used_at, path.stat().st_mtime_ns))
+    return path
+
+
+def test_released_copy_stays_cached_while_it_fits(manager):
+    copy = cached_copy(manager, 'a.mp4', 100, 1)
+    manager._use_faststart(copy)
+
+    manager.release_faststart(str(copy))
+
+    assert copy.exists()
+
+
+def test_trim_evicts_least_recently_used_first(manager):
+    old = cached_copy(manager, 'old.mp4', 100, 1)
+    middle = cached_copy(manager, 'middle.mp4', 100, 2)
+    new = cached_copy(manager, 'new.mp4', 100, 3)
+
+    manager.trim_faststart_cache()
+
+    assert not old.exists()
+    assert middle.exists() and new.exists()
+
+
+def test_trim_keeps_copies_in_use_or_resumable(manager):
+    in_use = cached_copy(manager, 'in_use.mp4', 100, 1)
+    resumable = cached_copy(manager, 'resumable.mp4', 100, 2)
+    evictable = cached_copy(manager, 'evictable.mp4', 100, 3)
+    manager._use_faststart(in_use)
+
+    manager.trim_faststart_cache(referenced={os.path.realpath(resumable)})
+
+    assert in_use.exists() and resumable.exists()
+    assert not evictable.exists()
+
+
+def test_journal_reports_the_files_it_can_resume(tmp_path):
+    video = tmp_path / 'video.mp4'
+    video.write_bytes(b'\0' * 10)
+    journal = UploadJournal(tmp_path / 'journal')
+
+    journal.start(str(video), 'english', 'publish-1', 'https://upload', 10, 1)
+    assert journal.referenced_files() == {os.path.realpath(video)}
+
+    journal.clear(str(video), 'english')
+    assert journal.referenced_files() == set()
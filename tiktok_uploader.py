@@ -4,33 +4,132 @@ Uses TikTok Content Posting API v2
 """
 
 import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
 import certifi
 
+from chunk_io import FileChunk, IntegrityRecorder, iter_chunk_ranges
+from chunk_planner import ChunkPlanner
+from status_poller import FINAL_STATES
+from retry import (RetryPolicy, classify_status, parse_retry_after,
+                   TRANSIENT, RATE_LIMITED, SERVER_ERROR, FATAL)
+from upload_journal import UploadJournal
+
+
+TIKTOK_API_HOST = 'open.tiktokapis.com'
+TIKTOK_UPLOAD_HOST = 'open-upload.tiktokapis.com'
+
+# Keep-alive sessions shared by every uploader talking to the same host,
+# with the pool size each one's adapter was mounted with
+_shared_sessions = {}
+_shared_sessions_lock = threading.Lock()
+
+# Hosts a session keeps connection pools for (API, upload and status hosts)
+POOL_HOSTS = 4
+
+
+def get_shared_session(host=TIKTOK_API_HOST, pool_size=10):
+    """
+    Get the process-wide pooled HTTP session for a host
+
+    Sessions keep TCP/TLS connections alive between calls, so the init
+    request, every chunk PUT and every status poll reuse warm connections.
+    A later call asking for a larger pool grows the session's pool.
+
+    Args:
+        host: Host name the session is shared for
+        pool_size: Maximum pooled connections per host (size for every
+                   upload that may run at once plus the status poller)
+
+    Returns:
+        requests.Session instance
+    """
+    with _shared_sessions_lock:
+        session, mounted_size = _shared_sessions.get(host, (None, 0))
+        if session is None:
+            session = requests.Session()
+
+        if pool_size > mounted_size:
+            # Connections of the replaced adapter finish their requests and are dropped
+            adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _shared_sessions[host] = (session, pool_size)
+
+        return session
+
 
 class TikTokUploader:
     """Handles uploading videos to TikTok"""
 
     # TikTok API endpoints
-    POST_VIDEO_INIT_URL = 'https://open.tiktokapis.com/v2/post/publish/video/init/'
-    POST_VIDEO_URL = 'https://open.tiktokapis.com/v2/post/publish/video/'
-    QUERY_VIDEO_STATUS_URL = 'https://open.tiktokapis.com/v2/post/publish/status/fetch/'
+    POST_VIDEO_INIT_URL = f'https://{TIKTOK_API_HOST}/v2/post/publish/video/init/'
+    POST_VIDEO_URL = f'https://{TIKTOK_API_HOST}/v2/post/publish/video/'
+    QUERY_VIDEO_STATUS_URL = f'https://{TIKTOK_API_HOST}/v2/post/publish/status/fetch/'
 
-    def __init__(self, access_token):
+    def __init__(self, access_token, session=None, account_name='default', journal=None,
+                 retry_policy=None, chunk_planner=None, status_poller=None, source_registry=None,
+                 byte_budget=None, init_limiter=None):
         """
         Initialize TikTok uploader with access token
 
         Args:
             access_token: TikTok OAuth access token
+            session: requests.Session to use (None = shared pooled session)
+            account_name: Account identifier used to key resumable uploads
+            journal: UploadJournal for resumable uploads (None = default journal)
+            retry_policy: RetryPolicy for init and chunk requests (None = defaults)
+            chunk_planner: ChunkPlanner choosing chunk sizes (None = default planner)
+            status_poller: StatusPoller to hand publish IDs to once bytes are sent
+                           (None = wait for the status in upload_video)
+            source_registry: SharedSourceRegistry so concurrent uploads of the
+                             same file read one shared mapping (None = open the file)
+            byte_budget: ByteBudget shared by every upload, held by each chunk
+                         while it is sent (None = unlimited)
+            init_limiter: RateLimiter for this account's init requests
+                          (None = unlimited)
         """
         self.access_token = access_token
+        self.session = session or get_shared_session()
+        self.account_name = account_name
+        self.journal = journal or UploadJournal()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.chunk_planner = chunk_planner or ChunkPlanner()
+        self.status_poller = status_poller
+        self.source_registry = source_registry
+        self.byte_budget = byte_budget
+        self.init_limiter = init_limiter
         self.headers = {
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json; charset=UTF-8'
         }
 
+    def warm_up(self, timeout=5):
+        """
+        Open pooled connections to the API and upload hosts ahead of an upload
+
+        The TLS handshakes then happen while the video is being validated
+        instead of in front of the init request and the first chunk.
+
+        Args:
+            timeout: Seconds to wait for each host
+
+        Returns:
+            List of hosts that answered
+        """
+        reached = []
+        for host in (TIKTOK_API_HOST, TIKTOK_UPLOAD_HOST):
+            try:
+                # Same verify setting as the upload requests, so they reuse this connection
+                self.session.head(f'https://{host}/', timeout=timeout, verify=False)
+                reached.append(host)
+            except requests.exceptions.RequestException:
+                pass
+        return reached
+
     def upload_video(self, video_file, title, description='', privacy_level='SELF_ONLY',
                      disable_duet=False, disable_comment=False, disable_stitch=False,
                      video_cover_timestamp_ms=1000):
@@ -49,7 +148,10 @@ class TikTokUploader:
             video_cover_timestamp_ms: Timestamp for video cover in milliseconds
 
         Returns:
-            Dictionary with publish_id and status on success
+            Dictionary with publish_id, status and integrity (file SHA-256
+            and per-chunk checksums) on success. With a status poller,
+            'status' is 'PROCESSING' and 'status_future' resolves to the
+            final status.
             None on failure
         """
         if not os.path.exists(video_file):
@@ -76,61 +178,115 @@ class TikTokUploader:
             video_size = os.path.getsize(video_file)
             print(f"Video size: {video_size} bytes ({video_size / (1024*1024):.2f} MB)")
 
-            # Step 2: Initialize upload (returns chunk info too)
-            init_result = self._initialize_upload(caption, privacy_level, disable_duet,
-                                                   disable_comment, disable_stitch,
-                                                   video_cover_timestamp_ms, video_size)
+            # Step 2: Resume an interrupted upload, or initialize a new one
+            session_info = self.journal.load(video_file, self.account_name)
+            resumed = session_info is not None
 
-            if not init_result or not init_result.get('response') or 'data' not in init_result['response']:
-                return {
-                    'success': False,
-                    'error': 'Failed to initialize TikTok upload',
-                    'platform': 'tiktok'
-                }
+            if resumed:
+                print(f"Resuming TikTok upload. Publish ID: {session_info['publish_id']} "
+                      f"({len(session_info['acknowledged'])}/{session_info['total_chunks']} chunks already acknowledged)")
+            else:
+                init_result = self._initialize_upload(caption, privacy_level, disable_duet,
+                                                       disable_comment, disable_stitch,
+                                                       video_cover_timestamp_ms, video_size)
+
+                if not init_result.get('response') or 'data' not in init_result['response']:
+                    return {
+                        'success': False,
+                        'error': 'Failed to initialize TikTok upload',
+                        'category': init_result.get('category', FATAL),
+                        'retried': init_result.get('retried', False),
+                        'platform': 'tiktok'
+                    }
+
+                init_response = init_result['response']
+                session_info = self.journal.start(
+                    video_file,
+                    self.account_name,
+                    publish_id=init_response['data']['publish_id'],
+                    upload_url=init_response['data']['upload_url'],
+                    chunk_size=init_result['chunk_size'],
+                    total_chunks=init_result['total_chunks']
+                )
 
-            init_response = init_result['response']
-            publish_id = init_response['data']['publish_id']
-            upload_url = init_response['data']['upload_url']
-            chunk_size = init_result['chunk_size']
-            total_chunks = init_result['total_chunks']
+                print(f"TikTok upload initialized. Publish ID: {session_info['publish_id']}")
 
-            print(f"TikTok upload initialized. Publish ID: {publish_id}")
+            publish_id = session_info['publish_id']
 
-            # Step 3: Upload video file in chunks
-            upload_success = self._upload_video_file(
+            # Step 3: Upload video file in chunks, checksumming the bytes as they are sent
+            recorder = IntegrityRecorder(video_size)
+            upload_failure = self._upload_video_file(
                 video_file,
-                upload_url,
-                chunk_size=chunk_size,
-                total_chunks=total_chunks
+                session_info['upload_url'],
+                chunk_size=session_info['chunk_size'],
+                total_chunks=session_info['total_chunks'],
+                acknowledged=session_info['acknowledged'],
+                recorder=recorder
             )
 
-            if not upload_success:
+            if upload_failure and resumed and self.journal.load(video_file, self.account_name) is None:
+                # The saved upload session was rejected, so start a fresh upload
+                print(f"⚠️  Saved TikTok upload session is no longer valid. Starting a new upload.")
+                return self.upload_video(video_file, title, description, privacy_level,
+                                         disable_duet, disable_comment, disable_stitch,
+                                         video_cover_timestamp_ms)
+
+            if upload_failure:
                 return {
                     'success': False,
                     'error': 'Failed to upload video file to TikTok',
+                    'category': upload_failure,
                     'platform': 'tiktok'
                 }
 
-            print(f"Video file uploaded successfully")
+            self.journal.clear(video_file, self.account_name)
+            integrity = recorder.finalize(video_file)
+            print(f"Video file uploaded successfully (SHA-256 {integrity['sha256'][:12]}...)")
+
+            # Step 4: Check status
+            if self.status_poller:
+                # Hand the publish ID to the background poller so this worker is free again
+                print(f"TikTok upload complete! Publish ID: {publish_id} (processing)")
+                return {
+                    'success': True,
+                    'publish_id': publish_id,
+                    'status': 'PROCESSING',
+                    'status_future': self.status_poller.track(publish_id, self._fetch_status),
+                    'integrity': integrity,
+                    'platform': 'tiktok'
+                }
 
-            # Step 3: Check status
             status = self._check_upload_status(publish_id)
 
+            if status == 'FAILED':
+                print(f"❌ TikTok failed to process the video (publish ID {publish_id})")
+                return {
+                    'success': False,
+                    'error': f"TikTok failed to process the video (publish ID {publish_id})",
+                    'publish_id': publish_id,
+                    'status': status,
+                    'integrity': integrity,
+                    'platform': 'tiktok'
+                }
+
             print(f"TikTok upload complete! Publish ID: {publish_id}")
 
             return {
                 'success': True,
                 'publish_id': publish_id,
                 'status': status,
+                'integrity': integrity,
                 'platform': 'tiktok'
             }
 
         except Exception as e:
             error_message = f"Error uploading to TikTok: {str(e)}"
             print(error_message)
+            network_error = isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
             return {
                 'success': False,
                 'error': error_message,
+                'category': TRANSIENT if network_error else FATAL,
                 'platform': 'tiktok'
             }
 
@@ -143,26 +299,12 @@ class TikTokUploader:
             video_size: Size of video file in bytes
 
         Returns:
-            Response JSON with publish_id and upload_url
+            Dictionary with the response JSON (publish_id and upload_url) and
+            the chunk plan; on failure 'response' is None, 'category' says
+            why and 'retried' whether the retry policy was already used up
         """
-        # TikTok chunking rules:
-        # - Videos < 5MB must upload as whole (chunk_size = video_size)
-        # - Chunk size must be 5-64 MB
-        # - total_chunk_count should be calculated using ceiling division
-
-        min_chunk_size = 5 * 1024 * 1024  # 5 MB minimum
-        max_chunk_size = 64 * 1024 * 1024  # 64 MB maximum
-
-        if video_size < min_chunk_size:
-            # Videos under 5MB upload as whole
-            chunk_size = video_size
-            total_chunk_count = 1
-        else:
-            # Use fixed 10 MB chunks
-            chunk_size = 10 * 1024 * 1024  # 10 MB
-            # Use floor division - TikTok expects this
-            # We'll upload remaining bytes in the last chunk
-            total_chunk_count = video_size // chunk_size
+        # Chunk size follows the throughput measured on earlier uploads
+        chunk_size, total_chunk_count = self.chunk_planner.plan(video_size, TIKTOK_UPLOAD_HOST)
 
         # Debug output
         print(f"\n=== TikTok Upload Initialization Debug ===")
@@ -192,20 +334,47 @@ class TikTokUploader:
         print(f"Request payload:")
         print(json.dumps(data, indent=2))
 
-        response = requests.post(
-            self.POST_VIDEO_INIT_URL,
-            headers=self.headers,
-            json=data,
-            verify=False
-        )
+        attempt = 0
+        while True:
+            if self.init_limiter and self.init_limiter.acquire() > 0:
+                print(f"Waited for TikTok init rate limit ({self.init_limiter.rate}/min)")
 
-        print(f"\nResponse status: {response.status_code}")
-        print(f"Response body: {response.text}\n")
+            try:
+                response = self.session.post(
+                    self.POST_VIDEO_INIT_URL,
+                    headers=self.headers,
+                    json=data,
+                    verify=False
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not self.retry_policy.should_retry(TRANSIENT, attempt):
+                    print(f"❌ Network error during TikTok init: {e}")
+                    return {'response': None, 'category': TRANSIENT, 'retried': attempt > 0}
+                delay = self.retry_policy.delay(attempt, TRANSIENT)
+                print(f"⚠️  Network error during TikTok init: {e}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            print(f"\nResponse status: {response.status_code}")
+            print(f"Response body: {response.text}\n")
+
+            category = classify_status(response.status_code) if response.status_code != 200 else None
+            if category in [RATE_LIMITED, SERVER_ERROR] and self.retry_policy.should_retry(category, attempt):
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                delay = self.retry_policy.delay(attempt, category, retry_after)
+                print(f"⚠️  TikTok init returned HTTP {response.status_code}. "
+                      f"Retrying in {delay:.0f}s (attempt {attempt + 1}/{self.retry_policy.max_retries})...")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            break
 
         if response.status_code == 429:
-            print(f"⚠️  Rate limit exceeded. TikTok requires waiting before next attempt.")
+            print(f"⚠️  Rate limit exceeded after {self.retry_policy.max_retries} retries.")
             print(f"   Suggested: Wait 5-10 minutes before retrying.")
-            return None
+            return {'response': None, 'category': RATE_LIMITED, 'retried': attempt > 0}
         elif response.status_code == 403:
             error_data = response.json().get('error', {})
             error_code = error_data.get('code', '')
@@ -225,10 +394,10 @@ class TikTokUploader:
                 print(f"   Note: After TikTok approves your app, you can make your account public again.")
             else:
                 print(f"TikTok init error: {response.status_code} - {response.text}")
-            return None
+            return {'response': None, 'category': FATAL}
         elif response.status_code != 200:
             print(f"TikTok init error: {response.status_code} - {response.text}")
-            return None
+            return {'response': None, 'category': category, 'retried': attempt > 0}
 
         return {
             'response': response.json(),
@@ -236,124 +405,208 @@ class TikTokUploader:
             'total_chunks': total_chunk_count
         }
 
-    def _upload_video_file(self, video_file, upload_url, chunk_size=10485760, total_chunks=11):
+    def _upload_video_file(self, video_file, upload_url, chunk_size=10485760, total_chunks=11,
+                           acknowledged=None, recorder=None):
         """
         Upload video file to TikTok in chunks
 
+        Each acknowledged chunk is recorded in the upload journal so an
+        interrupted upload can continue from the first missing chunk.
+
         Args:
             video_file: Path to video file
             upload_url: Upload URL from initialization step
             chunk_size: Size of each chunk in bytes
             total_chunks: Total number of chunks
+            acknowledged: List of [start, end] byte ranges already accepted by TikTok
+            recorder: Optional IntegrityRecorder fed with the bytes being sent
 
         Returns:
-            True on success, False on failure
+            None on success, otherwise the failure category
         """
-        try:
-            # Read entire video file
-            with open(video_file, 'rb') as f:
-                video_data = f.read()
-
-            video_size = len(video_data)
-            print(f"Uploading {video_size:,} bytes in {total_chunks} chunks...")
+        acknowledged = acknowledged or []
+        bytes_sent = 0
+        send_seconds = 0.0
 
-            # Upload file in chunks
-            for chunk_index in range(total_chunks):
-                start_byte = chunk_index * chunk_size
+        try:
+            # Stream each chunk straight from disk so memory stays bounded
+            # to one read buffer per in-flight upload, whatever the file size
+            with self._open_source(video_file) as f:
+                video_size = os.fstat(f.fileno()).st_size
+                print(f"Uploading {video_size:,} bytes in {total_chunks} chunks...")
+
+                for chunk_index, start_byte, end_byte in iter_chunk_ranges(video_size, chunk_size, total_chunks):
+                    if [start_byte, end_byte] in acknowledged:
+                        print(f"  Chunk {chunk_index + 1}/{total_chunks}: already uploaded, skipping")
+                        continue
+
+                    print(f"  Chunk {chunk_index + 1}/{total_chunks}: "
+                          f"bytes {start_byte}-{end_byte - 1}/{video_size} ({end_byte - start_byte} bytes)")
+
+                    category, put_seconds = self._put_chunk(f, upload_url, start_byte, end_byte,
+                                                            video_size, recorder)
+
+                    if category is not None:
+                        print(f"❌ Chunk {chunk_index + 1} upload failed ({category})")
+                        if category == FATAL:
+                            # The upload URL was rejected; it can't be resumed
+                            self.journal.clear(video_file, self.account_name)
+                        return category
+
+                    bytes_sent += end_byte - start_byte
+                    send_seconds += put_seconds
+                    self.journal.acknowledge(video_file, self.account_name, start_byte, end_byte)
+                    print(f"    ✓ Uploaded successfully")
+
+            # Remember link speed so the next upload plans its chunks from it. The
+            # plan is made before init returns the upload URL, so the estimate is
+            # kept under the same fixed host name the planner reads
+            self.chunk_planner.throughput_store.record(TIKTOK_UPLOAD_HOST, bytes_sent, send_seconds)
+            if send_seconds > 0:
+                print(f"✓ All chunks uploaded successfully ({bytes_sent / send_seconds / (1024*1024):.2f} MB/s)")
+            else:
+                print(f"✓ All chunks uploaded successfully")
+            return None
 
-                # For the last declared chunk, include ALL remaining bytes
-                if chunk_index == total_chunks - 1:
-                    # This is the last chunk TikTok expects - send everything remaining
-                    end_byte = video_size
-                else:
-                    end_byte = min(start_byte + chunk_size, video_size)
+        except Exception as e:
+            print(f"❌ Error uploading file to TikTok: {e}")
+            import traceback
+            traceback.print_exc()
+            return FATAL
 
-                chunk_data = video_data[start_byte:end_byte]
+    def _open_source(self, video_file):
+        """Open the file chunks are read from (shared mapping when available)"""
+        if self.source_registry:
+            return self.source_registry.open(video_file)
+        return open(video_file, 'rb')
 
-                # Actual end byte is start + length of chunk data - 1 (for 0-indexed)
-                actual_end_byte = start_byte + len(chunk_data) - 1
+    def _put_chunk(self, f, upload_url, start_byte, end_byte, video_size, recorder=None):
+        """
+        Upload one chunk, retrying only this Content-Range on transient failures
 
-                # Content-Range header: bytes start-end/total
-                content_range = f"bytes {start_byte}-{actual_end_byte}/{video_size}"
+        Args:
+            f: Open video file or SharedMappedSource
+            upload_url: Upload URL from initialization step
+            start_byte: First byte of the chunk
+            end_byte: End of the chunk (exclusive)
+            video_size: Total file size in bytes
+            recorder: Optional IntegrityRecorder fed with the bytes being sent
 
-                headers = {
-                    'Content-Type': 'video/mp4',
-                    'Content-Length': str(len(chunk_data)),
-                    'Content-Range': content_range
-                }
+        Returns:
+            Tuple of (failure category of the last attempt or None on success,
+            seconds the successful PUT took; retry backoff is not counted)
+        """
+        # Content-Range header: bytes start-end/total (end is inclusive)
+        headers = {
+            'Content-Type': 'video/mp4',
+            'Content-Length': str(end_byte - start_byte),
+            'Content-Range': f"bytes {start_byte}-{end_byte - 1}/{video_size}"
+        }
 
-                print(f"  Chunk {chunk_index + 1}/{total_chunks}: {content_range} ({len(chunk_data)} bytes)")
+        attempt = 0
+        while True:
+            retry_after = None
 
-                response = requests.put(
+            chunk = FileChunk(f, start_byte, end_byte - start_byte, recorder, budget=self.byte_budget)
+            try:
+                # Wait for the byte budget before the clock starts, so the
+                # throughput estimate only counts time spent sending
+                chunk.reserve()
+                put_started = time.monotonic()
+                response = self.session.put(
                     upload_url,
-                    data=chunk_data,
+                    data=chunk,
                     headers=headers,
                     verify=False,
                     timeout=60
                 )
-
-                # Check response for each chunk
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                category = TRANSIENT
+                print(f"    Network error: {e}")
+            else:
                 # 200 = OK, 201 = Created, 204 = No Content, 206 = Partial Content (chunked upload success)
-                if response.status_code not in [200, 201, 204, 206]:
-                    print(f"❌ Chunk {chunk_index + 1} upload failed: HTTP {response.status_code}")
-                    if response.text and response.text != 'null':
-                        print(f"   Response: {response.text}")
-                    return False
+                if response.status_code in [200, 201, 204, 206]:
+                    return None, time.monotonic() - put_started
 
-                print(f"    ✓ Uploaded successfully")
+                category = classify_status(response.status_code)
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                print(f"    HTTP {response.status_code}")
+                if response.text and response.text != 'null':
+                    print(f"    Response: {response.text}")
+            finally:
+                chunk.close()
 
-            print(f"✓ All chunks uploaded successfully")
-            return True
+            if not self.retry_policy.should_retry(category, attempt):
+                return category, 0.0
 
-        except Exception as e:
-            print(f"❌ Error uploading file to TikTok: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+            delay = self.retry_policy.delay(attempt, category, retry_after)
+            attempt += 1
+            print(f"    Retrying chunk in {delay:.1f}s (attempt {attempt}/{self.retry_policy.max_retries})...")
+            time.sleep(delay)
 
     def _check_upload_status(self, publish_id, max_wait=60):
         """
-        Check the status of a TikTok video upload
+        Check the status of a TikTok video upload (blocking)
+
+        Only used when no status poller is configured.
 
         Args:
             publish_id: The publish ID from initialization
             max_wait: Maximum seconds to wait for processing
 
         Returns:
-            Status string
+            Status string (last observed status if max_wait elapses)
         """
-        data = {
-            'publish_id': publish_id
-        }
-
         start_time = time.time()
+        last_status = None
 
         while time.time() - start_time < max_wait:
             try:
-                response = requests.post(
-                    self.QUERY_VIDEO_STATUS_URL,
-                    headers=self.headers,
-                    json=data,
-                    verify=False
-                )
+                status = self._fetch_status(publish_id)
+            except requests.exceptions.RequestException as e:
+                # Every byte was sent; a failed poll must not fail the upload
+                print(f"Error checking status: {e}")
+                status = None
 
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'data' in result:
-                        status = result['data'].get('status', 'UNKNOWN')
-                        print(f"Upload status: {status}")
+            if status:
+                last_status = status
+                print(f"Upload status: {status}")
 
-                        if status in ['PUBLISH_COMPLETE', 'PROCESSING_DOWNLOAD']:
-                            return status
+                if status in FINAL_STATES:
+                    return status
 
-                # Wait before checking again
-                time.sleep(5)
+            # Wait before checking again
+            time.sleep(5)
 
-            except Exception as e:
-                print(f"Error checking status: {e}")
-                break
+        return last_status or 'TIMEOUT'
+
+    def _fetch_status(self, publish_id):
+        """
+        Fetch the current publish status once
+
+        Args:
+            publish_id: The publish ID from initialization
+
+        Returns:
+            Status string, or None if the status could not be read
+        """
+        response = self.session.post(
+            self.QUERY_VIDEO_STATUS_URL,
+            headers=self.headers,
+            json={'publish_id': publish_id},
+            verify=False,
+            timeout=30
+        )
+
+        if response.status_code != 200:
+            print(f"Error checking status: {response.status_code} - {response.text}")
+            return None
+
+        result = response.json()
+        if 'data' not in result:
+            return None
 
-        return 'TIMEOUT'
+        return result['data'].get('status', 'UNKNOWN')
 
     def get_video_info(self, publish_id):
         """
@@ -370,7 +623,7 @@ class TikTokUploader:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.QUERY_VIDEO_STATUS_URL,
                 headers=self.headers,
                 json=data,
@@ -0,0 +1,230 @@
+"""
+Upload Daemon - Resident worker running jobs from the durable job queue
+Keeps one orchestrator (credentials, sessions, caches) warm across jobs
+"""
+
+import os
+import signal
+import socket
+import threading
+import time
+from pathlib import Path
+
+from job_queue import JobQueue
+from upload_ledger import process_owner
+
+
+DEFAULT_SOCKET_FILE = 'state/upload_daemon.sock'
+
+
+def notify_daemon(socket_file=DEFAULT_SOCKET_FILE):
+    """
+    Wake a running daemon so it claims new jobs right away
+
+    Best effort: without a daemon listening, the job simply waits in the
+    queue until one starts.
+
+    Args:
+        socket_file: Path of the daemon's wake-up socket
+
+    Returns:
+        True if a daemon was notified
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_file):
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b'wake', socket_file)
+        return True
+    except OSError:
+        return False
+
+
+class UploadDaemon:
+    """Claims queued upload jobs and runs them on one long-lived orchestrator"""
+
+    def __init__(self, orchestrator, queue=None, max_jobs=2, lease_seconds=300,
+                 poll_interval=5.0, socket_file=DEFAULT_SOCKET_FILE):
+        """
+        Initialize upload daemon
+
+        Args:
+            orchestrator: UploadOrchestrator shared by every job
+            queue: JobQueue to run (None = default database)
+            max_jobs: Maximum jobs running at once (their uploads share the
+                      orchestrator's concurrency caps)
+            lease_seconds: Job lease length, renewed while the job runs
+            poll_interval: Seconds between queue checks when not woken up
+            socket_file: Path of the wake-up socket producers notify
+        """
+        self.orchestrator = orchestrator
+        self.queue = queue or JobQueue()
+        self.max_jobs = max_jobs
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.socket_file = socket_file
+        # Same identifier the upload ledger records with in-flight uploads
+        self.owner = process_owner()
+        self._running = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._socket = None
+
+    def serve(self):
+        """Run jobs until SIGINT/SIGTERM, then finish the running ones"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._on_signal)
+            signal.signal(signal.SIGTERM, self._on_signal)
+
+        self._open_socket()
+        threading.Thread(target=self._heartbeat, name='job-heartbeat', daemon=True).start()
+
+        print(f"✓ Upload daemon {self.owner} running ({self.max_jobs} jobs at once)")
+        counts = self.queue.counts()
+        if counts:
+            print(f"  Queue: {', '.join(f'{n} {status}' for status, n in sorted(counts.items()))}")
+
+        try:
+            while not self._stopping.is_set():
+                self._claim_jobs()
+
+                timeout = self.poll_interval
+                next_available = self.queue.next_available()
+                if next_available is not None:
+                    timeout = min(timeout, next_available)
+
+                self._wake.wait(timeout)
+                self._wake.clear()
+        finally:
+            self._drain()
+            self._close_socket()
+
+        print("✓ Upload daemon stopped")
+
+    def stop(self):
+        """Stop claiming jobs; serve() returns once running jobs finish"""
+        self._stopping.set()
+        self._wake.set()
+
+    def _on_signal(self, signum, frame):
+        """Handle SIGINT/SIGTERM"""
+        print(f"\nStopping after {len(self._running)} running job(s) finish...")
+        self.stop()
+
+    def _claim_jobs(self):
+        """Start queued jobs while there are free slots"""
+        while not self._stopping.is_set():
+            with self._lock:
+                if len(self._running) >= self.max_jobs:
+                    return
+
+            job = self.queue.claim(self.owner, self.lease_seconds)
+            if job is None:
+                return
+
+            thread = threading.Thread(target=self._run_job, args=(job,), name=f"job-{job['id']}")
+            with self._lock:
+                self._running[job['id']] = thread
+            thread.start()
+
+    def _run_job(self, job):
+        """
+        Run one job and record its outcome
+
+        Args:
+            job: Job dictionary from JobQueue.claim
+        """
+        print(f"\n▶ Job {job['id']} (attempt {job['attempts']}/{job['max_attempts']}): {job['metadata_file']}")
+        started = time.monotonic()
+
+        # Taken over from a worker whose lease expired: its uploads are dead too
+        resume_owner = job.get('expired_owner')
+        if resume_owner == self.owner:
+            resume_owner = None
+
+        try:
+            results = self.orchestrator.upload_from_metadata(
+                job['metadata_file'],
+                platforms=job['platforms'],
+                max_retries=job['max_retries'],
+                force=job['force'],
+                resume_owner=resume_owner
+            )
+            status = self.queue.complete(job['id'], self.owner, results)
+        except (FileNotFoundError, ValueError) as e:
+            # Missing or malformed metadata: another attempt can't succeed
+            status = self.queue.fail(job['id'], self.owner, str(e), retry=False)
+        except Exception as e:
+            status = self.queue.fail(job['id'], self.owner, f"Unexpected error: {e}")
+        finally:
+            with self._lock:
+                self._running.pop(job['id'], None)
+            self._wake.set()
+
+        elapsed = time.monotonic() - started
+        if status is None:
+            print(f"⚠️  Job {job['id']} lost its lease; its outcome was not recorded")
+        else:
+            icon = "✓" if status == 'done' else "❌"
+            print(f"{icon} Job {job['id']}: {status} ({elapsed:.1f}s)")
+
+    def _heartbeat(self):
+        """Renew the leases of running jobs until the daemon stops"""
+        interval = max(self.lease_seconds / 3, 1)
+
+        while not self._stopping.wait(interval):
+            with self._lock:
+                job_ids = list(self._running)
+
+            for job_id in job_ids:
+                if not self.queue.heartbeat(job_id, self.owner, self.lease_seconds):
+                    print(f"⚠️  Job {job_id}: lease lost")
+
+    def _drain(self):
+        """Wait for running jobs, still renewing their leases"""
+        with self._lock:
+            threads = list(self._running.values())
+
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(self.lease_seconds / 3)
+                with self._lock:
+                    job_ids = list(self._running)
+                for job_id in job_ids:
+                    self.queue.heartbeat(job_id, self.owner, self.lease_seconds)
+
+    def _open_socket(self):
+        """Listen for wake-ups from producers (Unix socket, where available)"""
+        if not hasattr(socket, 'AF_UNIX'):
+            return
+
+        Path(self.socket_file).parent.mkdir(parents=True, exist_ok=True)
+        if os.path.exists(self.socket_file):
+            os.unlink(self.socket_file)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(self.socket_file)
+        threading.Thread(target=self._listen, args=(self._socket,), name='job-wakeup', daemon=True).start()
+
+    def _listen(self, sock):
+        """Turn socket messages into wake-ups"""
+        while True:
+            try:
+                sock.recv(64)
+            except OSError:
+                return
+            self._wake.set()
+
+    def _close_socket(self):
+        """Stop listening and remove the socket file"""
+        if self._socket is None:
+            return
+
+        self._socket.close()
+        self._socket = None
+        try:
+            os.unlink(self.socket_file)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,285 @@
+"""
+Upload Journal - Persists chunked upload progress to disk
+Lets interrupted TikTok and YouTube uploads continue where they stopped
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+def _file_identity(video_file):
+    """Identity of a file's current contents (path, size, mtime)"""
+    stat = os.stat(video_file)
+    return {
+        'path': os.path.realpath(video_file),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+
+
+def _entry_path(state_dir, video_file, account):
+    """State file path for a (file, account) pair"""
+    key = f"{os.path.realpath(video_file)}|{account}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return Path(state_dir) / f"{digest}.json"
+
+
+def _write_json(path, entry):
+    """Atomically write a JSON state file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    """Read a JSON state file, discarding it if unreadable"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable upload state {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _referenced_files(state_dir, max_age):
+    """Real paths of the files that unexpired state entries point at"""
+    files = set()
+    now = time.time()
+
+    for path in Path(state_dir).glob('*.json'):
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if now - entry.get('created_at', 0) <= max_age and entry.get('file'):
+            files.add(entry['file']['path'])
+
+    return files
+
+
+class UploadJournal:
+    """Records acknowledged byte ranges for in-progress chunked uploads"""
+
+    # TikTok upload URLs are valid for one hour after initialization;
+    # stop resuming a little before that so the last chunks don't race expiry
+    DEFAULT_MAX_AGE = 55 * 60
+
+    def __init__(self, journal_dir='cache/tiktok_journal', max_age=DEFAULT_MAX_AGE):
+        """
+        Initialize upload journal
+
+        Args:
+            journal_dir: Directory holding one JSON file per in-progress upload
+            max_age: Seconds after which an upload session is no longer resumed
+        """
+        self.journal_dir = Path(journal_dir)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def load(self, video_file, account):
+        """
+        Load a resumable upload for a file and account
+
+        Stale entries (expired upload URL or modified file) are discarded.
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier (e.g., 'english')
+
+        Returns:
+            Journal entry dictionary, or None if there is nothing to resume
+        """
+        path = _entry_path(self.journal_dir, video_file, account)
+
+        with self._lock:
+            if not path.exists():
+                return None
+
+            entry = _read_json(path)
+            if entry is None:
+                return None
+
+            expired = time.time() - entry.get('created_at', 0) > self.max_age
+            changed = entry.get('file') != _file_identity(video_file)
+
+            if expired or changed:
+                path.unlink(missing_ok=True)
+                return None
+
+            return entry
+
+    def start(self, video_file, account, publish_id, upload_url, chunk_size, total_chunks):
+        """
+        Record a newly initialized upload
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier
+            publish_id: Publish ID returned by the init call
+            upload_url: Upload URL returned by the init call
+            chunk_size: Declared chunk size in bytes
+            total_chunks: Declared number of chunks
+
+        Returns:
+            The new journal entry
+        """
+        entry = {
+            'file': _file_identity(video_file),
+            'account': account,
+            'publish_id': publish_id,
+            'upload_url': upload_url,
+            'chunk_size': chunk_size,
+            'total_chunks': total_chunks,
+            'acknowledged': [],
+            'created_at': time.time()
+        }
+
+        with self._lock:
+            _write_json(_entry_path(self.journal_dir, video_file, account), entry)
+
+        return entry
+
+    def acknowledge(self, video_file, account, start_byte, end_byte):
+        """
+        Record that the server acknowledged a byte range
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier
+            start_byte: First byte of the range
+            end_byte: End of the range (exclusive)
+        """
+        path = _entry_path(self.journal_dir, video_file, account)
+
+        with self._lock:
+            if not path.exists():
+                return
+
+            entry = _read_json(path)
+            if entry is not None and [start_byte, end_byte] not in entry['acknowledged']:
+                entry['acknowledged'].append([start_byte, end_byte])
+                _write_json(path, entry)
+
+    def clear(self, video_file, account):
+        """
+        Forget an upload (finished, or its session can no longer be used)
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier
+        """
+        with self._lock:
+            _entry_path(self.journal_dir, video_file, account).unlink(missing_ok=True)
+
+    def referenced_files(self):
+        """
+        Files that have an upload which can still be resumed
+
+        Returns:
+            Set of real paths
+        """
+        with self._lock:
+            return _referenced_files(self.journal_dir, self.max_age)
+
+
+class ResumableSessionStore:
+    """Records YouTube resumable upload session URIs and confirmed offsets"""
+
+    # YouTube resumable session URIs stay valid for about a week
+    DEFAULT_MAX_AGE = 6 * 24 * 3600
+
+    def __init__(self, store_dir='cache/youtube_sessions', max_age=DEFAULT_MAX_AGE):
+        """
+        Initialize session store
+
+        Args:
+            store_dir: Directory holding one JSON file per in-progress upload
+            max_age: Seconds after which a session URI is no longer resumed
+        """
+        self.store_dir = Path(store_dir)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def load(self, video_file, account):
+        """
+        Load the resumable session for a file and account
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier (e.g., 'english')
+
+        Returns:
+            Dictionary with 'session_uri' and 'offset', or None
+        """
+        path = _entry_path(self.store_dir, video_file, account)
+
+        with self._lock:
+            if not path.exists():
+                return None
+
+            entry = _read_json(path)
+            if entry is None:
+                return None
+
+            expired = time.time() - entry.get('created_at', 0) > self.max_age
+            changed = entry.get('file') != _file_identity(video_file)
+
+            if expired or changed:
+                path.unlink(missing_ok=True)
+                return None
+
+            return entry
+
+    def save(self, video_file, account, session_uri, offset):
+        """
+        Record the session URI and the offset the server has confirmed
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier
+            session_uri: Resumable upload session URI
+            offset: Number of bytes committed by the server
+        """
+        path = _entry_path(self.store_dir, video_file, account)
+
+        with self._lock:
+            entry = _read_json(path) if path.exists() else None
+            if not entry or entry.get('session_uri') != session_uri:
+                entry = {
+                    'file': _file_identity(video_file),
+                    'account': account,
+                    'session_uri': session_uri,
+                    'created_at': time.time()
+                }
+
+            entry['offset'] = offset
+            _write_json(path, entry)
+
+    def clear(self, video_file, account):
+        """
+        Forget a session (upload finished or session expired)
+
+        Args:
+            video_file: Path to video file
+            account: Account identifier
+        """
+        with self._lock:
+            _entry_path(self.store_dir, video_file, account).unlink(missing_ok=True)
+
+    def referenced_files(self):
+        """
+        Files that have a session which can still be resumed
+
+        Returns:
+            Set of real paths
+        """
+        with self._lock:
+            return _referenced_files(self.store_dir, self.max_age)
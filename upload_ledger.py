@@ -0,0 +1,344 @@
+"""
+Upload Ledger - Records which videos were posted to which accounts
+Keyed by content hash so a retried run never posts the same video twice
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Upload states
+IN_FLIGHT = 'in_flight'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+# Key prefix of uploads whose hash is only known once they finish
+UNHASHED_PREFIX = 'unhashed:'
+
+
+def hash_file(video_file, chunk_size=HASH_CHUNK_SIZE):
+    """
+    Compute the SHA-256 of a file without loading it into memory
+
+    Args:
+        video_file: Path to file
+        chunk_size: Bytes read per step
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(video_file, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def process_owner():
+    """
+    Identifier of this process, stored with the uploads it starts
+
+    Returns:
+        String of the form 'hostname:pid'
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def owner_alive(owner):
+    """
+    Check whether the process that started an upload may still be running
+
+    Only processes on this host can be checked; an owner on another host
+    is assumed to be alive.
+
+    Args:
+        owner: Identifier from process_owner(), or None for entries
+               recorded before owners were tracked
+
+    Returns:
+        False if the owner is known to be gone
+    """
+    if not owner:
+        return False
+
+    host, _, pid = owner.rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def unhashed_key(video_file):
+    """
+    Stand-in ledger key for a file whose hash isn't known yet
+
+    Args:
+        video_file: Path to video file
+
+    Returns:
+        Key made of the file's real path and size
+    """
+    path = os.path.realpath(video_file)
+    return f"{UNHASHED_PREFIX}{os.path.getsize(path)}:{path}"
+
+
+class UploadLedger:
+    """SQLite ledger of uploads keyed by (content hash, target platform account)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS uploads (
+            content_hash TEXT NOT NULL,
+            target TEXT NOT NULL,
+            status TEXT NOT NULL,
+            video_file TEXT,
+            file_size INTEGER,
+            remote_id TEXT,
+            result TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            owner TEXT,
+            started_at REAL,
+            updated_at REAL,
+            PRIMARY KEY (content_hash, target)
+        );
+        CREATE TABLE IF NOT EXISTS file_hashes (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            content_hash TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_file='state/upload_ledger.db'):
+        """
+        Initialize upload ledger
+
+        Args:
+            db_file: Path of the SQLite database
+        """
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(uploads)")}
+            if 'owner' not in columns:
+                # Ledgers created before in-flight owners were recorded
+                conn.execute("ALTER TABLE uploads ADD COLUMN owner TEXT")
+
+    def _connect(self):
+        """Open a connection (one per operation, so threads never share one)"""
+        conn = sqlite3.connect(str(self.db_file), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return closing(conn)
+
+    def known_hash(self, video_file):
+        """
+        Get the stored content hash of a file without reading the file
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Hex SHA-256 digest, or None if the file's current contents were
+            never hashed
+        """
+        path = os.path.realpath(video_file)
+        stat = os.stat(path)
+
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, inode, content_hash FROM file_hashes WHERE path = ?",
+                (path,)
+            ).fetchone()
+
+        if row and (row['size'], row['mtime_ns'], row['inode']) == (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+            return row['content_hash']
+
+        return None
+
+    def content_hash(self, video_file):
+        """
+        Get the content hash of a file, reusing the stored hash while the
+        file's size, mtime and inode are unchanged
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        content_hash = self.known_hash(video_file)
+        if content_hash:
+            return content_hash
+
+        print(f"Hashing {video_file}...")
+        content_hash = hash_file(os.path.realpath(video_file))
+        self.remember_hash(video_file, content_hash)
+        return content_hash
+
+    def remember_hash(self, video_file, content_hash):
+        """
+        Store the content hash of a file's current contents
+
+        Args:
+            video_file: Path to video file
+            content_hash: Hex SHA-256 digest of the file
+        """
+        path = os.path.realpath(video_file)
+        stat = os.stat(path)
+
+        with self._lock, self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, inode, content_hash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, stat.st_ino, content_hash)
+            )
+
+    def lookup(self, content_hash, target):
+        """
+        Get the ledger entry for a video and target
+
+        Args:
+            content_hash: Hex SHA-256 digest of the video
+            target: Platform account identifier (e.g., 'tiktok_japanese')
+
+        Returns:
+            Dictionary with the entry (result decoded), or None
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM uploads WHERE content_hash = ? AND target = ?",
+                (content_hash, target)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        entry = dict(row)
+        entry['result'] = json.loads(entry['result']) if entry['result'] else None
+        return entry
+
+    def lookup_unhashed(self, video_file, target):
+        """
+        Get the entry of an upload started before the file's hash was known
+
+        Args:
+            video_file: Path to video file
+            target: Platform account identifier
+
+        Returns:
+            Dictionary with the entry (result decoded), or None
+        """
+        return self.lookup(unhashed_key(video_file), target)
+
+    def mark_in_flight(self, content_hash, target, video_file, owner=None):
+        """
+        Record that an upload is starting
+
+        Args:
+            content_hash: Hex SHA-256 digest of the video, or None if it is
+                          taken from the upload itself (the entry is then
+                          keyed by the file's path and size until it finishes)
+            target: Platform account identifier
+            video_file: Path of the file being uploaded
+            owner: Process running the upload (None = this process)
+        """
+        content_hash = content_hash or unhashed_key(video_file)
+        owner = owner or process_owner()
+        now = time.time()
+
+        with self._lock, self._connect() as conn, conn:
+            conn.execute(
+                "INSERT INTO uploads (content_hash, target, status, video_file, file_size, attempts, owner, "
+                "started_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?) "
+                "ON CONFLICT (content_hash, target) DO UPDATE SET "
+                "status = excluded.status, video_file = excluded.video_file, file_size = excluded.file_size, "
+                "attempts = attempts + 1, owner = excluded.owner, updated_at = excluded.updated_at",
+                (content_hash, target, IN_FLIGHT, video_file, os.path.getsize(video_file), owner, now, now)
+            )
+
+    def has_size(self, file_size, target):
+        """
+        Check whether any recorded upload to a target has a given file size
+
+        Files of a size never seen for a target can't be duplicates, so
+        their hash can be taken from the upload itself instead of a
+        separate read.
+
+        Args:
+            file_size: File size in bytes
+            target: Platform account identifier
+
+        Returns:
+            True if an entry with that size exists
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM uploads WHERE target = ? AND file_size = ? LIMIT 1",
+                (target, file_size)
+            ).fetchone()
+
+        return row is not None
+
+    def mark_finished(self, content_hash, target, result, video_file=None):
+        """
+        Record the outcome of an upload
+
+        An upload marked in flight before its hash was known moves from its
+        path-and-size key to the hash.
+
+        Args:
+            content_hash: Hex SHA-256 digest of the video, or None if the
+                          upload never produced one
+            target: Platform account identifier
+            result: Upload result dictionary from the uploader
+            video_file: Path of the uploaded file
+        """
+        status = COMPLETED if result.get('success') else FAILED
+        remote_id = result.get('video_id') or result.get('publish_id')
+        file_size = os.path.getsize(video_file) if video_file else None
+        pending_key = unhashed_key(video_file) if video_file else None
+        content_hash = content_hash or pending_key
+        now = time.time()
+
+        with self._lock, self._connect() as conn, conn:
+            started_at = now
+            if pending_key and pending_key != content_hash:
+                row = conn.execute(
+                    "SELECT started_at FROM uploads WHERE content_hash = ? AND target = ?",
+                    (pending_key, target)
+                ).fetchone()
+                if row is not None:
+                    started_at = row['started_at']
+                    conn.execute("DELETE FROM uploads WHERE content_hash = ? AND target = ?",
+                                 (pending_key, target))
+
+            conn.execute(
+                "INSERT INTO uploads (content_hash, target, status, video_file, file_size, remote_id, result, "
+                "attempts, started_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT (content_hash, target) DO UPDATE SET "
+                "status = excluded.status, remote_id = COALESCE(excluded.remote_id, remote_id), "
+                "result = excluded.result, video_file = COALESCE(excluded.video_file, video_file), "
+                "file_size = COALESCE(excluded.file_size, file_size), updated_at = excluded.updated_at",
+                (content_hash, target, status, video_file, file_size, remote_id,
+                 json.dumps(result, default=str), started_at, now)
+            )
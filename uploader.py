@@ -3,13 +3,26 @@ Upload Orchestrator - Manages parallel uploads to multiple platforms
 Coordinates YouTube and TikTok uploads with error handling
 """
 
+import glob
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
 
-from oauth_handler import OAuthHandler
+from mp4_parser import needs_faststart
+from oauth_handler import InteractiveAuthRequired, OAuthHandler
+import platform_rules
+from renditions import RenditionFarm, recipe_for
+from retry import CircuitBreaker, RetryPolicy, FATAL, OPEN, SERVER_ERROR, TRANSIENT
+from scheduler import UploadScheduler
+from shared_source import SharedSourceRegistry
+from status_poller import StatusPoller, get_status_poller
+from upload_journal import ResumableSessionStore, UploadJournal
+from upload_ledger import UploadLedger, COMPLETED, IN_FLIGHT, owner_alive
 from youtube_uploader import YouTubeUploader
 from tiktok_uploader import TikTokUploader
 from video_manager import VideoManager
@@ -18,6 +31,9 @@ from video_manager import VideoManager
 class UploadOrchestrator:
     """Orchestrates video uploads to multiple platforms"""
 
+    UPLOADER_MAX_AGE = 30 * 60  # seconds before an account re-authenticates
+    PUBLISH_WAIT = 60  # seconds a run waits for TikTok processing before moving on
+
     def __init__(self, config_file='config.json', env_file='.env'):
         """
         Initialize upload orchestrator
@@ -29,7 +45,24 @@ class UploadOrchestrator:
         self.config_file = config_file
         self.config = self._load_config()
         self.oauth_handler = OAuthHandler()
-        self.video_manager = VideoManager()
+        faststart_cache_gb = self.config.get('upload_settings', {}).get('faststart_cache_gb', 20)
+        self.video_manager = VideoManager(faststart_cache_bytes=int(faststart_cache_gb * 1024 * 1024 * 1024))
+        # Shared with every uploader, so finished runs can tell which files
+        # an interrupted upload will resume from
+        self.upload_journal = UploadJournal()
+        self.session_store = ResumableSessionStore()
+        self.ledger = UploadLedger()
+        self.shared_sources = SharedSourceRegistry()
+        self.rendition_farm = RenditionFarm(
+            max_workers=self.config.get('upload_settings', {}).get('rendition_workers', 2)
+        )
+        self.scheduler = UploadScheduler.from_config(self.config.get('upload_settings', {}))
+        account_count = sum(len(accounts) for accounts in self.config.get('accounts', {}).values())
+        self._warmup_pool = ThreadPoolExecutor(max_workers=max(account_count, 1), thread_name_prefix='warmup')
+        self._uploaders = {}
+        self._uploader_locks = {}
+        self._uploaders_lock = threading.Lock()
+        self._circuit_breakers = {}
 
         # Load environment variables
         self._load_env(env_file)
@@ -48,7 +81,19 @@ class UploadOrchestrator:
             from dotenv import load_dotenv
             load_dotenv(env_file)
 
-    def upload_from_metadata(self, metadata_file, platforms=None, max_retries=None):
+    def close(self):
+        """
+        Stop the orchestrator's worker pools
+
+        Pending warm-ups are cancelled; queued uploads and renders are
+        waited for. Call once no more uploads will be started.
+        """
+        self._warmup_pool.shutdown(wait=False, cancel_futures=True)
+        self.scheduler.shutdown(wait=True)
+        self.rendition_farm.shutdown()
+
+    def upload_from_metadata(self, metadata_file, platforms=None, max_retries=None, force=False,
+                             resume_owner=None):
         """
         Upload video based on metadata file
 
@@ -56,10 +101,96 @@ class UploadOrchestrator:
             metadata_file: Path to video metadata JSON file
             platforms: List of specific platforms to upload to (None = all)
             max_retries: Maximum retry attempts (None = use config default)
+            force: Upload even to targets the ledger holds in flight for a live process
+            resume_owner: Ledger owner known to be dead (e.g. the worker of
+                          an expired job lease); its in-flight uploads resume
 
         Returns:
             Dictionary with results for each platform
         """
+        plan = self._prepare_upload(metadata_file, platforms, max_retries, force, resume_owner)
+
+        # Upload to all platforms in parallel; uploads of the same file share
+        # one mapping, held open until every one of them has finished
+        with self._hold_sources(plan):
+            results = self._parallel_upload(plan['video_file'], plan['metadata'], plan['pending'],
+                                            plan['max_retries'], plan['platform_metadata'], plan['timer'],
+                                            self._ledger_recorder(plan))
+
+        results = self._finish_upload(plan, results)
+
+        # Display summary
+        self._display_summary(results)
+
+        return results
+
+    def upload_batch(self, metadata_files, platforms=None, max_retries=None, force=False):
+        """
+        Upload many videos, scheduling every (video, platform) pair on one pool
+
+        Each video is prepared (validated, deduplicated, remuxed/rendered)
+        and its uploads queued right away, so earlier videos are already
+        uploading while later ones are prepared. Authenticated uploaders
+        are shared across videos.
+
+        Args:
+            metadata_files: List of video metadata JSON files
+            platforms: List of specific platforms to upload to (None = each file's list)
+            max_retries: Maximum retry attempts (None = use config default)
+            force: Upload even to targets the ledger holds in flight for a live process
+
+        Returns:
+            Dictionary mapping each metadata file to its per-platform results
+        """
+        batch_results = {}
+        plans = []
+
+        with ExitStack() as stack:
+            for metadata_file in metadata_files:
+                try:
+                    plan = self._prepare_upload(metadata_file, platforms, max_retries, force)
+                except (OSError, ValueError) as e:
+                    print(f"❌ Skipping {metadata_file}: {e}")
+                    batch_results[metadata_file] = {
+                        'metadata': {'success': False, 'error': str(e), 'platform': None}
+                    }
+                    continue
+
+                stack.enter_context(self._hold_sources(plan))
+                plan['futures'] = self._submit_uploads(plan['video_file'], plan['metadata'], plan['pending'],
+                                                       plan['max_retries'], plan['platform_metadata'],
+                                                       plan['timer'], self._ledger_recorder(plan))
+                plans.append(plan)
+
+            for plan in plans:
+                results = self._gather_uploads(plan['futures'])
+                batch_results[plan['metadata_file']] = self._finish_upload(plan, results)
+
+        batch_results = {metadata_file: batch_results[metadata_file] for metadata_file in metadata_files}
+        self._display_batch_summary(batch_results)
+
+        return batch_results
+
+    def _prepare_upload(self, metadata_file, platforms=None, max_retries=None, force=False, resume_owner=None):
+        """
+        Validate a video and work out what each of its targets uploads
+
+        Args:
+            metadata_file: Path to video metadata JSON file
+            platforms: List of specific platforms to upload to (None = all)
+            max_retries: Maximum retry attempts (None = use config default)
+            force: Upload even to targets the ledger holds in flight for a live process
+            resume_owner: Ledger owner known to be dead, whose in-flight uploads resume
+
+        Authentication and connection warm-up for every target start before
+        validation and run alongside it; targets that turn out not to upload
+        have their warm-up cancelled.
+
+        Returns:
+            Upload plan dictionary: 'pending' platforms with their
+            'platform_metadata', 'results' already known (ineligible or
+            previously uploaded targets) and the startup 'timer'
+        """
         # Load metadata
         if not os.path.exists(metadata_file):
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
@@ -67,54 +198,441 @@ class UploadOrchestrator:
         with open(metadata_file, 'r') as f:
             metadata = json.load(f)
 
-        # Validate video file
         video_file = metadata.get('video_file')
         if not video_file:
             raise ValueError("No video_file specified in metadata")
 
+        # Determine which platforms to upload to
+        target_platforms = platforms if platforms else metadata.get('platforms', [])
+
         print(f"\n{'='*60}")
         print(f"Video Upload Pipeline")
         print(f"{'='*60}")
         print(f"Video: {video_file}")
 
-        validation = self.video_manager.validate_video(video_file)
+        # Get retry setting
+        if max_retries is None:
+            max_retries = self.config.get('upload_settings', {}).get('max_retries', 3)
 
-        if not validation['valid']:
-            raise ValueError(f"Video validation failed: {validation['error']}")
+        # Authenticate and open connections while the files are validated
+        timer = StartupTimer()
+        warmups = {platform: self._start_warm_up(platform, max_retries, timer) for platform in target_platforms
+                   if platform.split('_')[0] in platform_rules.PLATFORM_RULES}
+
+        # Validate every file the targets will upload before any upload starts.
+        # Each file is probed once and judged against every target's rules.
+        renditions = self.config.get('upload_settings', {}).get('renditions', False)
+        upload_files = {platform: self._video_file_for(platform, metadata) for platform in target_platforms}
+        with timer.phase('validate'):
+            if upload_files:
+                validations = self._validate_video_files(upload_files, renditions)
+            else:
+                validations = {video_file: self.video_manager.validate_targets(video_file, [], renditions)}
+
+        for path, validation in validations.items():
+            if not validation['valid']:
+                print(f"\n❌ {path}: {validation['error']}")
+                continue
+
+            video_info = validation['video_info']
+            print(f"\nVideo Info ({path}):")
+            print(f"  Resolution: {video_info.get('width')}x{video_info.get('height')}")
+            print(f"  Duration: {video_info.get('duration', 0):.1f}s")
+            print(f"  Size: {self.video_manager.get_file_size_mb(path):.1f}MB")
+
+            for platform, verdict in validation['targets'].items():
+                for message in verdict['errors']:
+                    print(f"  ❌ {platform}: {message}")
+                for message in verdict['warnings']:
+                    print(f"  ⚠️  {platform}: {message}")
+
+        # Drop only the targets that can't take their file
+        results = self._ineligible_targets(upload_files, validations)
+        eligible_platforms = [p for p in target_platforms if p not in results]
+
+        print(f"\nTarget platforms: {', '.join(eligible_platforms) or 'none eligible'}")
+        print(f"\n{'='*60}\n")
 
-        if validation.get('warnings'):
-            print("\nWarnings:")
-            for warning in validation['warnings']:
-                print(f"  - {warning}")
+        # Skip targets that already have this exact video
+        content_hashes = self._content_hashes({p: upload_files[p] for p in eligible_platforms})
+        results.update(self._previous_uploads(content_hashes, upload_files, force, resume_owner))
+        pending_platforms = [p for p in eligible_platforms if p not in results]
+
+        # Targets that won't upload don't need warm connections
+        for platform, cancelled in warmups.items():
+            if platform not in pending_platforms:
+                cancelled.set()
+
+        # Upload faststart copies of files whose moov atom is at the end (once per file)
+        prepared_files = {}
+        if self.config.get('upload_settings', {}).get('faststart', True):
+            for source_file in {upload_files[p] for p in pending_platforms}:
+                if not needs_faststart(source_file):
+                    continue
+
+                # The remux reads the whole file anyway, so hash it now
+                with timer.phase('faststart'):
+                    content_hash = self.ledger.content_hash(source_file)
+                    prepared_files[source_file] = self.video_manager.prepare_faststart(source_file, content_hash,
+                                                                                       checked=True)
+
+                # The ledger keeps using the source's hash, now that it is known
+                for platform in pending_platforms:
+                    if upload_files[platform] == source_file:
+                        content_hashes[platform] = content_hash
+
+        # Pick the file each target uploads: the (faststart) source, or a
+        # rendered variant when the source doesn't fit the platform
+        upload_paths = {p: prepared_files.get(upload_files[p], upload_files[p]) for p in pending_platforms}
+        if renditions:
+            with timer.phase('renditions'):
+                upload_paths.update(self._render_variants(upload_files, pending_platforms, validations,
+                                                          content_hashes))
+
+            # A target that was only eligible through its rendition can't go without it
+            for platform in [p for p in pending_platforms if upload_paths[p] is None]:
+                results[platform] = {
+                    'success': False,
+                    'error': "Rendition failed and the original file doesn't meet the platform's requirements",
+                    'platform': platform
+                }
+            pending_platforms = [p for p in pending_platforms if upload_paths[p] is not None]
+            upload_paths = {p: upload_paths[p] for p in pending_platforms}
+
+        platform_metadata = {p: self._metadata_for(p, metadata, upload_paths[p]) for p in pending_platforms}
+
+        # Uploads whose hash comes from the upload itself are held by path and size
+        for platform in pending_platforms:
+            self.ledger.mark_in_flight(content_hashes[platform], platform, upload_files[platform])
+
+        return {
+            'metadata_file': metadata_file,
+            'video_file': video_file,
+            'metadata': metadata,
+            'max_retries': max_retries,
+            'results': results,
+            'pending': pending_platforms,
+            'upload_files': upload_files,
+            'upload_paths': upload_paths,
+            'prepared_files': prepared_files,
+            'content_hashes': content_hashes,
+            'platform_metadata': platform_metadata,
+            'timer': timer
+        }
+
+    def _hold_sources(self, plan):
+        """
+        Keep the shared mappings of a plan's upload files open
 
-        video_info = validation.get('video_info', {})
-        print(f"\nVideo Info:")
-        print(f"  Resolution: {video_info.get('width')}x{video_info.get('height')}")
-        print(f"  Duration: {video_info.get('duration', 0):.1f}s")
-        print(f"  Size: {self.video_manager.get_file_size_mb(video_file):.1f}MB")
+        Args:
+            plan: Upload plan from _prepare_upload
 
-        # Determine which platforms to upload to
-        target_platforms = platforms if platforms else metadata.get('platforms', [])
+        Returns:
+            Context manager releasing the mappings on exit
+        """
+        stack = ExitStack()
+        for upload_path in set(plan['upload_paths'].values()):
+            stack.enter_context(self.shared_sources.open(upload_path))
+        return stack
 
-        print(f"\nTarget platforms: {', '.join(target_platforms)}")
-        print(f"\n{'='*60}\n")
+    def _finish_upload(self, plan, upload_results):
+        """
+        Resolve publish statuses, record the ledger and log a video's results
 
-        # Get retry setting
-        if max_retries is None:
-            max_retries = self.config.get('upload_settings', {}).get('max_retries', 3)
+        Args:
+            plan: Upload plan from _prepare_upload
+            upload_results: Results of the uploads that ran
 
-        # Upload to all platforms in parallel
-        results = self._parallel_upload(video_file, metadata, target_platforms, max_retries)
+        Returns:
+            Dictionary with results for each platform
+        """
+        results = dict(plan['results'])
+        results.update(upload_results)
+
+        # Wait for TikTok processing now that every upload worker is done. Each
+        # upload was recorded when it returned; record the publish status too
+        tracked = [p for p in plan['pending'] if 'status_future' in results[p]]
+        self._await_publish_status(results)
+
+        record = self._ledger_recorder(plan)
+        for platform in tracked:
+            record(platform, results[platform])
+
+        # Every target of this video is done with its faststart copies. They
+        # stay cached; copies a failed upload can resume from are never evicted
+        prepared = [f for s, f in plan['prepared_files'].items() if f != s]
+        if prepared:
+            referenced = self.upload_journal.referenced_files() | self.session_store.referenced_files()
+            for prepared_file in prepared:
+                self.video_manager.release_faststart(prepared_file, referenced)
 
         # Log results
-        self._log_results(video_file, metadata, results)
+        self._log_results(plan['video_file'], plan['metadata'], results)
+        plan['timer'].report(plan['video_file'])
 
-        # Display summary
-        self._display_summary(results)
+        return results
+
+    def _ledger_recorder(self, plan):
+        """
+        Callback recording a plan's uploads in the ledger
+
+        Args:
+            plan: Upload plan from _prepare_upload
+
+        Returns:
+            Function taking (platform, result)
+        """
+        def record(platform, result):
+            self._record_upload(platform, plan['upload_files'][platform], plan['content_hashes'][platform],
+                                result, uploaded_file=plan['upload_paths'][platform])
+        return record
+
+    def _content_hashes(self, upload_files):
+        """
+        Content hashes needed to check the ledger before uploading
+
+        A file is only hashed up front when its hash isn't stored yet and
+        the target already has an upload of the same size. Otherwise it
+        can't be a duplicate, and its hash is taken from the bytes the
+        uploader reads (see _record_upload), so the file is read once.
+
+        Args:
+            upload_files: Dictionary mapping platform to the file it will upload
+
+        Returns:
+            Dictionary mapping platform to a hex digest, or None if deferred
+        """
+        content_hashes = {}
+
+        for platform, upload_file in upload_files.items():
+            content_hash = self.ledger.known_hash(upload_file)
+            if content_hash is None and self.ledger.has_size(os.path.getsize(upload_file), platform):
+                content_hash = self.ledger.content_hash(upload_file)
+            content_hashes[platform] = content_hash
+
+        return content_hashes
+
+    def _record_upload(self, platform, upload_file, content_hash, result, uploaded_file=None):
+        """
+        Record an upload result in the ledger
+
+        Args:
+            platform: Platform identifier
+            upload_file: Source file of the upload
+            content_hash: Hash computed before the upload, or None if deferred
+            result: Upload result dictionary
+            uploaded_file: File actually sent, if a prepared copy of the source
+        """
+        result = {key: value for key, value in result.items() if key != 'status_future'}
+
+        uploaded_hash = None
+        if uploaded_file in (None, upload_file):
+            uploaded_hash = (result.get('integrity') or {}).get('sha256')
+
+        if uploaded_hash:
+            if content_hash and content_hash != uploaded_hash:
+                print(f"⚠️  {upload_file} changed since it was hashed; "
+                      f"recording the hash of the bytes uploaded to {platform}")
+            self.ledger.remember_hash(upload_file, uploaded_hash)
+            content_hash = uploaded_hash
+
+        # Without a hash the entry stays under the file's path and size
+        self.ledger.mark_finished(content_hash, platform, result, upload_file)
+
+    def _render_variants(self, upload_files, platforms, validations, content_hashes):
+        """
+        Render the platform variants targets need (each distinct one once)
+
+        Args:
+            upload_files: Dictionary mapping platform to its source file
+            platforms: Platforms about to upload
+            validations: Validation results by file, with per-target verdicts
+            content_hashes: Dictionary mapping platform to the source hash (updated in place)
+
+        Returns:
+            Dictionary mapping platform to the variant it should upload, or
+            None where rendering failed and the source isn't eligible
+        """
+        futures = {}
+
+        for platform in platforms:
+            source_file = upload_files[platform]
+            recipe = recipe_for(validations[source_file]['targets'].get(platform))
+            if not recipe:
+                continue
+
+            if not content_hashes[platform]:
+                content_hashes[platform] = self.ledger.content_hash(source_file)
+
+            print(f"{platform}: uploading a {recipe.key} rendition of {source_file}")
+            futures[platform] = self.rendition_farm.submit(source_file, content_hashes[platform], recipe)
+
+        variants = {}
+        for platform, future in futures.items():
+            source_file = upload_files[platform]
+            variant = future.result()
+
+            if variant == source_file:
+                video_info = validations[source_file]['video_info']
+                if not platform_rules.evaluate(platform, video_info)['eligible']:
+                    variant = None
+
+            variants[platform] = variant
+
+        return variants
+
+    def _ineligible_targets(self, upload_files, validations):
+        """
+        Failure results for targets whose file is invalid or breaks their rules
+
+        Args:
+            upload_files: Dictionary mapping platform to the file it will upload
+            validations: Validation results by file, with per-target verdicts
+
+        Returns:
+            Dictionary of failure results for ineligible platforms
+        """
+        results = {}
+
+        for platform, upload_file in upload_files.items():
+            validation = validations[upload_file]
+            if not validation['valid']:
+                error = validation['error']
+            elif not validation['targets'][platform]['eligible']:
+                error = '; '.join(validation['targets'][platform]['errors'])
+            else:
+                continue
+
+            print(f"Skipping {platform}: {error}")
+            results[platform] = {
+                'success': False,
+                'error': f"Not eligible: {error}",
+                'ineligible': True,
+                'platform': platform
+            }
 
         return results
 
-    def _parallel_upload(self, video_file, metadata, platforms, max_retries):
+    def _metadata_for(self, platform, metadata, upload_path):
+        """
+        Copy of the metadata that points a platform at the file it uploads
+
+        Args:
+            platform: Platform identifier
+            metadata: Video metadata dictionary
+            upload_path: File the platform uploads
+
+        Returns:
+            Metadata dictionary for that platform's upload
+        """
+        if upload_path == self._video_file_for(platform, metadata):
+            return metadata
+
+        parts = platform.split('_')
+        language = parts[1] if len(parts) > 1 else 'english'
+
+        platform_metadata = dict(metadata)
+        platform_metadata[language] = dict(metadata.get(language, {}), video_file=upload_path)
+        return platform_metadata
+
+    def _previous_uploads(self, content_hashes, upload_files, force=False, resume_owner=None):
+        """
+        Look up targets in the upload ledger
+
+        An upload left in flight by a process that is gone is resumed: the
+        target uploads again and picks up its TikTok chunk journal or YouTube
+        resumable session. A target a live process is still uploading fails
+        as TRANSIENT, so a queued job tries again once that upload finished.
+
+        Args:
+            content_hashes: Dictionary mapping platform to the content hash it
+                            will upload (None = no finished upload possible)
+            upload_files: Dictionary mapping platform to the file it will upload
+            force: Upload even where another process still holds the upload
+                   in flight (completed uploads are skipped regardless)
+            resume_owner: Owner known to be dead even if its process can't
+                          be checked (e.g. on another host)
+
+        Returns:
+            Dictionary of stored results for platforms that already completed,
+            and failures for platforms a live process is still uploading to
+        """
+        previous = {}
+
+        for platform, content_hash in content_hashes.items():
+            entry = self.ledger.lookup(content_hash, platform) if content_hash else None
+            if not entry:
+                # An upload started before the file was hashed
+                entry = self.ledger.lookup_unhashed(upload_files[platform], platform)
+                if not entry or entry['status'] != IN_FLIGHT:
+                    continue
+
+            if entry['status'] == COMPLETED:
+                print(f"Skipping {platform}: this video was already uploaded "
+                      f"({entry['remote_id']})")
+                previous[platform] = dict(entry['result'] or {}, success=True, skipped=True)
+            elif entry['status'] == IN_FLIGHT:
+                started = f"{datetime.fromtimestamp(entry['started_at']):%Y-%m-%d %H:%M}"
+                if force or entry['owner'] == resume_owner or not owner_alive(entry['owner']):
+                    print(f"Resuming {platform}: the upload started {started} never finished")
+                    continue
+
+                print(f"Skipping {platform}: an upload of this video is in flight "
+                      f"(started {started} by {entry['owner']})")
+                previous[platform] = {
+                    'success': False,
+                    'error': f"An upload of this video is still running in {entry['owner']}; "
+                             f"use --force if it is not",
+                    'category': TRANSIENT,
+                    'in_flight': True,
+                    'platform': platform
+                }
+
+        return previous
+
+    def _video_file_for(self, platform, metadata):
+        """
+        Video file a target platform will upload
+
+        Args:
+            platform: Platform identifier (e.g., 'tiktok_japanese')
+            metadata: Video metadata dictionary
+
+        Returns:
+            Language-specific video file if set, otherwise the default video_file
+        """
+        parts = platform.split('_')
+        language = parts[1] if len(parts) > 1 else 'english'
+        return metadata.get(language, {}).get('video_file', metadata.get('video_file'))
+
+    def _validate_video_files(self, upload_files, renditions=False):
+        """
+        Validate distinct video files concurrently against their targets' rules
+
+        Args:
+            upload_files: Dictionary mapping platform to the file it will upload
+                          (a file shared by several targets is probed once)
+            renditions: The 'renditions' upload setting (see platform_rules.rendition_fields)
+
+        Returns:
+            Dictionary mapping each upload path to its validation result
+        """
+        distinct = {}
+        targets = {}
+        for platform, path in upload_files.items():
+            key = os.path.realpath(path)
+            distinct.setdefault(key, path)
+            targets.setdefault(key, []).append(platform)
+
+        with ThreadPoolExecutor(max_workers=len(distinct)) as executor:
+            futures = {executor.submit(self.video_manager.validate_targets, path, targets[key], renditions): key
+                       for key, path in distinct.items()}
+            results = {futures[future]: future.result() for future in as_completed(futures)}
+
+        return {path: results[os.path.realpath(path)] for path in upload_files.values()}
+
+    def _parallel_upload(self, video_file, metadata, platforms, max_retries, platform_metadata=None, timer=None,
+                         on_result=None):
         """
         Upload to multiple platforms in parallel
 
@@ -123,81 +641,318 @@ class UploadOrchestrator:
             metadata: Video metadata dictionary
             platforms: List of platform identifiers
             max_retries: Maximum retry attempts
+            platform_metadata: Optional per-platform metadata overriding metadata
+            timer: Optional StartupTimer marking when the first upload starts
+            on_result: Optional function called with (platform, result) as each upload returns
 
         Returns:
             Dictionary with results for each platform
         """
-        results = {}
+        futures = self._submit_uploads(video_file, metadata, platforms, max_retries, platform_metadata, timer,
+                                       on_result)
+        return self._gather_uploads(futures)
 
-        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
-            futures = {}
+    def _submit_uploads(self, video_file, metadata, platforms, max_retries, platform_metadata=None, timer=None,
+                        on_result=None):
+        """
+        Queue uploads on the shared scheduler
 
-            for platform in platforms:
-                future = executor.submit(
-                    self._upload_to_platform,
-                    platform,
-                    video_file,
-                    metadata,
-                    max_retries
-                )
-                futures[future] = platform
+        Args:
+            video_file: Path to video file
+            metadata: Video metadata dictionary
+            platforms: List of platform identifiers
+            max_retries: Maximum retry attempts
+            platform_metadata: Optional per-platform metadata overriding metadata
+            timer: Optional StartupTimer marking when the first upload starts
+            on_result: Optional function called with (platform, result) as each upload returns
 
-            # Collect results as they complete
-            for future in as_completed(futures):
-                platform = futures[future]
-                try:
-                    result = future.result()
-                    results[platform] = result
-                except Exception as e:
-                    results[platform] = {
-                        'success': False,
-                        'error': str(e),
-                        'platform': platform
-                    }
+        Returns:
+            Dictionary mapping platform to the Future of its upload result
+        """
+        return {
+            platform: self._submit_upload(
+                platform,
+                video_file,
+                (platform_metadata or {}).get(platform, metadata),
+                max_retries,
+                timer,
+                on_result
+            )
+            for platform in platforms
+        }
+
+    def _gather_uploads(self, futures):
+        """
+        Wait for queued uploads
+
+        Args:
+            futures: Dictionary mapping platform to the Future of its upload
+
+        Returns:
+            Dictionary with results for each platform
+        """
+        results = {}
+        platforms = {future: platform for platform, future in futures.items()}
+
+        # Collect results as they complete
+        for future in as_completed(platforms):
+            platform = platforms[future]
+            try:
+                results[platform] = future.result()
+            except Exception as e:
+                results[platform] = {
+                    'success': False,
+                    'error': str(e),
+                    'platform': platform
+                }
 
         return results
 
-    def _upload_to_platform(self, platform, video_file, metadata, max_retries):
+    def _await_publish_status(self, results):
         """
-        Upload to a specific platform with retry logic
+        Resolve publish statuses tracked by the background status poller
+
+        Waits at most PUBLISH_WAIT seconds in total. A publish still processing
+        by then keeps being tracked by the poller; its result says 'PROCESSING'.
+
+        Args:
+            results: Upload results dictionary (updated in place)
+        """
+        deadline = time.monotonic() + self.PUBLISH_WAIT
+
+        for platform, result in results.items():
+            future = result.pop('status_future', None)
+            if future is None:
+                continue
+
+            if not future.done():
+                print(f"Waiting for {platform} to finish processing...")
+
+            try:
+                status = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                print(f"⚠️  {platform} is still processing (publish ID {result.get('publish_id')}); "
+                      f"not waiting any longer")
+                result['status'] = 'PROCESSING'
+                continue
+
+            result['status'] = status
+            if status == 'FAILED':
+                result['success'] = False
+                result['error'] = f"TikTok failed to process the video (publish ID {result.get('publish_id')})"
+
+    def _submit_upload(self, platform, video_file, metadata, max_retries, timer=None, on_result=None):
+        """
+        Queue one target's upload, retries included, on the shared scheduler
 
         Args:
             platform: Platform identifier (e.g., 'youtube_english')
             video_file: Path to video file
             metadata: Video metadata dictionary
             max_retries: Maximum retry attempts
+            timer: Optional StartupTimer marking when the first upload starts
+            on_result: Optional function called with (platform, result) once
+                       the upload is done, before the worker moves on
+
+        Returns:
+            Future resolving to the final upload result
+        """
+        outcome = Future()
+        self.scheduler.submit(platform, self._upload_to_platform, outcome, 0, platform, video_file, metadata,
+                              max_retries, timer, on_result)
+        return outcome
+
+    def _upload_to_platform(self, outcome, attempt, platform, video_file, metadata, max_retries, timer=None,
+                            on_result=None):
+        """
+        Make one upload attempt, queueing the next one if the failure can pass
+
+        A retry waits out its backoff off the worker pool and then queues
+        for a slot again, so the wait holds none of the scheduler's caps.
+        Resumable sessions and the TikTok journal make a retry continue
+        where the last attempt stopped. A failure the uploader already
+        retried itself (such as a TikTok init) is not retried again here.
+
+        Args:
+            outcome: Future receiving the final upload result
+            attempt: Retries made before this attempt
+            platform: Platform identifier (e.g., 'youtube_english')
+            video_file: Path to video file
+            metadata: Video metadata dictionary
+            max_retries: Maximum retry attempts
+            timer: Optional StartupTimer marking when the first upload starts
+            on_result: Optional function called with (platform, result) once
+                       the upload is done
+        """
+        try:
+            result = self._attempt_upload(platform, video_file, metadata, max_retries, timer)
+
+            category = result.get('category', FATAL)
+            retry_policy = RetryPolicy(max_retries=max_retries, base_delay=5.0, max_delay=300.0)
+            if (not result.get('success') and not result.get('retried')
+                    and self._circuit_breaker_for(platform).state != OPEN
+                    and retry_policy.should_retry(category, attempt)):
+                delay = retry_policy.delay(attempt, category)
+                print(f"⚠️  {platform} upload failed ({category}: {result.get('error')}). "
+                      f"Retrying in {delay:.0f}s (attempt {attempt + 1}/{max_retries})...")
+                self.scheduler.submit_later(delay, platform, self._upload_to_platform, outcome, attempt + 1,
+                                            platform, video_file, metadata, max_retries, timer, on_result)
+                return
+
+            if on_result:
+                on_result(platform, result)
+            outcome.set_result(result)
+        except BaseException as e:
+            outcome.set_exception(e)
+            raise
+
+    def _attempt_upload(self, platform, video_file, metadata, max_retries, timer=None):
+        """
+        Upload to a specific platform once, through its circuit breaker
 
         Returns:
             Upload result dictionary
         """
-        # Authenticate ONCE before retries (don't re-auth on each retry)
+        # Authenticate ONCE per account (don't re-auth on each retry or video)
         try:
-            uploader = self._get_authenticated_uploader(platform)
+            uploader = self._uploader_for(platform, max_retries)
         except Exception as e:
             return {
                 'success': False,
                 'error': f"Authentication failed: {str(e)}",
+                'category': FATAL,
+                'platform': platform
+            }
+
+        if timer:
+            timer.mark('first upload')
+
+        breaker = self._circuit_breaker_for(platform)
+        if not breaker.allow():
+            return {
+                'success': False,
+                'error': f"{breaker.name} is unavailable after repeated server errors "
+                         f"(circuit open, retry in {breaker.retry_in():.0f}s)",
+                'category': SERVER_ERROR,
                 'platform': platform
             }
 
-        # Attempt upload once (no retries)
         try:
             result = self._do_upload_with_uploader(platform, video_file, metadata, uploader)
-            return result
-
         except Exception as e:
-            return {
+            result = {
                 'success': False,
                 'error': str(e),
+                'category': FATAL,
                 'platform': platform
             }
 
-    def _get_authenticated_uploader(self, platform):
+        if result.get('success'):
+            breaker.record_success()
+        else:
+            breaker.record_failure(result.get('category', FATAL))
+
+        return result
+
+    def _circuit_breaker_for(self, platform):
+        """
+        Get the circuit breaker shared by every account of a platform
+
+        Args:
+            platform: Platform identifier (e.g., 'youtube_english')
+
+        Returns:
+            CircuitBreaker for the platform type
+        """
+        platform_type = platform.split('_')[0]
+        settings = self.config.get('upload_settings', {}).get('circuit_breaker', {})
+
+        with self._uploaders_lock:
+            if platform_type not in self._circuit_breakers:
+                self._circuit_breakers[platform_type] = CircuitBreaker(
+                    {'youtube': 'YouTube', 'tiktok': 'TikTok'}.get(platform_type, platform_type),
+                    failure_threshold=settings.get('failure_threshold', 5),
+                    cooldown=settings.get('cooldown_seconds', 120)
+                )
+            return self._circuit_breakers[platform_type]
+
+    def _start_warm_up(self, platform, max_retries, timer):
+        """
+        Start authenticating a target and opening its connections
+
+        Args:
+            platform: Platform identifier
+            max_retries: Per-request retry limit inside the uploader
+            timer: StartupTimer recording the warm-up phases
+
+        Returns:
+            threading.Event that cancels the warm-up steps not yet started
+        """
+        cancelled = threading.Event()
+        self._warmup_pool.submit(self._warm_up, platform, max_retries, timer, cancelled)
+        return cancelled
+
+    def _warm_up(self, platform, max_retries, timer, cancelled):
+        """
+        Authenticate a target (cached for its upload) and pre-connect to its hosts
+
+        Only stored credentials are used: an account that needs a browser
+        sign-in is left to its upload, so no consent flow runs on a
+        background thread. Failures are only reported; the upload
+        authenticates again and returns the error in its result.
+        """
+        try:
+            if cancelled.is_set():
+                return
+            with timer.phase(f"auth {platform}"):
+                uploader = self._uploader_for(platform, max_retries, interactive=False)[0]
+
+            if cancelled.is_set():
+                return
+            with timer.phase(f"connect {platform}"):
+                uploader.warm_up()
+        except InteractiveAuthRequired as e:
+            print(f"⚠️  Skipping warm-up for {platform}: {e} (it will run when the upload starts)")
+        except Exception as e:
+            print(f"⚠️  Warm-up for {platform} failed: {e}")
+
+    def _uploader_for(self, platform, max_retries=None, interactive=True):
+        """
+        Get the shared authenticated uploader for a platform account
+
+        Uploaders are created once and reused by every video uploading to
+        that account until they are UPLOADER_MAX_AGE old, so a long-running
+        process picks up refreshed tokens; a failed authentication is not
+        cached.
+
+        Args:
+            platform: Platform identifier
+            max_retries: Per-request retry limit inside the uploader
+            interactive: Whether authentication may start a browser sign-in
+
+        Returns:
+            Tuple from _get_authenticated_uploader
+        """
+        key = (platform, max_retries)
+
+        with self._uploaders_lock:
+            lock = self._uploader_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            created_at, uploader = self._uploaders.get(key, (None, None))
+            if uploader is None or time.monotonic() - created_at > self.UPLOADER_MAX_AGE:
+                uploader = self._get_authenticated_uploader(platform, max_retries, interactive)
+                self._uploaders[key] = (time.monotonic(), uploader)
+            return uploader
+
+    def _get_authenticated_uploader(self, platform, max_retries=None, interactive=True):
         """
         Get authenticated uploader for a platform (auth happens once here)
 
         Args:
             platform: Platform identifier
+            max_retries: Per-request retry limit inside the uploader (None = uploader default)
+            interactive: Whether authentication may start a browser sign-in
 
         Returns:
             Tuple of (uploader, platform_type, language, lang_metadata)
@@ -205,15 +960,24 @@ class UploadOrchestrator:
         parts = platform.split('_')
         platform_type = parts[0]  # 'youtube' or 'tiktok'
         language = parts[1] if len(parts) > 1 else 'english'
+        retry_policy = RetryPolicy(max_retries=max_retries) if max_retries is not None else None
 
         if platform_type == 'youtube':
             account_config = self.config['accounts']['youtube'][language]
             credentials = self.oauth_handler.get_youtube_credentials(
                 language,
-                account_config['token_file']
+                account_config['token_file'],
+                interactive=interactive
             )
             from youtube_uploader import YouTubeUploader
-            return (YouTubeUploader(credentials), platform_type, language)
+            chunk_size_mb = self.config.get('upload_settings', {}).get('youtube_chunk_size_mb', 8)
+            return (YouTubeUploader(credentials, account_name=language,
+                                    chunk_size=int(chunk_size_mb * 1024 * 1024),
+                                    session_store=self.session_store,
+                                    retry_policy=retry_policy,
+                                    source_registry=self.shared_sources,
+                                    byte_budget=self.scheduler.byte_budget),
+                    platform_type, language)
 
         elif platform_type == 'tiktok':
             account_config = self.config['accounts']['tiktok'][language]
@@ -227,15 +991,25 @@ class UploadOrchestrator:
                 language,
                 account_config['token_file'],
                 client_key,
-                client_secret
+                client_secret,
+                interactive=interactive
             )
 
             access_token = token_data.get('access_token')
             if not access_token:
                 raise ValueError('Failed to get TikTok access token')
 
-            from tiktok_uploader import TikTokUploader
-            return (TikTokUploader(access_token), platform_type, language)
+            from tiktok_uploader import TikTokUploader, get_shared_session
+            # One pooled connection per upload that may run at once (per_account
+            # caps can let an account run several), plus the status poller's
+            session = get_shared_session(pool_size=self.scheduler.max_workers + StatusPoller.THREADS)
+            return (TikTokUploader(access_token, session=session, account_name=language,
+                                   journal=self.upload_journal,
+                                   retry_policy=retry_policy, status_poller=get_status_poller(),
+                                   source_registry=self.shared_sources,
+                                   byte_budget=self.scheduler.byte_budget,
+                                   init_limiter=self.scheduler.init_limiter(platform)),
+                    platform_type, language)
 
         else:
             raise ValueError(f"Unknown platform type: {platform_type}")
@@ -335,7 +1109,7 @@ class UploadOrchestrator:
         )
 
         # Create uploader
-        uploader = YouTubeUploader(credentials)
+        uploader = YouTubeUploader(credentials, account_name=account_name)
 
         # Upload
         category_id = self.config.get('upload_settings', {}).get('youtube_category', '20')
@@ -386,7 +1160,7 @@ class UploadOrchestrator:
                 'account': account_name
             }
 
-        uploader = TikTokUploader(access_token)
+        uploader = TikTokUploader(access_token, account_name=account_name)
 
         # Combine title and hashtags
         title = metadata.get('title', 'Untitled')
@@ -432,7 +1206,7 @@ class UploadOrchestrator:
             for platform, result in results.items():
                 f.write(f"\n  {platform}:\n")
                 if result['success']:
-                    f.write(f"    Status: SUCCESS\n")
+                    f.write(f"    Status: {'SKIPPED (already uploaded)' if result.get('skipped') else 'SUCCESS'}\n")
                     if 'video_url' in result:
                         f.write(f"    URL: {result['video_url']}\n")
                     if 'video_id' in result:
@@ -466,6 +1240,8 @@ class UploadOrchestrator:
             print(f"{icon} {platform}: {status}")
 
             if result.get('success'):
+                if result.get('skipped'):
+                    print(f"  Already uploaded in an earlier run")
                 if 'video_url' in result:
                     print(f"  URL: {result['video_url']}")
                 if 'publish_id' in result:
@@ -478,3 +1254,102 @@ class UploadOrchestrator:
         print(f"{'='*60}")
         print(f"Total: {success_count}/{total_count} successful")
         print(f"{'='*60}\n")
+
+    def _display_batch_summary(self, batch_results):
+        """
+        Display one summary for a whole batch
+
+        Args:
+            batch_results: Dictionary mapping metadata file to its results
+        """
+        print(f"\n{'='*60}")
+        print("Batch Upload Summary")
+        print(f"{'='*60}\n")
+
+        success_count = 0
+        total_count = 0
+
+        for metadata_file, results in batch_results.items():
+            print(f"{metadata_file}:")
+
+            for platform, result in results.items():
+                total_count += 1
+                if result.get('success'):
+                    success_count += 1
+                    status = "SKIPPED (already uploaded)" if result.get('skipped') else "SUCCESS"
+                    detail = result.get('video_url') or result.get('publish_id') or ''
+                    print(f"  ✓ {platform}: {status} {detail}".rstrip())
+                else:
+                    print(f"  ✗ {platform}: FAILED - {result.get('error', 'Unknown error')}")
+
+            print()
+
+        print(f"{'='*60}")
+        print(f"Total: {success_count}/{total_count} successful across {len(batch_results)} videos")
+        print(f"{'='*60}\n")
+
+
+class StartupTimer:
+    """Wall-clock timings of the phases before an upload starts"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Time a phase (repeated phases of the same name add up)"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                offset, duration = self.phases.get(name, (start - self.started, 0.0))
+                self.phases[name] = (offset, duration + time.monotonic() - start)
+
+    def mark(self, name):
+        """Record the first time an event happens"""
+        with self._lock:
+            self.phases.setdefault(name, (time.monotonic() - self.started, 0.0))
+
+    def report(self, label):
+        """
+        Print each phase's start offset and duration
+
+        Overlapping offsets show which phases ran concurrently.
+
+        Args:
+            label: What the timings are for (e.g., the video file)
+        """
+        with self._lock:
+            phases = sorted(self.phases.items(), key=lambda item: item[1][0])
+
+        print(f"Startup timings ({label}):")
+        for name, (offset, duration) in phases:
+            took = f"{duration:.2f}s" if duration else ''
+            print(f"  +{offset:6.2f}s  {name:<28} {took}".rstrip())
+        print()
+
+
+def expand_metadata_paths(paths):
+    """
+    Expand metadata files and directories into a list of metadata files
+
+    Args:
+        paths: List of JSON files or directories holding them
+
+    Returns:
+        List of metadata file paths in the order given, with each
+        directory's files sorted (missing paths are kept so they are
+        reported as failures)
+    """
+    metadata_files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            metadata_files.extend(sorted(glob.glob(os.path.join(path, '*.json'))))
+        else:
+            metadata_files.append(path)
+
+    return list(dict.fromkeys(metadata_files))
@@ -4,97 +4,240 @@ Checks format, resolution, file size, and duration
 """
 
 import os
+import glob
 import subprocess
 import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import platform_rules
+from mp4_parser import MP4_EXTENSIONS, needs_faststart, probe_mp4
+from probe_cache import ProbeCache
+from upload_ledger import hash_file
+
+
+def _mark_used(path):
+    """Record a cache hit in the file's access time, leaving its mtime alone"""
+    stat = os.stat(path)
+    os.utime(path, ns=(time.time_ns(), stat.st_mtime_ns))
 
 
 class VideoManager:
     """Manages video file validation and information"""
 
-    # Platform requirements
-    MAX_FILE_SIZE = 4 * 1024 * 1024 * 1024  # 4GB
-    YOUTUBE_SHORTS_MAX_DURATION = 60  # seconds
-    TIKTOK_MAX_DURATION = 600  # 10 minutes in seconds
-
+    # Per-platform requirements live in platform_rules
     SUPPORTED_FORMATS = ['.mp4', '.mov', '.avi', '.mkv']
-    RECOMMENDED_RESOLUTION = (1080, 1920)  # width x height for vertical video
 
-    def __init__(self):
-        """Initialize video manager"""
-        pass
+    REMUX_TIMEOUT = 600  # seconds
+    FASTSTART_CACHE_BYTES = 20 * 1024 * 1024 * 1024  # 20GB
 
-    def validate_video(self, video_file):
+    def __init__(self, cache_file='cache/probe_cache.json', faststart_dir='cache/faststart',
+                 faststart_cache_bytes=FASTSTART_CACHE_BYTES):
+        """
+        Initialize video manager
+
+        Args:
+            cache_file: Path of the on-disk probe cache (None = always probe)
+            faststart_dir: Directory of faststart copies, named by source content hash
+            faststart_cache_bytes: Size the faststart copies are trimmed to
+                                   (least recently used first)
+        """
+        self.probe_cache = ProbeCache(cache_file) if cache_file else None
+        self.faststart_dir = Path(faststart_dir)
+        self.faststart_cache_bytes = faststart_cache_bytes
+        self._prepare_locks = {}
+        self._prepare_locks_guard = threading.Lock()
+        self._faststart_users = {}
+
+    def validate_video(self, video_file, platforms=None):
         """
         Validate video file for upload
 
+        Judges the file against platform_rules, the same rules uploads are
+        checked with.
+
         Args:
             video_file: Path to video file
+            platforms: Platform identifiers to check against (None = every
+                       platform type with rules)
 
         Returns:
-            Dictionary with validation results and video info
+            Dictionary with validation results, video info, the warnings of
+            every platform and each platform's verdict under 'targets'
         """
-        if not os.path.exists(video_file):
-            return {
-                'valid': False,
-                'error': f"Video file not found: {video_file}"
-            }
+        validation = self.validate_targets(video_file, platforms or list(platform_rules.PLATFORM_RULES))
+        if not validation['valid']:
+            return validation
 
-        # Check file extension
-        _, ext = os.path.splitext(video_file)
-        if ext.lower() not in self.SUPPORTED_FORMATS:
-            return {
-                'valid': False,
-                'error': f"Unsupported format: {ext}. Supported: {', '.join(self.SUPPORTED_FORMATS)}"
-            }
+        errors = []
+        warnings = []
+        for verdict in validation['targets'].values():
+            errors.extend(message for message in verdict['errors'] if message not in errors)
+            warnings.extend(message for message in verdict['warnings'] if message not in warnings)
 
-        # Check file size
-        file_size = os.path.getsize(video_file)
-        if file_size > self.MAX_FILE_SIZE:
-            size_gb = file_size / (1024 * 1024 * 1024)
-            return {
-                'valid': False,
-                'error': f"File too large: {size_gb:.2f}GB (max 4GB)"
-            }
+        validation['warnings'] = warnings
+        if errors:
+            validation['valid'] = False
+            validation['error'] = '; '.join(errors)
 
-        # Get video info
-        video_info = self._get_video_info(video_file)
+        return validation
 
-        if not video_info:
-            return {
-                'valid': False,
-                'error': "Could not read video information. File may be corrupted."
-            }
+    def validate_targets(self, video_file, platforms, renditions=False):
+        """
+        Validate a video file against each target platform's rules
 
-        # Check duration
-        duration = video_info.get('duration', 0)
-        if duration > self.TIKTOK_MAX_DURATION:
-            return {
-                'valid': False,
-                'error': f"Video too long: {duration}s (max {self.TIKTOK_MAX_DURATION}s for TikTok)"
-            }
+        The file is probed once (not at all when the probe is cached) and
+        every target is judged against that single result.
 
-        # Warnings for non-optimal settings
-        warnings = []
-        width = video_info.get('width', 0)
-        height = video_info.get('height', 0)
+        Args:
+            video_file: Path to video file
+            platforms: List of platform identifiers (e.g., 'tiktok_english')
+            renditions: The 'renditions' upload setting (see platform_rules.rendition_fields)
+
+        Returns:
+            Dictionary with 'valid' and 'error' for problems with the file
+            itself, 'video_info', and 'targets' mapping each platform to its
+            verdict from platform_rules.evaluate
+        """
+        error = self._check_file(video_file)
 
-        if (width, height) != self.RECOMMENDED_RESOLUTION:
-            warnings.append(
-                f"Resolution {width}x{height} differs from recommended {self.RECOMMENDED_RESOLUTION[0]}x{self.RECOMMENDED_RESOLUTION[1]} for vertical video"
-            )
+        video_info = None
+        if not error:
+            video_info = self._get_video_info(video_file)
+            if not video_info:
+                error = "Could not read video information. File may be corrupted."
 
-        if duration > self.YOUTUBE_SHORTS_MAX_DURATION:
-            warnings.append(
-                f"Duration {duration}s exceeds YouTube Shorts limit ({self.YOUTUBE_SHORTS_MAX_DURATION}s)"
-            )
+        if error:
+            return {
+                'valid': False,
+                'error': error,
+                'targets': {}
+            }
 
         return {
             'valid': True,
             'video_info': video_info,
-            'warnings': warnings
+            'targets': {platform: platform_rules.evaluate(platform, video_info, renditions)
+                        for platform in platforms}
         }
 
+    def _check_file(self, video_file):
+        """
+        Check that a file exists and has a supported extension
+
+        Returns:
+            Error message, or None if the file can be probed
+        """
+        if not os.path.exists(video_file):
+            return f"Video file not found: {video_file}"
+
+        _, ext = os.path.splitext(video_file)
+        if ext.lower() not in self.SUPPORTED_FORMATS:
+            return f"Unsupported format: {ext}. Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+
+        return None
+
+    def validate_videos(self, video_files, max_workers=None):
+        """
+        Validate many video files, probing uncached files in a process pool
+
+        Files with a cached probe result are validated in-process right
+        away; the rest are fanned out to worker processes. Results stream
+        back as soon as each file is done.
+
+        Args:
+            video_files: List of paths to video files
+            max_workers: Maximum worker processes (None = CPU count)
+
+        Yields:
+            Tuple of (video_file, validation result dictionary)
+        """
+        to_probe = []
+        for video_file in video_files:
+            if self.probe_cache and self.probe_cache.get(video_file):
+                yield video_file, self.validate_video(video_file)
+            else:
+                to_probe.append(video_file)
+
+        if not to_probe:
+            return
+
+        workers = min(max_workers or os.cpu_count() or 1, len(to_probe))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_validate_in_worker, f): f for f in to_probe}
+
+            for future in as_completed(futures):
+                video_file = futures[future]
+                try:
+                    validation = future.result()
+                except Exception as e:
+                    validation = {
+                        'valid': False,
+                        'error': f"Validation crashed: {e}"
+                    }
+
+                # Workers don't share the cache, so the parent records their probes
+                video_info = validation.get('video_info')
+                if self.probe_cache and video_info and not video_info.get('estimated'):
+                    self.probe_cache.put(video_file, video_info)
+
+                yield video_file, validation
+
     def _get_video_info(self, video_file):
+        """
+        Get video file information, from the probe cache when possible
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Dictionary with video properties
+        """
+        if self.probe_cache:
+            video_info = self.probe_cache.get(video_file)
+            if video_info:
+                return video_info
+
+        video_info = self._probe_video(video_file)
+
+        # Estimated fallback info is not worth remembering
+        if self.probe_cache and video_info and not video_info.get('estimated'):
+            self.probe_cache.put(video_file, video_info)
+
+        return video_info
+
+    def invalidate_probe_cache(self, video_file=None):
+        """
+        Forget cached probe results
+
+        Args:
+            video_file: Path to forget (None = clear the whole cache)
+        """
+        if self.probe_cache:
+            self.probe_cache.invalidate(video_file)
+
+    def _probe_video(self, video_file):
+        """
+        Get video file information, natively for MP4/MOV and with ffprobe otherwise
+
+        Args:
+            video_file: Path to video file
+
+        Returns:
+            Dictionary with video properties
+        """
+        _, ext = os.path.splitext(video_file)
+        if ext.lower() in MP4_EXTENSIONS:
+            video_info = probe_mp4(video_file)
+            if video_info:
+                return video_info
+
+        return self._run_ffprobe(video_file)
+
+    def _run_ffprobe(self, video_file):
         """
         Get video file information using ffprobe
 
@@ -173,9 +316,161 @@ class VideoManager:
             'codec': 'unknown',
             'fps': 30,
             'bitrate': 0,
-            'size': os.path.getsize(video_file)
+            'size': os.path.getsize(video_file),
+            'estimated': True
         }
 
+    def prepare_faststart(self, video_file, content_hash=None, checked=False):
+        """
+        Get a copy of an MP4/MOV with the moov box at the front
+
+        Files whose moov box follows the media data are remuxed with
+        ffmpeg (streams copied, not re-encoded). The copy is stored under
+        the source's content hash, so it is remuxed once per source file
+        and later runs upload the same copy (keeping resumable sessions
+        keyed on it valid). Call release_faststart() when done with it.
+
+        Args:
+            video_file: Path to video file
+            content_hash: Hex SHA-256 of the file (None = hash it here)
+            checked: The caller already found that the file needs faststart
+
+        Returns:
+            Path of the file to upload: the faststart copy, or video_file
+            itself if it needs no remux or the remux failed
+        """
+        _, ext = os.path.splitext(video_file)
+        if ext.lower() not in MP4_EXTENSIONS or not (checked or needs_faststart(video_file)):
+            return video_file
+
+        content_hash = content_hash or hash_file(video_file)
+        output_file = self.faststart_dir / f"{content_hash}{ext.lower()}"
+
+        with self._prepare_locks_guard:
+            lock = self._prepare_locks.setdefault(str(output_file), threading.Lock())
+
+        with lock:
+            if output_file.exists():
+                print(f"Using faststart copy of {video_file}: {output_file}")
+                self._use_faststart(output_file)
+                _mark_used(output_file)
+                return str(output_file)
+
+            print(f"Moving moov atom to the front of {video_file}...")
+            self.faststart_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = output_file.with_name(f"{output_file.stem}.tmp{ext.lower()}")
+
+            cmd = [
+                'ffmpeg',
+                '-v', 'error',
+                '-y',
+                '-i', video_file,
+                '-map', '0',
+                '-c', 'copy',
+                '-movflags', '+faststart',
+                str(tmp_file)
+            ]
+
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.REMUX_TIMEOUT)
+            except FileNotFoundError:
+                print("Warning: ffmpeg not found. Uploading the original file.")
+                return video_file
+            except subprocess.TimeoutExpired:
+                print("Warning: Faststart remux timed out. Uploading the original file.")
+                tmp_file.unlink(missing_ok=True)
+                return video_file
+
+            if result.returncode != 0 or needs_faststart(str(tmp_file)):
+                print(f"Warning: Faststart remux failed. Uploading the original file. {result.stderr.strip()}")
+                tmp_file.unlink(missing_ok=True)
+                return video_file
+
+            os.replace(tmp_file, output_file)
+            self._use_faststart(output_file)
+            _mark_used(output_file)
+
+        # Streams are copied unchanged, so the source's probe result applies
+        if self.probe_cache:
+            video_info = self.probe_cache.get(video_file)
+            if video_info:
+                self.probe_cache.put(str(output_file), dict(video_info, size=os.path.getsize(output_file)))
+
+        print(f"✓ Faststart copy ready: {output_file}")
+        return str(output_file)
+
+    def _use_faststart(self, output_file):
+        """Count one more user of a faststart copy"""
+        with self._prepare_locks_guard:
+            self._faststart_users[str(output_file)] = self._faststart_users.get(str(output_file), 0) + 1
+
+    def release_faststart(self, prepared_file, referenced=()):
+        """
+        Stop using a faststart copy
+
+        The copy stays cached. Once nobody uses it, the cache is trimmed to
+        faststart_cache_bytes.
+
+        Args:
+            prepared_file: Path returned by prepare_faststart (the source
+                           itself is ignored)
+            referenced: Real paths an unfinished upload can still resume
+                        from; those copies are never evicted
+        """
+        with self._prepare_locks_guard:
+            users = self._faststart_users.get(prepared_file, 0) - 1
+            if users < 0:
+                return
+            if users:
+                self._faststart_users[prepared_file] = users
+                return
+            del self._faststart_users[prepared_file]
+
+        self.trim_faststart_cache(referenced)
+
+    def trim_faststart_cache(self, referenced=()):
+        """
+        Evict least recently used faststart copies until the cache fits
+
+        Copies in use by an upload, or that a TikTok journal or YouTube
+        session still points at, are kept even if the cache stays over
+        its size.
+
+        Args:
+            referenced: Real paths an unfinished upload can still resume from
+        """
+        copies = []
+        for path in self.faststart_dir.glob('*'):
+            if '.tmp' in path.suffixes:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            copies.append((stat.st_atime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in copies)
+
+        for _, size, path in sorted(copies):
+            if total <= self.faststart_cache_bytes:
+                break
+            if os.path.realpath(path) in referenced:
+                continue
+
+            with self._prepare_locks_guard:
+                lock = self._prepare_locks.setdefault(str(path), threading.Lock())
+
+            # Taking the copy's lock keeps a concurrent prepare from handing it out mid-delete
+            with lock:
+                with self._prepare_locks_guard:
+                    if self._faststart_users.get(str(path)):
+                        continue
+                path.unlink(missing_ok=True)
+
+            total -= size
+            self.invalidate_probe_cache(str(path))
+            print(f"Evicted faststart copy {path}")
+
     def get_file_size_mb(self, video_file):
         """
         Get video file size in MB
@@ -210,3 +505,37 @@ class VideoManager:
         height = video_info.get('height', 0)
 
         return height > width
+
+
+def _validate_in_worker(video_file):
+    """Validate one file in a worker process (no shared probe cache)"""
+    return VideoManager(cache_file=None).validate_video(video_file)
+
+
+def expand_video_paths(paths):
+    """
+    Expand files, directories and glob patterns into video file paths
+
+    Directories are searched recursively for supported video formats.
+
+    Args:
+        paths: List of file paths, directory paths or glob patterns
+
+    Returns:
+        Sorted list of unique video file paths
+    """
+    video_files = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in files:
+                    if os.path.splitext(name)[1].lower() in VideoManager.SUPPORTED_FORMATS:
+                        video_files.append(os.path.join(root, name))
+        elif any(c in path for c in '*?['):
+            video_files.extend(f for f in glob.glob(path, recursive=True) if os.path.isfile(f))
+        else:
+            # Missing files are kept so validation reports them
+            video_files.append(path)
+
+    return sorted(set(video_files))
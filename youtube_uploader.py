@@ -4,23 +4,182 @@ Supports Shorts and regular videos with full metadata
 """
 
 import os
-from googleapiclient.discovery import build
+import json
+import socket
+import ssl
+import threading
+import http.client
+from pathlib import Path
+import httplib2
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaIoBaseUpload
 import time
 
+from chunk_io import IntegrityRecorder, TeeReader
+from retry import RetryPolicy, classify_status, parse_retry_after, TRANSIENT, FATAL
+from upload_journal import ResumableSessionStore
+
+
+# Network failures worth retrying (socket resets, timeouts, broken responses).
+# Other OSErrors (missing file, no permission) are local and fail at once.
+RETRIABLE_EXCEPTIONS = (
+    httplib2.HttpLib2Error,
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    ssl.SSLError,
+    http.client.NotConnected,
+    http.client.IncompleteRead,
+    http.client.ImproperConnectionState,
+    http.client.CannotSendRequest,
+    http.client.CannotSendHeader,
+    http.client.ResponseNotReady,
+    http.client.BadStatusLine
+)
+
+
+DISCOVERY_CACHE_FILE = 'cache/discovery/youtube.v3.json'
+DISCOVERY_URL = 'https://www.googleapis.com/discovery/v1/apis/youtube/v3/rest'
+YOUTUBE_UPLOAD_HOST = 'www.googleapis.com'
+
+# Discovery document shared by every service built in this process
+_discovery_document = None
+_discovery_lock = threading.Lock()
+
+# Services are cached per thread because httplib2 connections aren't thread-safe
+_thread_services = threading.local()
+
+
+def load_discovery_document(cache_file=DISCOVERY_CACHE_FILE):
+    """
+    Load the YouTube v3 discovery document once per process
+
+    Looks in memory, then the on-disk cache, then the document packaged
+    with google-api-python-client, and only fetches it over the network
+    as a last resort. Whatever is found is written to the on-disk cache.
+
+    Args:
+        cache_file: Path of the on-disk discovery cache
+
+    Returns:
+        Discovery document as a JSON string
+    """
+    global _discovery_document
+
+    with _discovery_lock:
+        if _discovery_document is not None:
+            return _discovery_document
+
+        cache_path = Path(cache_file)
+        if cache_path.exists():
+            _discovery_document = cache_path.read_text(encoding='utf-8')
+            return _discovery_document
+
+        document = get_static_doc('youtube', 'v3')
+        if document is None:
+            print("Fetching YouTube discovery document...")
+            resp, content = httplib2.Http().request(DISCOVERY_URL)
+            if resp.status != 200:
+                raise HttpError(resp, content, uri=DISCOVERY_URL)
+            document = content.decode('utf-8')
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_text(document, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+
+        _discovery_document = document
+        return _discovery_document
+
+
+def get_youtube_service(credentials, account_name='default'):
+    """
+    Get a YouTube API service for an account
+
+    Services are built from the cached discovery document (no network
+    round trip) and reused per account within the calling thread.
+
+    Args:
+        credentials: Google OAuth2 credentials object
+        account_name: Account identifier the service is cached under
+
+    Returns:
+        googleapiclient Resource for YouTube Data API v3
+    """
+    services = getattr(_thread_services, 'services', None)
+    if services is None:
+        services = _thread_services.services = {}
+
+    cached = services.get(account_name)
+    if cached and cached[0] is credentials:
+        return cached[1]
+
+    service = build_from_document(load_discovery_document(), credentials=credentials)
+    services[account_name] = (credentials, service)
+    return service
+
 
 class YouTubeUploader:
     """Handles uploading videos to YouTube"""
 
-    def __init__(self, credentials):
+    # Resumable chunks must be a multiple of 256 KB
+    CHUNK_ALIGNMENT = 256 * 1024
+    DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+    # videos().list accepts up to 50 IDs; batches are kept to the same size
+    MAX_IDS_PER_LIST = 50
+    MAX_BATCH_SIZE = 50
+
+    def __init__(self, credentials, account_name='default', chunk_size=DEFAULT_CHUNK_SIZE,
+                 session_store=None, retry_policy=None, source_registry=None, byte_budget=None):
         """
         Initialize YouTube uploader with credentials
 
         Args:
             credentials: Google OAuth2 credentials object
+            account_name: Account identifier used to key resumable sessions
+            chunk_size: Bytes sent per request (rounded to a multiple of 256 KB)
+            session_store: ResumableSessionStore (None = default store)
+            retry_policy: RetryPolicy for chunk requests (None = defaults)
+            source_registry: SharedSourceRegistry so concurrent uploads of the
+                             same file read one shared mapping (None = open the file)
+            byte_budget: ByteBudget shared by every upload, held by each chunk
+                         until the next one is read (None = unlimited)
+        """
+        self.credentials = credentials
+        self.account_name = account_name
+        self.chunk_size = max(self.CHUNK_ALIGNMENT,
+                              chunk_size // self.CHUNK_ALIGNMENT * self.CHUNK_ALIGNMENT)
+        self.session_store = session_store or ResumableSessionStore()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.source_registry = source_registry
+        self.byte_budget = byte_budget
+
+    @property
+    def youtube(self):
+        """YouTube API service for this account, owned by the calling thread"""
+        return get_youtube_service(self.credentials, self.account_name)
+
+    def warm_up(self):
+        """
+        Do the upload's one-time setup ahead of time
+
+        Loads the discovery document and resolves the upload host. The
+        connections themselves belong to the uploading thread's service
+        (httplib2 isn't thread-safe), so they can't be opened here.
+
+        Returns:
+            List of hosts that were resolved
         """
-        self.youtube = build('youtube', 'v3', credentials=credentials)
+        load_discovery_document()
+        try:
+            socket.getaddrinfo(YOUTUBE_UPLOAD_HOST, 443, proto=socket.IPPROTO_TCP)
+            return [YOUTUBE_UPLOAD_HOST]
+        except OSError:
+            return []
 
     def upload_video(self, video_file, title, description, tags, category_id='20',
                      privacy_status='public', made_for_kids=False):
@@ -37,7 +196,8 @@ class YouTubeUploader:
             made_for_kids: Whether the video is made for kids
 
         Returns:
-            Dictionary with video_id and video_url on success
+            Dictionary with video_id, video_url and integrity (file SHA-256
+            and per-chunk checksums) on success
             None on failure
         """
         if not os.path.exists(video_file):
@@ -57,12 +217,19 @@ class YouTubeUploader:
             }
         }
 
-        # Create media file upload
-        media = MediaFileUpload(
-            video_file,
-            chunksize=-1,  # Upload in a single request
-            resumable=True,
-            mimetype='video/*'
+        # Create media upload; chunked so a dropped connection only costs
+        # the chunk in flight. The stream checksums the bytes as they are sent.
+        recorder = IntegrityRecorder(os.path.getsize(video_file))
+        if self.source_registry:
+            fileobj = self.source_registry.reader(video_file)
+        else:
+            fileobj = open(video_file, 'rb')
+        stream = TeeReader(fileobj, recorder, self.chunk_size, budget=self.byte_budget)
+        media = MediaIoBaseUpload(
+            stream,
+            mimetype='video/*',
+            chunksize=self.chunk_size,
+            resumable=True
         )
 
         try:
@@ -77,11 +244,57 @@ class YouTubeUploader:
             )
 
             response = None
+
+            # Continue a session from an earlier run if the server still has it
+            saved_session = self.session_store.load(video_file, self.account_name)
+            if saved_session:
+                request.resumable_uri = saved_session['session_uri']
+                try:
+                    response = self._sync_resumable_progress(request, media)
+                    print(f"Resuming YouTube upload at byte {request.resumable_progress:,} "
+                          f"of {media.size():,}")
+                except HttpError as e:
+                    print(f"Saved YouTube upload session is no longer valid ({e.resp.status}). "
+                          f"Starting a new upload.")
+                    self.session_store.clear(video_file, self.account_name)
+                    request.resumable_uri = None
+                    request.resumable_progress = 0
+
+            attempt = 0
             while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    print(f"Upload progress: {progress}%")
+                retry_after = None
+                try:
+                    status, response = request.next_chunk()
+                except HttpError as e:
+                    error = e
+                    category = classify_status(e.resp.status)
+                    retry_after = parse_retry_after(e.resp.get('retry-after'))
+                except RETRIABLE_EXCEPTIONS as e:
+                    error = e
+                    category = TRANSIENT
+                else:
+                    # Each chunk gets its own retry budget
+                    attempt = 0
+                    if status:
+                        self.session_store.save(video_file, self.account_name,
+                                                request.resumable_uri, request.resumable_progress)
+                        progress = int(status.progress() * 100)
+                        print(f"Upload progress: {progress}%")
+                    continue
+
+                if not self.retry_policy.should_retry(category, attempt):
+                    raise error
+
+                delay = self.retry_policy.delay(attempt, category, retry_after)
+                attempt += 1
+                print(f"YouTube chunk failed ({category}: {error}). "
+                      f"Retrying in {delay:.1f}s (attempt {attempt}/{self.retry_policy.max_retries})...")
+                time.sleep(delay)
+
+                response = self._resync_after_error(request, media)
+
+            self.session_store.clear(video_file, self.account_name)
+            integrity = recorder.finalize(video_file)
 
             video_id = response['id']
             video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -93,6 +306,7 @@ class YouTubeUploader:
                 'success': True,
                 'video_id': video_id,
                 'video_url': video_url,
+                'integrity': integrity,
                 'platform': 'youtube'
             }
 
@@ -102,6 +316,16 @@ class YouTubeUploader:
             return {
                 'success': False,
                 'error': error_message,
+                'category': classify_status(e.resp.status),
+                'platform': 'youtube'
+            }
+        except RETRIABLE_EXCEPTIONS as e:
+            error_message = f"Network error: {str(e)}"
+            print(f"Error uploading to YouTube: {error_message}")
+            return {
+                'success': False,
+                'error': error_message,
+                'category': TRANSIENT,
                 'platform': 'youtube'
             }
         except Exception as e:
@@ -110,8 +334,73 @@ class YouTubeUploader:
             return {
                 'success': False,
                 'error': error_message,
+                'category': FATAL,
                 'platform': 'youtube'
             }
+        finally:
+            stream.close()
+
+    def _sync_resumable_progress(self, request, media):
+        """
+        Ask the server how much of a resumable session it has committed
+
+        Sends an empty PUT with "Content-Range: bytes */size" and moves the
+        request's resumable_progress to the first byte the server is missing.
+
+        Args:
+            request: videos().insert HttpRequest with resumable_uri set
+            media: MediaIoBaseUpload for the request
+
+        Returns:
+            Response body if the server already has the whole file, else None
+
+        Raises:
+            HttpError: If the session no longer exists
+        """
+        headers = {
+            'Content-Length': '0',
+            'Content-Range': f'bytes */{media.size()}'
+        }
+        resp, content = request.http.request(request.resumable_uri, method='PUT', headers=headers)
+
+        if resp.status in (200, 201):
+            return json.loads(content)
+
+        if resp.status == 308:
+            # Range: bytes=0-<last committed byte>, absent if nothing committed
+            committed = resp.get('range')
+            request.resumable_progress = int(committed.split('-')[1]) + 1 if committed else 0
+            if resp.get('location'):
+                request.resumable_uri = resp['location']
+            return None
+
+        raise HttpError(resp, content, uri=request.resumable_uri)
+
+    def _resync_after_error(self, request, media):
+        """
+        Re-read the committed offset after a failed chunk
+
+        Args:
+            request: videos().insert HttpRequest
+            media: MediaIoBaseUpload for the request
+
+        Returns:
+            Response body if the server turned out to have the whole file, else None
+        """
+        if not request.resumable_uri:
+            # The session was never created; next_chunk will start it again
+            return None
+
+        try:
+            return self._sync_resumable_progress(request, media)
+        except HttpError as e:
+            if classify_status(e.resp.status) == FATAL:
+                raise
+            print(f"Could not query YouTube upload offset: {e}")
+        except RETRIABLE_EXCEPTIONS as e:
+            print(f"Could not query YouTube upload offset: {e}")
+
+        return None
 
     def get_video_info(self, video_id):
         """
@@ -160,29 +449,7 @@ class YouTubeUploader:
             if not video:
                 return False
 
-            body = {'id': video_id}
-
-            # Update snippet if any snippet fields are provided
-            if title or description or tags:
-                body['snippet'] = video['snippet']
-                if title:
-                    body['snippet']['title'] = title[:100]
-                if description:
-                    body['snippet']['description'] = description
-                if tags:
-                    body['snippet']['tags'] = tags[:500]
-
-            # Update status if privacy is provided
-            if privacy_status:
-                body['status'] = video['status']
-                body['status']['privacyStatus'] = privacy_status.lower()
-
-            # Determine which parts to update
-            parts = []
-            if 'snippet' in body:
-                parts.append('snippet')
-            if 'status' in body:
-                parts.append('status')
+            body, parts = self._build_update_body(video, title, description, tags, privacy_status)
 
             if not parts:
                 return True  # Nothing to update
@@ -200,6 +467,153 @@ class YouTubeUploader:
             print(f"Error updating video: {e}")
             return False
 
+    def get_videos_info(self, video_ids):
+        """
+        Get information about many videos, up to 50 IDs per request
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            Dictionary mapping video ID to video information (missing IDs are omitted)
+        """
+        videos = {}
+        video_ids = list(dict.fromkeys(video_ids))
+
+        for start in range(0, len(video_ids), self.MAX_IDS_PER_LIST):
+            batch_ids = video_ids[start:start + self.MAX_IDS_PER_LIST]
+            try:
+                response = self.youtube.videos().list(
+                    part='snippet,status,statistics',
+                    id=','.join(batch_ids),
+                    maxResults=len(batch_ids)
+                ).execute()
+            except HttpError as e:
+                print(f"Error getting video info: {e}")
+                continue
+
+            for item in response.get('items', []):
+                videos[item['id']] = item
+
+        return videos
+
+    def update_videos(self, updates):
+        """
+        Update metadata of many videos with batched reads and writes
+
+        Args:
+            updates: Dictionary mapping video ID to a dictionary of
+                     update_video keyword arguments (title, description,
+                     tags, privacy_status)
+
+        Returns:
+            Dictionary mapping video ID to True on success, False on failure
+        """
+        results = {video_id: False for video_id in updates}
+        videos = self.get_videos_info(list(updates))
+
+        requests = []
+        for video_id, changes in updates.items():
+            video = videos.get(video_id)
+            if not video:
+                print(f"Error updating video: {video_id} not found")
+                continue
+
+            body, parts = self._build_update_body(video, **changes)
+            if not parts:
+                results[video_id] = True  # Nothing to update
+                continue
+
+            requests.append((video_id, self.youtube.videos().update(part=','.join(parts), body=body)))
+
+        self._execute_batch(requests, results, 'updated')
+        return results
+
+    def delete_videos(self, video_ids):
+        """
+        Delete many videos using batched requests
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            Dictionary mapping video ID to True on success, False on failure
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        results = {video_id: False for video_id in video_ids}
+
+        requests = [(video_id, self.youtube.videos().delete(id=video_id)) for video_id in video_ids]
+
+        self._execute_batch(requests, results, 'deleted')
+        return results
+
+    def _build_update_body(self, video, title=None, description=None, tags=None,
+                           privacy_status=None):
+        """
+        Build a videos().update body from current video details
+
+        Args:
+            video: Current video resource (snippet and status parts)
+            title: New title (optional)
+            description: New description (optional)
+            tags: New tags list (optional)
+            privacy_status: New privacy status (optional)
+
+        Returns:
+            Tuple of (body, parts) where parts lists the parts being updated
+        """
+        body = {'id': video['id']}
+
+        # Update snippet if any snippet fields are provided
+        if title or description or tags:
+            body['snippet'] = video['snippet']
+            if title:
+                body['snippet']['title'] = title[:100]
+            if description:
+                body['snippet']['description'] = description
+            if tags:
+                body['snippet']['tags'] = tags[:500]
+
+        # Update status if privacy is provided
+        if privacy_status:
+            body['status'] = video['status']
+            body['status']['privacyStatus'] = privacy_status.lower()
+
+        # Determine which parts to update
+        parts = []
+        if 'snippet' in body:
+            parts.append('snippet')
+        if 'status' in body:
+            parts.append('status')
+
+        return body, parts
+
+    def _execute_batch(self, requests, results, action):
+        """
+        Execute requests as HTTP batches of up to 50 calls
+
+        Args:
+            requests: List of (video_id, HttpRequest) tuples
+            results: Dictionary mapping video ID to success, updated in place
+            action: Past-tense verb used in log messages
+        """
+        def callback(video_id, response, exception):
+            if exception is not None:
+                print(f"Error: video {video_id} could not be {action}: {exception}")
+            else:
+                results[video_id] = True
+                print(f"Video {video_id} {action} successfully")
+
+        for start in range(0, len(requests), self.MAX_BATCH_SIZE):
+            batch = self.youtube.new_batch_http_request(callback=callback)
+            for video_id, request in requests[start:start + self.MAX_BATCH_SIZE]:
+                batch.add(request, request_id=video_id)
+
+            try:
+                batch.execute()
+            except HttpError as e:
+                print(f"Error executing batch request: {e}")
+
     def delete_video(self, video_id):
         """
         Delete a video from YouTube